@@ -0,0 +1,61 @@
+import heapq
+import itertools
+import threading
+import time
+
+
+class Agendador:
+
+    ''' Classe Agendador
+
+        Executa funções depois de um intervalo de tempo, todas em uma única thread. Os eventos ficam em um heap ordenado pelo
+        instante de execução, então agendar custa O(log n) e a thread só acorda quando o próximo evento vence ou quando um
+        evento mais próximo é agendado. É usado pelo Server para enviar mensagens atrasadas (como o aviso de jogo encerrado)
+        sem manter uma thread dormindo por partida.
+
+        Atributos:
+        eventos: heap de tuplas (instante, sequencia, funcao, args); a sequência mantém a ordem de agendamento entre eventos do mesmo instante.
+        condicao: threading.Condition que protege o heap e acorda a thread quando um evento é agendado. '''
+
+    def __init__(self):
+        self.__eventos = []
+        self.__sequencia = itertools.count()
+        self.__condicao = threading.Condition()
+        self.__thread = None
+
+    def agendar(self, atraso, funcao, *args):
+
+        ''' agendar(self, atraso, funcao, *args)
+        Objetivo: Agenda a execução de funcao(*args) daqui a "atraso" segundos.
+        Parâmetros de Entrada: atraso (float: segundos), funcao (função a ser executada), args (argumentos da função).
+        Descrição: A thread do agendador é criada no primeiro agendamento. A função não deve bloquear, pois atrasaria os demais eventos. '''
+
+        with self.__condicao:
+            if self.__thread == None:
+                self.__thread = threading.Thread(target=self.__executar, daemon=True)
+                self.__thread.start()
+            evento = (time.monotonic() + atraso, next(self.__sequencia), funcao, args)
+            heapq.heappush(self.__eventos, evento)
+            # só é preciso acordar a thread se o novo evento vence antes daquele pelo qual ela espera
+            if self.__eventos[0] is evento:
+                self.__condicao.notify()
+
+    def __len__(self):
+        with self.__condicao:
+            return len(self.__eventos)
+
+    def __executar(self):
+
+        ''' __executar(self)
+        Objetivo: Laço da thread do agendador, que espera o próximo evento vencer e o executa. '''
+
+        while True:
+            with self.__condicao:
+                while not self.__eventos or self.__eventos[0][0] > time.monotonic():
+                    espera = self.__eventos[0][0] - time.monotonic() if self.__eventos else None
+                    self.__condicao.wait(espera)
+                _, _, funcao, args = heapq.heappop(self.__eventos)
+            try:
+                funcao(*args)
+            except Exception as e:
+                print(f"Erro em evento agendado: {e}")
@@ -0,0 +1,145 @@
+''' Benchmark do custo por operação da HashTable conforme o número de chaves.
+
+    Para cada quantidade de chaves insere todas elas (put), consulta todas em ordem aleatória (get) e remove todas
+    (remove), exibindo o tempo médio por operação e o maior tempo de um único put. Com o redimensionamento incremental o
+    tempo médio deve ficar praticamente constante. Nenhum put reposiciona todas as entradas de uma vez: o maior put é o
+    que inicia um rehash e só aloca a tabela nova, ainda vazia.
+
+    Também mede, por chave, as operações em lote: from_iterable (que usa put_many e dimensiona a tabela uma única vez) e
+    get_many com todas as chaves.
+
+    A mesma medição é feita com a HashTableCompacta (endereçamento aberto), que também informa a memória usada por chave
+    (medida com tracemalloc em uma inserção separada, sem contar as chaves e valores em si). Na HashTableCompacta o maior
+    put é o que reconstrói a tabela inteira, pois ela não redimensiona de forma incremental.
+
+    Antes das medições é exibido o tempo de importação de hashtable.py em um interpretador novo (mediana de algumas
+    execuções), que entra no tempo de partida do servidor e das ferramentas de linha de comando. Com --referencia, outra
+    versão de hashtable.py (por exemplo, extraída com git show) é medida da mesma forma e a HashTable dela entra nas
+    medições por operação como a tabela "referencia".
+
+    O coletor de lixo cíclico do Python é desligado durante as medições (a não ser com --com-gc): com milhões de objetos
+    vivos, uma coleta completa pausa o processo por mais de um segundo e apareceria como o "maior put" de qualquer
+    estrutura de dados, não apenas da HashTable.
+
+    Uso:
+        python benchmark_hashtable.py [--chaves 100 1000 10000 100000 1000000] [--tabelas encadeada compacta] [--com-gc]
+                                      [--referencia hashtable_antiga.py]
+'''
+import argparse
+import gc
+import importlib.util
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from hashtable import HashTable, HashTableCompacta
+
+TABELAS = {'encadeada': HashTable, 'compacta': HashTableCompacta}
+
+# importa o arquivo informado como módulo e imprime o tempo gasto, em segundos
+IMPORTAR = '''
+import importlib.util, sys, time
+inicio = time.perf_counter()
+spec = importlib.util.spec_from_file_location('hashtable_medida', sys.argv[1])
+spec.loader.exec_module(importlib.util.module_from_spec(spec))
+print(time.perf_counter() - inicio)
+'''
+
+
+def tempo_importacao(caminho, execucoes=5):
+    ''' Mediana, em milissegundos, do tempo de importar o arquivo em um interpretador novo (sem módulos já carregados). '''
+    tempos = []
+    for _ in range(execucoes):
+        saida = subprocess.run([sys.executable, '-c', IMPORTAR, caminho], capture_output=True, text=True, check=True)
+        tempos.append(float(saida.stdout) * 1000)
+    return statistics.median(tempos)
+
+
+def carregar_referencia(caminho):
+    ''' Importa outra versão de hashtable.py e retorna a classe HashTable dela. '''
+    spec = importlib.util.spec_from_file_location('hashtable_referencia', caminho)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo.HashTable
+
+
+def memoria_por_chave(classe, chaves):
+    ''' Bytes alocados pela tabela por chave inserida (as chaves já existem antes da medição). '''
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    tabela = classe()
+    for chave in chaves:
+        tabela.put(chave, chave)
+    usada = tracemalloc.get_traced_memory()[0] - antes
+    tracemalloc.stop()
+    return usada / len(chaves)
+
+
+def medir_lote(classe, chaves):
+    ''' Custo por chave de from_iterable e get_many (nan para uma referência sem as operações em lote). '''
+    if not hasattr(classe, 'from_iterable'):
+        return float('nan'), float('nan')
+    pares = [(chave, chave) for chave in chaves]
+    inicio = time.perf_counter()
+    tabela = classe.from_iterable(pares)
+    put_many_ns = (time.perf_counter() - inicio) / len(chaves) * 1e9
+    inicio = time.perf_counter()
+    tabela.get_many(chaves)
+    get_many_ns = (time.perf_counter() - inicio) / len(chaves) * 1e9
+    return put_many_ns, get_many_ns
+
+
+def medir(classe, total):
+    chaves = [f'sala{i}' for i in range(total)]
+    tabela = classe()
+
+    maior_put = 0
+    inicio = time.perf_counter()
+    for chave in chaves:
+        antes = time.perf_counter_ns()
+        tabela.put(chave, chave)
+        maior_put = max(maior_put, time.perf_counter_ns() - antes)
+    put_ns = (time.perf_counter() - inicio) / total * 1e9
+
+    random.shuffle(chaves)
+    inicio = time.perf_counter()
+    for chave in chaves:
+        tabela.get(chave)
+    get_ns = (time.perf_counter() - inicio) / total * 1e9
+
+    inicio = time.perf_counter()
+    for chave in chaves:
+        tabela.remove(chave)
+    remove_ns = (time.perf_counter() - inicio) / total * 1e9
+    put_many_ns, get_many_ns = medir_lote(classe, chaves)
+    return put_ns, get_ns, remove_ns, maior_put / 1000, put_many_ns, get_many_ns, memoria_por_chave(classe, chaves)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Custo por operação da HashTable conforme o número de chaves.')
+    parser.add_argument('--chaves', type=int, nargs='+', default=[100, 1000, 10000, 100000, 1000000])
+    parser.add_argument('--tabelas', nargs='+', choices=list(TABELAS), default=list(TABELAS))
+    parser.add_argument('--referencia', help='outra versão de hashtable.py, para comparação')
+    parser.add_argument('--com-gc', action='store_true', help='mantém o coletor de lixo cíclico ligado durante as medições')
+    args = parser.parse_args()
+    tabelas = [(nome, TABELAS[nome]) for nome in args.tabelas]
+    atual = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hashtable.py')
+    print(f'importação de hashtable.py: {tempo_importacao(atual):.1f} ms')
+    if args.referencia:
+        print(f'importação da referência ({args.referencia}): {tempo_importacao(args.referencia):.1f} ms')
+        tabelas.append(('referencia', carregar_referencia(args.referencia)))
+    print()
+
+    if not args.com_gc:
+        gc.disable()
+
+    print(f'{"tabela":>10} {"chaves":>9} {"put (ns)":>9} {"get (ns)":>9} {"remove (ns)":>12} {"maior put (us)":>15} '
+          f'{"put_many (ns)":>14} {"get_many (ns)":>14} {"bytes/chave":>12}')
+    for total in args.chaves:
+        for nome, classe in tabelas:
+            put_ns, get_ns, remove_ns, maior_put_us, put_many_ns, get_many_ns, memoria = medir(classe, total)
+            print(f'{nome:>10} {total:9d} {put_ns:9.0f} {get_ns:9.0f} {remove_ns:12.0f} {maior_put_us:15.1f} '
+                  f'{put_many_ns:14.0f} {get_many_ns:14.0f} {memoria:12.0f}')
@@ -0,0 +1,180 @@
+''' Suíte de microbenchmarks da HashTable comparada ao dict do Python.
+
+    Para cada tipo de chave, tamanho e estrutura mede o custo por operação de put, get, remove, contains (metade das
+    chaves presentes e metade ausentes) e iteração sobre os pares (chave, valor). O dict é a referência: cada resultado
+    também é informado como múltiplo do tempo do dict nas mesmas condições ("x dict"), o que diminui a influência da
+    máquina ao comparar execuções.
+
+    Tipos de chave:
+        str: nomes de sala ("sala123"), como as chaves de Server.salas.
+        socket: objetos com o hash padrão (baseado no id), como os sockets que já foram chave das tabelas do servidor.
+
+    Cada medição é repetida algumas vezes, alternando as estruturas, e o menor tempo é usado; nos tamanhos pequenos as
+    repetições aumentam até somar OPERACOES_MINIMAS operações, para que o tempo medido não fique perto da resolução do
+    relógio. O coletor de lixo cíclico fica desligado durante as medições (ver benchmark_hashtable.py). O hash de str é
+    aleatório por processo, o que muda as colisões da tabela de uma execução para outra; por isso o script se executa de
+    novo com PYTHONHASHSEED fixo (--hashseed) quando a variável não está definida.
+
+    Os resultados são gravados em JSON (--saida) para que execuções possam ser comparadas. Com --comparar, cada resultado
+    é comparado ao da execução anterior com a mesma estrutura, chave, tamanho e operação; os que ficaram mais lentos do
+    que o limite (--limite, fração) são marcados como regressão e o script termina com código 1. Por padrão a comparação
+    usa o múltiplo do dict (--metrica relativo); com --metrica ns compara o tempo absoluto.
+
+    Uso:
+        python benchmark_hashtable_dict.py [--tamanhos 100 1000 10000 100000 1000000] [--chaves str socket]
+                                           [--estruturas HashTable HashTableCompacta] [--repeticoes 3]
+                                           [--saida resultado.json] [--comparar anterior.json] [--limite 0.1]
+                                           [--metrica relativo|ns]
+'''
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import time
+from hashtable import HashTable, HashTableCompacta
+
+ESTRUTURAS = {'dict': dict, 'HashTable': HashTable, 'HashTableCompacta': HashTableCompacta}
+OPERACOES = ['put', 'get', 'remove', 'contains', 'iteracao']
+OPERACOES_MINIMAS = 200000
+
+
+class SocketFalso:
+    ''' Chave com o hash padrão de objeto (derivado do id), como um socket, sem abrir descritores. '''
+    __slots__ = ()
+
+
+def gerar_chaves(tipo, total, prefixo='sala'):
+    if tipo == 'str':
+        return [f'{prefixo}{i}' for i in range(total)]
+    return [SocketFalso() for _ in range(total)]
+
+
+def medir_estrutura(classe, chaves, consultas, contidas):
+
+    ''' Retorna {operação: ns por operação} de uma execução na estrutura.
+        Os métodos são os mesmos para as tabelas e para o dict ([], in, items()), exceto remove, que no dict é pop. '''
+
+    tabela = classe()
+    remover = tabela.pop if classe is dict else tabela.remove
+
+    inicio = time.perf_counter()
+    for chave in chaves:
+        tabela[chave] = chave
+    tempos = {'put': time.perf_counter() - inicio}
+
+    inicio = time.perf_counter()
+    for chave in consultas:
+        tabela[chave]
+    tempos['get'] = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for chave in contidas:
+        chave in tabela
+    tempos['contains'] = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for chave, valor in tabela.items():
+        pass
+    tempos['iteracao'] = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for chave in consultas:
+        remover(chave)
+    tempos['remove'] = time.perf_counter() - inicio
+    return {operacao: tempo / len(chaves) * 1e9 for operacao, tempo in tempos.items()}
+
+
+def executar(tamanhos, tipos, estruturas, repeticoes):
+
+    ''' Mede todas as combinações e retorna a lista de resultados. As repetições alternam as estruturas (dict, tabela,
+        dict, ...), para que o dict e as tabelas sejam medidos sob a mesma carga da máquina, e cada operação fica com o
+        menor tempo entre as repetições. '''
+
+    resultados = []
+    nomes = ['dict'] + estruturas
+    for tipo in tipos:
+        for tamanho in tamanhos:
+            chaves = gerar_chaves(tipo, tamanho)
+            ausentes = gerar_chaves(tipo, tamanho, 'ausente')
+            consultas = chaves[:]
+            random.shuffle(consultas)
+            contidas = chaves[:tamanho // 2] + ausentes[:tamanho - tamanho // 2]
+            random.shuffle(contidas)
+            melhores = {nome: dict.fromkeys(OPERACOES, float('inf')) for nome in nomes}
+            for _ in range(max(repeticoes, OPERACOES_MINIMAS // tamanho)):
+                for nome in nomes:
+                    tempos = medir_estrutura(ESTRUTURAS[nome], chaves, consultas, contidas)
+                    for operacao, tempo in tempos.items():
+                        melhores[nome][operacao] = min(melhores[nome][operacao], tempo)
+            for nome in nomes:
+                for operacao in OPERACOES:
+                    tempo = melhores[nome][operacao]
+                    resultado = {'estrutura': nome, 'chaves': tipo, 'tamanho': tamanho, 'operacao': operacao,
+                                 'ns_por_op': round(tempo, 1),
+                                 'relativo_dict': round(tempo / melhores['dict'][operacao], 3)}
+                    resultados.append(resultado)
+                    print(f'{nome:>18} {tipo:>7} {tamanho:9d} {operacao:>9} {resultado["ns_por_op"]:11.1f} '
+                          f'{resultado["relativo_dict"]:8.2f}', flush=True)
+    return resultados
+
+
+def comparar(resultados, anterior, limite, metrica):
+
+    ''' Retorna a lista de regressões: resultados que ficaram mais lentos que o anterior além do limite. '''
+
+    campo = 'relativo_dict' if metrica == 'relativo' else 'ns_por_op'
+    chave = lambda r: (r['estrutura'], r['chaves'], r['tamanho'], r['operacao'])
+    antigos = {chave(r): r for r in anterior['resultados']}
+    regressoes = []
+    for resultado in resultados:
+        antigo = antigos.get(chave(resultado))
+        if antigo == None or resultado['estrutura'] == 'dict' and metrica == 'relativo':
+            continue
+        variacao = resultado[campo] / antigo[campo] - 1
+        resultado['variacao'] = round(variacao, 3)
+        if variacao > limite:
+            regressoes.append(resultado)
+    return regressoes
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Microbenchmarks da HashTable comparada ao dict.')
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[100, 1000, 10000, 100000, 1000000])
+    parser.add_argument('--chaves', nargs='+', choices=['str', 'socket'], default=['str', 'socket'])
+    parser.add_argument('--estruturas', nargs='+', choices=[nome for nome in ESTRUTURAS if nome != 'dict'],
+                        default=['HashTable', 'HashTableCompacta'])
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--saida', help='arquivo JSON onde os resultados são gravados')
+    parser.add_argument('--comparar', help='arquivo JSON de uma execução anterior')
+    parser.add_argument('--limite', type=float, default=0.1, help='piora máxima aceita em relação à execução anterior (0.1 = 10%%)')
+    parser.add_argument('--metrica', choices=['relativo', 'ns'], default='relativo')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--hashseed', default='0', help='PYTHONHASHSEED usado quando a variável não está definida')
+    args = parser.parse_args()
+    if 'PYTHONHASHSEED' not in os.environ:
+        os.environ['PYTHONHASHSEED'] = args.hashseed
+        os.execv(sys.executable, [sys.executable] + sys.argv)
+    random.seed(args.seed)
+    gc.disable()
+
+    print(f'{"estrutura":>18} {"chaves":>7} {"tamanho":>9} {"operacao":>9} {"ns/op":>11} {"x dict":>8}')
+    resultados = executar(args.tamanhos, args.chaves, args.estruturas, args.repeticoes)
+
+    regressoes = []
+    if args.comparar:
+        with open(args.comparar) as arquivo:
+            regressoes = comparar(resultados, json.load(arquivo), args.limite, args.metrica)
+        print(f'\n{len(regressoes)} regressão(ões) acima de {args.limite:.0%} ({args.metrica}) em relação a {args.comparar}')
+        for r in regressoes:
+            print(f'  REGRESSÃO {r["estrutura"]} {r["chaves"]} {r["tamanho"]} {r["operacao"]}: {r["variacao"]:+.1%}')
+
+    if args.saida:
+        with open(args.saida, 'w') as arquivo:
+            json.dump({'python': sys.version.split()[0], 'plataforma': platform.platform(),
+                       'data': time.strftime('%Y-%m-%dT%H:%M:%S'), 'repeticoes': args.repeticoes,
+                       'hashseed': os.environ['PYTHONHASHSEED'],
+                       'resultados': resultados}, arquivo, indent=1)
+    sys.exit(1 if regressoes else 0)
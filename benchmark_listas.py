@@ -0,0 +1,99 @@
+''' Benchmark dos percursos da lista circular (lista_circular.LinkedList) e da fila (fila.Fila).
+
+    Para cada quantidade de nós mede o tempo de LinkedList.goTo e LinkedList.element (até o meio da lista) e de
+    Fila.busca (de uma carga ausente, que percorre a fila inteira) e Fila.__str__, além da memória por nó de cada
+    estrutura (medida com tracemalloc, sem contar os elementos em si). Os tempos são o menor entre algumas repetições.
+    Como a Fila guarda o texto de __str__ até ser alterada, a medição de str é a de uma fila exibida várias vezes entre
+    duas alterações, como nas mensagens de cada rodada.
+
+    Com --referencia-lista e --referencia-fila, outras versões de lista_circular.py e fila.py (por exemplo, extraídas
+    com git show) são medidas da mesma forma e aparecem com a estrutura "referencia".
+
+    Uso:
+        python benchmark_listas.py [--nos 3 100 10000 100000] [--repeticoes 5]
+                                   [--referencia-lista lista_circular_antiga.py] [--referencia-fila fila_antiga.py]
+'''
+import argparse
+import gc
+import importlib.util
+import timeit
+import tracemalloc
+import fila
+import lista_circular
+
+
+def carregar_modulo(nome, caminho):
+    ''' Importa outra versão de um módulo a partir do caminho do arquivo. '''
+    spec = importlib.util.spec_from_file_location(nome, caminho)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+def criar_lista(modulo, cargas):
+    lista = modulo.LinkedList()
+    for posicao, carga in enumerate(cargas, 1):
+        lista.insert(carga, posicao)
+    return lista
+
+
+def criar_fila(modulo, cargas):
+    f = modulo.Fila()
+    for carga in cargas:
+        f.enfileirar(carga)
+    return f
+
+
+def memoria_por_no(criar, modulo, cargas):
+    ''' Bytes alocados pela estrutura por nó (as cargas já existem antes da medição). '''
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    estrutura = criar(modulo, cargas)
+    usada = tracemalloc.get_traced_memory()[0] - antes
+    tracemalloc.stop()
+    return usada / len(cargas)
+
+
+def melhor_tempo_us(funcao, repeticoes):
+    ''' Menor tempo de uma chamada entre as repetições, em microssegundos. '''
+    vezes, _ = timeit.Timer(funcao).autorange()
+    return min(timeit.repeat(funcao, number=vezes, repeat=repeticoes)) / vezes * 1e6
+
+
+def medir(modulo_lista, modulo_fila, total, repeticoes):
+    cargas = list(range(total))
+    lista = criar_lista(modulo_lista, cargas)
+    f = criar_fila(modulo_fila, cargas)
+    meio = total // 2
+    return {
+        'goTo': melhor_tempo_us(lambda: lista.goTo(1, meio), repeticoes),
+        'element': melhor_tempo_us(lambda: lista.element(meio), repeticoes),
+        'busca': melhor_tempo_us(lambda: f.busca(-1), repeticoes),
+        'str': melhor_tempo_us(lambda: str(f), repeticoes),
+        'B/no lista': memoria_por_no(criar_lista, modulo_lista, cargas),
+        'B/no fila': memoria_por_no(criar_fila, modulo_fila, cargas),
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Percursos e memória por nó da lista circular e da fila.')
+    parser.add_argument('--nos', type=int, nargs='+', default=[3, 100, 10000, 100000])
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--referencia-lista', help='outra versão de lista_circular.py para comparação')
+    parser.add_argument('--referencia-fila', help='outra versão de fila.py para comparação')
+    args = parser.parse_args()
+    gc.disable()
+
+    estruturas = [('atual', lista_circular, fila)]
+    if args.referencia_lista or args.referencia_fila:
+        referencia_lista = carregar_modulo('lista_referencia', args.referencia_lista) if args.referencia_lista else lista_circular
+        referencia_fila = carregar_modulo('fila_referencia', args.referencia_fila) if args.referencia_fila else fila
+        estruturas.append(('referencia', referencia_lista, referencia_fila))
+
+    print(f'{"estrutura":>10} {"nos":>8} {"goTo (us)":>11} {"element (us)":>13} {"busca (us)":>11} {"str (us)":>10} '
+          f'{"B/no lista":>11} {"B/no fila":>10}')
+    for total in args.nos:
+        for nome, modulo_lista, modulo_fila in estruturas:
+            r = medir(modulo_lista, modulo_fila, total, args.repeticoes)
+            print(f'{nome:>10} {total:8d} {r["goTo"]:11.2f} {r["element"]:13.2f} {r["busca"]:11.2f} {r["str"]:10.2f} '
+                  f'{r["B/no lista"]:11.1f} {r["B/no fila"]:10.1f}', flush=True)
@@ -0,0 +1,61 @@
+''' Microbenchmark do comando jogador_pronto conforme o número de salas abertas.
+
+    Cria N salas com 3 jogadores cada diretamente no Server (sem rede) e mede quanto tempo Server.tratar_comando leva para
+    tratar jogador_pronto de um jogador. Para comparação, mede também a busca antiga, que percorria salas.items() e a lista
+    de jogadores de cada sala até encontrar a sala do jogador.
+
+    Uso:
+        python benchmark_salas.py [--salas 10 100 1000 10000 100000] [--amostras M]
+'''
+import argparse
+import random
+import time
+from server import Server
+from sessao import Sessao
+
+
+def sala_por_varredura(server, cliente):
+    ''' Busca usada antes de a sala ficar na sessão: percorre todas as salas e os jogadores de cada uma. '''
+    for chave, valor in server.salas.items():
+        for socket in valor:
+            if socket == cliente:
+                return chave
+    return None
+
+
+def medir(total_salas, amostras):
+    server = Server()
+    jogadores = []
+    for i in range(total_salas):
+        # sessões sem conexão: tratar_comando não faz nenhuma operação de rede
+        sala = [Sessao(None) for _ in range(3)]
+        server.tratar_comando(sala[0], ('criar_sala', f'sala{i}'))
+        for jogador in sala[1:]:
+            server.tratar_comando(jogador, ('entrar_na_sala', f'sala{i}'))
+        jogadores.append(sala[0])
+
+    # cada amostra é o primeiro jogador de uma sala diferente, para que nenhuma sala complete
+    escolhidos = random.sample(jogadores, min(amostras, len(jogadores)))
+    inicio = time.perf_counter()
+    for jogador in escolhidos:
+        server.tratar_comando(jogador, ('jogador_pronto', 'nick'))
+    pronto_us = (time.perf_counter() - inicio) / len(escolhidos) * 1e6
+
+    escolhidos = escolhidos[:max(1, len(escolhidos) // 10)]
+    inicio = time.perf_counter()
+    for jogador in escolhidos:
+        sala_por_varredura(server, jogador)
+    varredura_us = (time.perf_counter() - inicio) / len(escolhidos) * 1e6
+    return pronto_us, varredura_us
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Latência de jogador_pronto conforme o número de salas.')
+    parser.add_argument('--salas', type=int, nargs='+', default=[10, 100, 1000, 10000, 100000])
+    parser.add_argument('--amostras', type=int, default=1000, help='jogador_pronto medidos para cada número de salas')
+    args = parser.parse_args()
+
+    print(f'{"salas":>8} {"jogador_pronto (us)":>20} {"varredura antiga (us)":>22}')
+    for total_salas in args.salas:
+        pronto_us, varredura_us = medir(total_salas, args.amostras)
+        print(f'{total_salas:8d} {pronto_us:20.2f} {varredura_us:22.2f}')
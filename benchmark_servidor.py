@@ -0,0 +1,260 @@
+''' Testes de carga do servidor em loopback.
+
+    conexoes: sobe o servidor (server.py) em um processo separado para cada modo (threads e async), abre várias conexões
+    ociosas no lobby e mede a latência dos comandos enquanto essas conexões estão abertas. Ao final exibe, para cada modo,
+    quantas conexões o processo do servidor sustentou, quantas threads e quanta memória ele usou e a latência dos comandos.
+
+    vazao: sobe o servidor com 1, 2, 4... workers (--workers) e mede quantos comandos por segundo ele atende com vários
+    processos clientes enviando salas_disponiveis ao mesmo tempo.
+
+    desconexoes: teste de resistência que conecta e derruba muitos clientes (alguns dentro de salas, alguns com RST) e
+    verifica, depois que todos saíram, se o servidor voltou ao número de descritores abertos do início, se não sobrou
+    nenhuma sala e se o processo fica ocioso (sem laços ocupados em sockets fechados).
+
+    Uso:
+        python benchmark_servidor.py [--protocolo texto|binario] desconexoes [--clientes N] [--lote L] [--modos threads async]
+        python benchmark_servidor.py [--protocolo texto|binario] conexoes [--conexoes N] [--amostras M] [--modos threads async]
+        python benchmark_servidor.py [--protocolo texto|binario] vazao [--workers 1 2 4] [--clientes C] [--duracao S] [--modo async|threads]
+'''
+import argparse
+import multiprocessing
+import os
+import resource
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import time
+from protocolo import Conexao
+
+
+def porta_livre():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def iniciar_servidor(modo, porta, *extras):
+    ''' Inicia o servidor em um subprocesso (em uma nova sessão, junto com seus workers) e aguarda até que a porta aceite conexões. '''
+    processo = subprocess.Popen([sys.executable, 'server.py', '127.0.0.1', str(porta), '--modo', modo, *extras],
+                                cwd=os.path.dirname(os.path.abspath(__file__)),
+                                stdout=subprocess.DEVNULL, start_new_session=True)
+    limite = time.time() + 10
+    while time.time() < limite:
+        try:
+            socket.create_connection(('127.0.0.1', porta), timeout=1).close()
+            return processo
+        except OSError:
+            time.sleep(0.05)
+    encerrar_servidor(processo)
+    raise RuntimeError(f'o servidor no modo {modo} não iniciou')
+
+
+def encerrar_servidor(processo):
+    ''' Encerra o servidor e todos os workers criados por ele. '''
+    os.killpg(processo.pid, signal.SIGKILL)
+    processo.wait()
+
+
+def status_processo(pid):
+    ''' Lê o número de threads e a memória residente (em MB) do processo em /proc. '''
+    info = {}
+    with open(f'/proc/{pid}/status') as arquivo:
+        for linha in arquivo:
+            chave, _, valor = linha.partition(':')
+            info[chave] = valor.strip()
+    return int(info['Threads']), int(info['VmRSS'].split()[0]) / 1024
+
+
+def descritores_abertos(pid):
+    return len(os.listdir(f'/proc/{pid}/fd'))
+
+
+def tempo_cpu(pid):
+    ''' Lê o tempo de CPU (usuário + sistema, em segundos) já consumido pelo processo. '''
+    with open(f'/proc/{pid}/stat') as arquivo:
+        campos = arquivo.read().rsplit(')', 1)[1].split()
+    return (int(campos[11]) + int(campos[12])) / os.sysconf('SC_CLK_TCK')
+
+
+def conectar(porta, binario):
+    cliente = Conexao(socket.create_connection(('127.0.0.1', porta), timeout=5))
+    if binario:
+        cliente.negociar_binario()
+    return cliente
+
+
+def comando(cliente, *mensagem):
+    ''' Envia um comando e devolve o tempo, em milissegundos, até a resposta chegar. '''
+    inicio = time.perf_counter()
+    cliente.enviar(*mensagem)
+    cliente.receber()
+    return (time.perf_counter() - inicio) * 1000
+
+
+def percentil(valores, p):
+    valores = sorted(valores)
+    return valores[min(len(valores) - 1, int(len(valores) * p))]
+
+
+def medir(modo, conexoes, amostras, binario):
+    porta = porta_livre()
+    servidor = iniciar_servidor(modo, porta)
+    ociosos = []
+    try:
+        for i in range(conexoes):
+            try:
+                cliente = conectar(porta, binario)
+            except OSError:
+                break
+            cliente.enviar('nickname', f'ocioso{i}')
+            ociosos.append(cliente)
+        time.sleep(0.5)
+
+        ativo = conectar(porta, binario)
+        comando(ativo, 'criar_sala', 'sala_benchmark')
+        latencias = [comando(ativo, 'salas_disponiveis') for _ in range(amostras)]
+        threads, memoria = status_processo(servidor.pid)
+        ativo.close()
+    finally:
+        for cliente in ociosos:
+            cliente.close()
+        encerrar_servidor(servidor)
+
+    return {
+        'modo': modo,
+        'conexoes': len(ociosos),
+        'threads': threads,
+        'memoria_mb': memoria,
+        'p50_ms': percentil(latencias, 0.5),
+        'p99_ms': percentil(latencias, 0.99),
+    }
+
+
+def cliente_vazao(porta, duracao, binario):
+    ''' Envia salas_disponiveis sem parar durante "duracao" segundos e devolve quantos comandos foram respondidos. '''
+    cliente = conectar(porta, binario)
+    total = 0
+    limite = time.perf_counter() + duracao
+    while time.perf_counter() < limite:
+        comando(cliente, 'salas_disponiveis')
+        total += 1
+    cliente.close()
+    return total
+
+
+def medir_vazao(modo, workers, clientes, duracao, binario, salas=50):
+    porta = porta_livre()
+    servidor = iniciar_servidor(modo, porta, '--workers', str(workers))
+    try:
+        # cada sala pertence a um worker; o lobby de todos eles lista as salas de todos
+        for i in range(salas):
+            criador = conectar(porta, binario)
+            comando(criador, 'criar_sala', f'sala{i}')
+            criador.close()
+        time.sleep(0.5)
+        with multiprocessing.get_context('fork').Pool(clientes) as pool:
+            totais = pool.starmap(cliente_vazao, [(porta, duracao, binario)] * clientes)
+    finally:
+        encerrar_servidor(servidor)
+    return sum(totais) / duracao
+
+
+def medir_desconexoes(modo, clientes, lote, binario):
+    porta = porta_livre()
+    servidor = iniciar_servidor(modo, porta)
+    try:
+        time.sleep(0.5)
+        fds_inicio = descritores_abertos(servidor.pid)
+        for inicio in range(0, clientes, lote):
+            conexoes = []
+            for i in range(inicio, min(inicio + lote, clientes)):
+                sock = socket.create_connection(('127.0.0.1', porta), timeout=5)
+                cliente = Conexao(sock)
+                if binario:
+                    cliente.negociar_binario()
+                cliente.enviar('nickname', f'cliente{i}')
+                # um terço cria uma sala, um terço entra na sala criada antes e o restante fica só no lobby
+                if i % 3 == 0:
+                    comando(cliente, 'criar_sala', f'sala{i}')
+                elif i % 3 == 1:
+                    comando(cliente, 'entrar_na_sala', f'sala{i - 1}')
+                conexoes.append(sock)
+            for i, sock in enumerate(conexoes):
+                if i % 2 == 0:
+                    # fecha com RST em vez de FIN
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+                sock.close()
+
+        limite = time.time() + 30
+        while descritores_abertos(servidor.pid) > fds_inicio and time.time() < limite:
+            time.sleep(0.1)
+        fds_fim = descritores_abertos(servidor.pid)
+        threads, memoria = status_processo(servidor.pid)
+        cpu_inicio = tempo_cpu(servidor.pid)
+        time.sleep(2)
+        cpu_ociosa = (tempo_cpu(servidor.pid) - cpu_inicio) / 2 * 100
+
+        verificador = conectar(porta, binario)
+        verificador.enviar('salas_disponiveis')
+        salas = verificador.receber()
+        verificador.close()
+    finally:
+        encerrar_servidor(servidor)
+
+    return {
+        'modo': modo,
+        'clientes': clientes,
+        'fds_inicio': fds_inicio,
+        'fds_fim': fds_fim,
+        'threads': threads,
+        'cpu_ociosa': cpu_ociosa,
+        # só as linhas das salas ("-  nome (n/3)"), sem o cabeçalho com os totais
+        'salas_restantes': sum(linha.startswith('-  ') for linha in '\n'.join(salas).splitlines()),
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Testes de carga do servidor em loopback.')
+    parser.add_argument('--protocolo', default='texto', choices=['texto', 'binario'],
+                        help='formato das mensagens negociado pelos clientes do benchmark')
+    subparsers = parser.add_subparsers(dest='teste', required=True)
+    p_conexoes = subparsers.add_parser('conexoes', help='conexões ociosas por processo e latência dos comandos')
+    p_conexoes.add_argument('--conexoes', type=int, default=2000, help='conexões ociosas abertas no lobby')
+    p_conexoes.add_argument('--amostras', type=int, default=500, help='comandos medidos com as conexões abertas')
+    p_conexoes.add_argument('--modos', nargs='+', default=['threads', 'async'], choices=['threads', 'async'])
+    p_vazao = subparsers.add_parser('vazao', help='comandos por segundo conforme o número de workers')
+    p_vazao.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    p_vazao.add_argument('--clientes', type=int, default=16, help='processos clientes simultâneos')
+    p_vazao.add_argument('--duracao', type=float, default=5, help='segundos de medição para cada número de workers')
+    p_vazao.add_argument('--modo', default='async', choices=['threads', 'async'])
+    p_desconexoes = subparsers.add_parser('desconexoes', help='conecta e derruba muitos clientes e verifica se o servidor libera tudo')
+    p_desconexoes.add_argument('--clientes', type=int, default=10000, help='total de clientes conectados e derrubados')
+    p_desconexoes.add_argument('--lote', type=int, default=500, help='clientes conectados ao mesmo tempo')
+    p_desconexoes.add_argument('--modos', nargs='+', default=['threads', 'async'], choices=['threads', 'async'])
+    args = parser.parse_args()
+
+    # cada conexão usa um descritor no benchmark e outro no servidor, que herda este limite
+    _, maximo = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (maximo, maximo))
+
+    if args.teste == 'desconexoes':
+        print(f'{"modo":8} {"clientes":>9} {"fds antes":>10} {"fds depois":>11} {"threads":>8} {"CPU ociosa":>11} {"salas":>6}')
+        for modo in args.modos:
+            r = medir_desconexoes(modo, args.clientes, args.lote, args.protocolo == 'binario')
+            print(f'{r["modo"]:8} {r["clientes"]:9d} {r["fds_inicio"]:10d} {r["fds_fim"]:11d} {r["threads"]:8d} '
+                  f'{r["cpu_ociosa"]:10.1f}% {r["salas_restantes"]:6d}')
+    elif args.teste == 'conexoes':
+        print(f'{"modo":8} {"conexões":>9} {"threads":>8} {"RSS (MB)":>9} {"p50 (ms)":>9} {"p99 (ms)":>9}')
+        for modo in args.modos:
+            r = medir(modo, args.conexoes, args.amostras, args.protocolo == 'binario')
+            print(f'{r["modo"]:8} {r["conexoes"]:9d} {r["threads"]:8d} {r["memoria_mb"]:9.1f} {r["p50_ms"]:9.3f} {r["p99_ms"]:9.3f}')
+    else:
+        print(f'CPUs: {os.cpu_count()}')
+        print(f'{"workers":>8} {"comandos/s":>11} {"aceleração":>11}')
+        base = None
+        for workers in args.workers:
+            vazao = medir_vazao(args.modo, workers, args.clientes, args.duracao, args.protocolo == 'binario')
+            base = base or vazao
+            print(f'{workers:8d} {vazao:11.0f} {vazao / base:10.2f}x')
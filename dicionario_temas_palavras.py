@@ -1,4 +1,4 @@
-Temas = {
-    'frutas': ['banana', 'maça', 'manga', 'uva', 'pera', 'melão', 'melancia', 'mamão', 'limão', 'ameixa', 'laranja', 'tangerina'],
-    'objetos': ['computador', 'celular', 'quadro', 'janela', 'porta', 'monitor', 'teclado', 'mouse', 'tela', 'teclas', 'roupas', 'camisa'], 
-}
+Temas = {
+    'frutas': ['banana', 'maça', 'manga', 'uva', 'pera', 'melão', 'melancia', 'mamão', 'limão', 'ameixa', 'laranja', 'tangerina'],
+    'objetos': ['computador', 'celular', 'quadro', 'janela', 'porta', 'monitor', 'teclado', 'mouse', 'tela', 'teclas', 'roupas', 'camisa'], 
+}
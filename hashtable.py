@@ -1,214 +1,1169 @@
-from typing import List, Any
-import numpy as np
-
-class Entry:
-    """
-    Classe privada utilizada para encapsular os pares chave/valor
-    """
-    def __init__( self, entryKey, entryValue ):
-        self.__key = entryKey
-        self.__value = entryValue
-    
-    @property
-    def key( self ):
-        return self.__key
-    
-    @property
-    def value( self ):
-        return self.__value
-    
-    @value.setter
-    def value( self, newValue ):
-        self.__value = newValue
-
-    @key.setter
-    def key( self, newKey ):
-        self.__key = newKey
-        
-    def __str__( self ):
-        return "(" + str( self.__key ) + ", " + str( self.__value ) + ")"
- 
-class HashTable:
-    def __init__(self, size:int=100):
-        '''
-        Construtor da classe que recebe o tamanho para a tabela de dispersão.
-        Utiliza um list de python como estrutura encadeda para armazenar os
-        elementos mapeados para um slot correpondente.
-        Argumentos:
-            size(int): tamanho da tabela de dispersão. Se não informar, 
-            o tamanho padrão é 100.
-        '''
-        self.__used = 0
-        # inicializa a tabela de dispersão com todos os elementos iguais a None
-        self.__table = np.full(size,None)
-        for i in range(len(self.__table)):
-            self.__table[i] = []
-
-    def __hash(self, key:any)->int:
-        ''' 
-            Método que retorna a posição na tabela hashing conforme a chave.
-            (hash modular)
-        '''
-        return hash(key) % len(self.__table)
-
-    def put(self, key:any, data:any)->int:
-        ''' 
-            Método que insere um novo elemento na tabela de dispersão.
-            Argumentos:
-                key(Any): chave do elemento a ser inserido.
-                data(Any): valor do elemento a ser inserido.
-            Retorna:
-                int: índice na tabela de dispersão onde o elemento foi inserido.
-        '''
-        slot = self.__hash(key)
-        for i in range(len(self.__table[slot])):
-            if key == self.__table[slot][i].key:
-                self.__table[slot][i].value = data
-                return slot
-        else:
-            self.__table[slot].append(Entry(key,data))
-            return slot
-
-    def get(self, key:any)->any:
-        '''
-            Método que retorna a carga na tabela de dispersão
-            correspondente a chave informada.
-            Argumentos:
-                key(Any): chave do elemento a ser buscado.
-            Retorna:
-                Any: valor do elemento buscado.
-            Raises:
-                KeyError: se a chave não for encontrada na tabela de dispersão.
-        '''
-        slot = self.__hash(key)
-        for i in range(len(self.__table[slot])):
-            if key == self.__table[slot][i].key:
-                return self.__table[slot][i].value
-        else:
-            raise KeyError(f'key {key} not found')
-
-    def remove(self, key:any)->any:
-        '''
-            Método que remove um elemento da tabela de dispersão.
-            Argumentos:
-                key(Any): chave do elemento a ser removido.
-            Retorna:
-                Any: valor do elemento removido.
-            Raises:
-                KeyError: se a chave não for encontrada na tabela de dispersão.
-        '''
-        slot = self.__hash(key)
-        for i in range(len(self.__table[slot])):
-            if key == self.__table[slot][i].key:
-                return self.__table[slot].pop(i).value
-        else:
-            raise KeyError(f'key {key} not found')
-
-    def items(self)->List[tuple]:
-        '''
-            Método que retorna uma lista com todos os pares chave/valor da tabela de dispersão.
-            Retorna:
-                list: lista com todos os pares chave/valor da tabela de dispersão.
-        '''
-        lista = []
-        for items in self.__table:
-            if items == None:
-                continue
-            for entry in items:
-                lista.append((entry.key, entry.value))
-        return lista
-
-    def keys(self)->List[any]:
-        '''
-            Método que retorna uma lista com todas as chaves da tabela de dispersão.
-            Retorna:
-                list: lista com todas as chaves da tabela de dispersão.
-        '''
-        lista = []
-        for items in self.__table:
-            if items == None:
-                continue
-            for entry in items:
-                lista.append(entry.key)
-        return lista
-    
-    def values(self)->List[any]:
-        '''
-        Método que retorna uma lista com todos os pares chave/valor da tabela de dispersão.
-        Retorna:
-            list(tuple): lista de tuplas com todos os pares chave/valor da tabela de dispersão.
-        '''
-        lista = []
-        for items in self.__table:
-            if items == None:
-                continue
-            for entry in items:
-                lista.append(entry.value)
-        return lista
-
-    def __getitem__(self, key):
-        return self.get(key)
-    
-    def __setitem__(self, key, data):
-        self.put(key, data)
-
-    def __contains__(self, key:any)->bool:
-        '''
-        Método que verifica se uma chave está na tabela de dispersão.
-        Acionado em situações de uso do operador "in": "if chave in hashTable".
-        Argumentos:
-            key(Any): chave do elemento a ser buscado.
-        Retorna:
-            bool: True se a chave estiver na tabela de dispersão e False caso contrário.
-        '''
-        slot = self.__hash(key)
-        for i in range(len(self.__table[slot])):
-            if key == self.__table[slot][i].key:
-                return True
-        else:
-            return False
-
-    def __len__(self)->int:
-        '''
-        Método que informa quantas entradas estão armazenadas na tabela de dispersão.
-        Retorna:
-            int: quantidade de elementos na tabela de dispersão.
-        '''
-        count = 0
-        for i in self.__table:
-            count += len(i)
-        return count
-
-    def __str__(self)->str:
-        '''
-        Método que retorna uma string com o conteúdo da tabela de dispersão.        
-        Retorna:
-            str: string no formato: {chave1:valor1, chave2:valor2, ...}
-        '''
-        info = "{"
-        for items in self.__table:
-            if items == None:
-                continue
-            for entry in items:
-                info += f'{entry.key}:{entry.value},'
-        info = info.rstrip(',') + '}'
-        return info
-
-    def showHashTable(self):
-        '''
-        Método que exibe o status de ocupação da tabela de dispersão.
-        Deve ser chamado apenas para tabelas de dispersão com poucos,
-        elementos, pois a saída pode ficar muito grande e confusa.
-        '''
-        entrada = -1
-        print('+--+')
-        for items in self.__table:
-            entrada += 1
-            print(f'|{entrada:2d}| = ', end='') 
-            if len(items) == 0:
-                print(' None')
-                continue
-            for entry in items:
-                print(f'[ {entry.key},{entry.value} ] ',end='')
-            print()
-        print('+--+')
\ No newline at end of file
+import array
+from collections import abc
+import threading
+
+# a tabela dobra de tamanho quando há mais entradas do que slots e volta à metade quando
+# menos de 1/8 dos slots estão ocupados (nunca abaixo do tamanho informado no construtor)
+FATOR_CARGA_MAXIMO = 1.0
+FATOR_CARGA_MINIMO = 0.125
+# quantidade de slots ocupados da tabela antiga transferidos para a nova a cada put/remove;
+# slots vazios são apenas pulados, até 10 vezes esse número por passo
+SLOTS_POR_PASSO = 4
+
+# marcadores do vetor de índices da HashTableCompacta
+INDICE_VAZIO = -1
+INDICE_REMOVIDO = -2
+# a HashTableCompacta cresce quando 2/3 do vetor de índices estão em uso (entradas e removidas)
+OCUPACAO_MAXIMA_COMPACTA = 2 / 3
+
+# quantidade padrão de partições (cada uma com o seu lock) da ConcurrentHashTable
+PARTICOES_CONCORRENTE = 16
+
+# operações cujas sondagens são contadas para stats(), na ordem dos contadores
+OPERACOES = ('get', 'put', 'remove')
+GET, PUT, REMOVE = range(len(OPERACOES))
+
+# chave das entradas removidas nos vetores densos da HashTableCompacta
+_REMOVIDA = object()
+# valor padrão de get_many: sem ele, uma chave ausente lança KeyError
+_AUSENTE = object()
+
+def _estatisticas(entradas:int, slots:int, histograma:dict, operacoes:list, sondagens:list)->dict:
+    '''
+        Monta o dicionário retornado por stats() a partir do histograma do
+        comprimento das cadeias e dos contadores de sondagens de cada operação.
+    '''
+    ocupados = sum(quantidade for comprimento, quantidade in histograma.items() if comprimento > 0)
+    total = sum(comprimento * quantidade for comprimento, quantidade in histograma.items())
+    return {
+        'entradas': entradas,
+        'slots': slots,
+        'fator_carga': entradas / slots if slots else 0.0,
+        'maior_cadeia': max(histograma, default=0),
+        'media_cadeia': total / ocupados if ocupados else 0.0,
+        'histograma_cadeias': dict(sorted(histograma.items())),
+        'sondagens': {nome: {'operacoes': operacoes[i], 'comparacoes': sondagens[i],
+                             'media': sondagens[i] / operacoes[i] if operacoes[i] else 0.0}
+                      for i, nome in enumerate(OPERACOES)},
+    }
+
+def _lista_pares(pares)->list:
+    '''
+        Converte o argumento de put_many/update (pares chave/valor, dict ou tabela
+        de dispersão) em uma lista de pares, para que o tamanho do lote seja conhecido.
+    '''
+    if hasattr(pares, 'items'):
+        pares = pares.items()
+    return pares if isinstance(pares, list) else list(pares)
+
+class Entry:
+    """
+    Classe privada utilizada para encapsular os pares chave/valor
+    """
+    def __init__( self, entryKey, entryValue ):
+        self.__key = entryKey
+        self.__value = entryValue
+    
+    @property
+    def key( self ):
+        return self.__key
+    
+    @property
+    def value( self ):
+        return self.__value
+    
+    @value.setter
+    def value( self, newValue ):
+        self.__value = newValue
+
+    @key.setter
+    def key( self, newKey ):
+        self.__key = newKey
+        
+    def __str__( self ):
+        return "(" + str( self.__key ) + ", " + str( self.__value ) + ")"
+ 
+class HashTable:
+    def __init__(self, size:int=100):
+        '''
+        Construtor da classe que recebe o tamanho para a tabela de dispersão.
+        Utiliza um list de python como estrutura encadeda para armazenar os
+        elementos mapeados para um slot correpondente.
+
+        A tabela é redimensionada conforme o fator de carga (entradas / slots):
+        dobra ao passar de FATOR_CARGA_MAXIMO e cai pela metade abaixo de
+        FATOR_CARGA_MINIMO. O rehash é incremental: enquanto ele acontece
+        existem duas tabelas, e cada put/remove transfere SLOTS_POR_PASSO
+        slots da antiga para a nova. Assim nenhuma operação isolada precisa
+        reposicionar todas as entradas de uma vez.
+        Argumentos:
+            size(int): tamanho da tabela de dispersão. Se não informar, 
+            o tamanho padrão é 100.
+        '''
+        self.__used = 0
+        self.__size = size
+        self.__table = self.__nova_tabela(size)
+        # tabela que recebe as entradas durante um rehash (None fora dele)
+        self.__proxima = None
+        # próximo slot da tabela antiga a ser transferido para a nova
+        self.__rehash_slot = 0
+        # muda a cada entrada inserida ou removida; as visões usam para detectar
+        # alterações na tabela durante uma iteração
+        self.__versao = 0
+        # quantidade de chamadas e de chaves comparadas por operação (GET, PUT, REMOVE), para stats()
+        self.__operacoes = [0, 0, 0]
+        self.__sondagens = [0, 0, 0]
+
+    def __nova_tabela(self, size:int):
+        ''' 
+            Método que cria uma tabela de dispersão com "size" slots vazios.
+            A lista de cada slot só é criada quando a primeira entrada é inserida nele,
+            para que criar a tabela nova de um rehash não custe uma lista por slot.
+        '''
+        # uma list de python com todos os elementos iguais a None: indexar uma list é mais rápido
+        # que um array de objetos do numpy, e o módulo não precisa importar o numpy
+        return [None] * size
+
+    def __hash(self, key:any, tabela=None)->int:
+        ''' 
+            Método que retorna a posição na tabela hashing conforme a chave.
+            (hash modular)
+        '''
+        if tabela is None:
+            tabela = self.__table
+        return hash(key) % len(tabela)
+
+    def __tabelas(self):
+        ''' 
+            Método que retorna as tabelas em uso: apenas a tabela principal ou,
+            durante um rehash, a tabela antiga e a nova.
+        '''
+        if self.__proxima is None:
+            return (self.__table,)
+        return (self.__table, self.__proxima)
+
+    def __slots(self):
+        ''' 
+            Método que percorre os slots (listas de entradas) de todas as tabelas em uso.
+        '''
+        for tabela in self.__tabelas():
+            for items in tabela:
+                if items is not None:
+                    yield items
+
+    def __localizar(self, key:any, operacao:int=GET):
+        ''' 
+            Método que procura a chave nas tabelas em uso, contando as chaves
+            comparadas na operação informada (GET, PUT ou REMOVE).
+            Retorna:
+                tuple: (tabela, slot, posição da entrada no slot) ou (None, -1, -1)
+                se a chave não estiver na tabela de dispersão.
+        '''
+        self.__operacoes[operacao] += 1
+        comparacoes = 0
+        for tabela in self.__tabelas():
+            slot = self.__hash(key, tabela)
+            items = tabela[slot]
+            if items is None:
+                continue
+            for i in range(len(items)):
+                if key == items[i].key:
+                    self.__sondagens[operacao] += comparacoes + i + 1
+                    return tabela, slot, i
+            comparacoes += len(items)
+        self.__sondagens[operacao] += comparacoes
+        return None, -1, -1
+
+    def __iniciar_rehash(self, size:int):
+        ''' 
+            Método que cria a tabela nova com "size" slots e inicia a transferência
+            das entradas, que é feita aos poucos por __passo_rehash.
+        '''
+        self.__proxima = self.__nova_tabela(size)
+        self.__rehash_slot = 0
+
+    def __passo_rehash(self):
+        ''' 
+            Método que transfere os próximos SLOTS_POR_PASSO slots ocupados da tabela
+            antiga para a nova e, ao transferir o último, passa a usar apenas a nova.
+        '''
+        if self.__proxima is None:
+            return
+        slot = self.__rehash_slot
+        ocupados = 0
+        fim = min(slot + SLOTS_POR_PASSO * 10, len(self.__table))
+        while slot < fim and ocupados < SLOTS_POR_PASSO:
+            if self.__table[slot]:
+                for entry in self.__table[slot]:
+                    self.__inserir(self.__proxima, self.__hash(entry.key, self.__proxima), entry)
+                self.__table[slot] = None
+                ocupados += 1
+            slot += 1
+        self.__rehash_slot = slot
+        if slot == len(self.__table):
+            self.__table = self.__proxima
+            self.__proxima = None
+            self.__rehash_slot = 0
+
+    def __inserir(self, tabela, slot:int, entry:Entry):
+        ''' 
+            Método que acrescenta a entrada ao slot, criando a lista do slot se ele estiver vazio.
+        '''
+        if tabela[slot] is None:
+            tabela[slot] = [entry]
+        else:
+            tabela[slot].append(entry)
+
+    def __verificar_fator_carga(self):
+        ''' 
+            Método que inicia um rehash se o fator de carga saiu dos limites
+            (FATOR_CARGA_MINIMO, FATOR_CARGA_MAXIMO).
+        '''
+        if self.__proxima is not None:
+            return
+        slots = len(self.__table)
+        if self.__used > slots * FATOR_CARGA_MAXIMO:
+            self.__iniciar_rehash(slots * 2)
+        elif slots > self.__size and self.__used < slots * FATOR_CARGA_MINIMO:
+            self.__iniciar_rehash(max(self.__size, slots // 2))
+
+    def put(self, key:any, data:any)->int:
+        ''' 
+            Método que insere um novo elemento na tabela de dispersão.
+            Argumentos:
+                key(Any): chave do elemento a ser inserido.
+                data(Any): valor do elemento a ser inserido.
+            Retorna:
+                int: índice na tabela de dispersão onde o elemento foi inserido.
+        '''
+        tabela, slot, i = self.__localizar(key, PUT)
+        if tabela is not None:
+            # atualizar o valor não dá passo no rehash, para que seja seguro durante uma iteração (como em um dict)
+            tabela[slot][i].value = data
+            return slot
+        self.__passo_rehash()
+        # durante um rehash as novas entradas vão direto para a tabela nova
+        tabela = self.__table if self.__proxima is None else self.__proxima
+        slot = self.__hash(key, tabela)
+        self.__inserir(tabela, slot, Entry(key,data))
+        self.__used += 1
+        self.__versao += 1
+        self.__verificar_fator_carga()
+        return slot
+
+    def get(self, key:any)->any:
+        '''
+            Método que retorna a carga na tabela de dispersão
+            correspondente a chave informada.
+            Argumentos:
+                key(Any): chave do elemento a ser buscado.
+            Retorna:
+                Any: valor do elemento buscado.
+            Raises:
+                KeyError: se a chave não for encontrada na tabela de dispersão.
+        '''
+        tabela, slot, i = self.__localizar(key)
+        if tabela is None:
+            raise KeyError(f'key {key} not found')
+        return tabela[slot][i].value
+
+    def remove(self, key:any)->any:
+        '''
+            Método que remove um elemento da tabela de dispersão.
+            Argumentos:
+                key(Any): chave do elemento a ser removido.
+            Retorna:
+                Any: valor do elemento removido.
+            Raises:
+                KeyError: se a chave não for encontrada na tabela de dispersão.
+        '''
+        tabela, slot, i = self.__localizar(key, REMOVE)
+        if tabela is None:
+            raise KeyError(f'key {key} not found')
+        value = tabela[slot].pop(i).value
+        self.__used -= 1
+        self.__versao += 1
+        self.__passo_rehash()
+        self.__verificar_fator_carga()
+        return value
+
+    def __reservar(self, entradas:int)->bool:
+        '''
+            Método que prepara a tabela principal para receber mais "entradas"
+            entradas sem redimensionar no meio de put_many: conclui um rehash em
+            andamento e, se faltar espaço, realoca a tabela de uma vez com o tamanho
+            final. Isso só é feito quando o lote tem pelo menos o tamanho da tabela,
+            para que o custo fique proporcional ao lote.
+            Retorna:
+                bool: True se as entradas cabem na tabela principal sem rehash.
+        '''
+        if self.__proxima is not None:
+            if entradas < self.__used:
+                return False
+            while self.__proxima is not None:
+                self.__passo_rehash()
+        total = self.__used + entradas
+        slots = len(self.__table)
+        if total <= slots * FATOR_CARGA_MAXIMO:
+            return True
+        if entradas < self.__used:
+            return False
+        while total > slots * FATOR_CARGA_MAXIMO:
+            slots *= 2
+        antiga = self.__table
+        self.__table = self.__nova_tabela(slots)
+        for items in antiga:
+            if items:
+                for entry in items:
+                    self.__inserir(self.__table, self.__hash(entry.key), entry)
+        return True
+
+    def put_many(self, pares)->int:
+        '''
+            Método que insere (ou atualiza) vários elementos de uma vez. A tabela é
+            dimensionada uma única vez para o lote e os pares são inseridos em uma
+            única passada, sem o passo de rehash e a verificação do fator de carga
+            de cada put.
+            Argumentos:
+                pares(Iterable): pares (chave, valor), um dict ou outra tabela de dispersão.
+            Retorna:
+                int: quantidade de chaves novas (as demais tiveram o valor atualizado).
+        '''
+        pares = _lista_pares(pares)
+        if not self.__reservar(len(pares)):
+            # lote pequeno para uma tabela que precisa crescer: o rehash continua incremental
+            antes = self.__used
+            for key, data in pares:
+                self.put(key, data)
+            return self.__used - antes
+        tabela = self.__table
+        tamanho = len(tabela)
+        novas = 0
+        comparacoes = 0
+        for key, data in pares:
+            slot = hash(key) % tamanho
+            items = tabela[slot]
+            if items is None:
+                tabela[slot] = [Entry(key, data)]
+                novas += 1
+                continue
+            for entry in items:
+                comparacoes += 1
+                if key == entry.key:
+                    entry.value = data
+                    break
+            else:
+                items.append(Entry(key, data))
+                novas += 1
+        self.__operacoes[PUT] += len(pares)
+        self.__sondagens[PUT] += comparacoes
+        if novas:
+            self.__used += novas
+            self.__versao += 1
+        return novas
+
+    def get_many(self, keys, default=_AUSENTE)->list:
+        '''
+            Método que retorna os valores de várias chaves, na ordem informada.
+            Argumentos:
+                keys(Iterable): chaves dos elementos a serem buscados.
+                default(Any): valor usado para as chaves ausentes. Se não informar,
+                uma chave ausente lança KeyError.
+            Retorna:
+                list: valores das chaves.
+            Raises:
+                KeyError: se uma chave não for encontrada e default não for informado.
+        '''
+        valores = []
+        for key in keys:
+            tabela, slot, i = self.__localizar(key)
+            if tabela is not None:
+                valores.append(tabela[slot][i].value)
+            elif default is _AUSENTE:
+                raise KeyError(f'key {key} not found')
+            else:
+                valores.append(default)
+        return valores
+
+    def update(self, outra):
+        '''
+            Método que copia para esta tabela todos os elementos de outra tabela de
+            dispersão (ou dict, ou pares chave/valor), substituindo os valores das
+            chaves que já existem. Equivale a put_many.
+        '''
+        self.put_many(outra)
+
+    @classmethod
+    def from_iterable(cls, pares):
+        '''
+            Método que cria uma tabela de dispersão já preenchida com os pares
+            (chave, valor) informados, dimensionada uma única vez para todos eles.
+        '''
+        tabela = cls()
+        tabela.put_many(pares)
+        return tabela
+
+    def stats(self)->dict:
+        '''
+            Método que retorna estatísticas de ocupação e de custo da tabela de
+            dispersão, para detectar chaves mal distribuídas. Os contadores de
+            sondagens são atualizados a cada operação e custam apenas duas somas;
+            o histograma percorre todos os slots a cada chamada.
+            Retorna:
+                dict: entradas, slots (das tabelas em uso), fator_carga, maior_cadeia,
+                media_cadeia (média dos slots não vazios), histograma_cadeias
+                ({comprimento: quantidade de slots}) e sondagens ({operação:
+                {operacoes, comparacoes, media}}, acumuladas desde a criação).
+        '''
+        histograma = {}
+        slots = 0
+        for tabela in self.__tabelas():
+            slots += len(tabela)
+            for items in tabela:
+                comprimento = len(items) if items else 0
+                histograma[comprimento] = histograma.get(comprimento, 0) + 1
+        estatisticas = _estatisticas(self.__used, slots, histograma, self.__operacoes, self.__sondagens)
+        estatisticas['rehash_em_andamento'] = self.__proxima is not None
+        return estatisticas
+
+    def _entradas(self):
+        '''
+            Método que percorre as entradas de todas as tabelas em uso, sem copiá-las.
+            Usado por __iter__, _valores e _itens, que alimentam as visões.
+            Raises:
+                RuntimeError: se uma entrada for inserida ou removida durante a iteração.
+        '''
+        versao = self.__versao
+        for items in self.__slots():
+            for entry in items:
+                yield entry
+                if versao != self.__versao:
+                    raise RuntimeError('HashTable changed size during iteration')
+
+    def _valores(self):
+        for entry in self._entradas():
+            yield entry.value
+
+    def _itens(self):
+        for entry in self._entradas():
+            yield (entry.key, entry.value)
+
+    def items(self)->'ItemsView':
+        '''
+            Método que retorna uma visão dos pares chave/valor da tabela de dispersão.
+            A visão não copia as entradas: reflete o conteúdo atual da tabela, como dict.items().
+            Retorna:
+                ItemsView: visão iterável dos pares (chave, valor), com len() e "in".
+        '''
+        return ItemsView(self)
+
+    def keys(self)->'KeysView':
+        '''
+            Método que retorna uma visão das chaves da tabela de dispersão.
+            A visão não copia as chaves: reflete o conteúdo atual da tabela, como dict.keys().
+            Retorna:
+                KeysView: visão iterável das chaves, com len() e "in" em O(1).
+        '''
+        return KeysView(self)
+    
+    def values(self)->'ValuesView':
+        '''
+        Método que retorna uma visão dos valores da tabela de dispersão.
+        A visão não copia os valores: reflete o conteúdo atual da tabela, como dict.values().
+        Retorna:
+            ValuesView: visão iterável dos valores, com len() e "in".
+        '''
+        return ValuesView(self)
+
+    def __getitem__(self, key):
+        return self.get(key)
+    
+    def __setitem__(self, key, data):
+        self.put(key, data)
+
+    def __contains__(self, key:any)->bool:
+        '''
+        Método que verifica se uma chave está na tabela de dispersão.
+        Acionado em situações de uso do operador "in": "if chave in hashTable".
+        Argumentos:
+            key(Any): chave do elemento a ser buscado.
+        Retorna:
+            bool: True se a chave estiver na tabela de dispersão e False caso contrário.
+        '''
+        tabela, slot, i = self.__localizar(key)
+        return tabela is not None
+
+    def __iter__(self):
+        '''
+        Método que percorre as chaves da tabela de dispersão: "for chave in hashTable".
+        '''
+        for entry in self._entradas():
+            yield entry.key
+
+    def __len__(self)->int:
+        '''
+        Método que informa quantas entradas estão armazenadas na tabela de dispersão.
+        Retorna:
+            int: quantidade de elementos na tabela de dispersão (O(1), mantida por put e remove).
+        '''
+        return self.__used
+
+    def __str__(self)->str:
+        '''
+        Método que retorna uma string com o conteúdo da tabela de dispersão.        
+        Retorna:
+            str: string no formato: {chave1:valor1, chave2:valor2, ...}
+        '''
+        info = "{"
+        for items in self.__slots():
+            for entry in items:
+                info += f'{entry.key}:{entry.value},'
+        info = info.rstrip(',') + '}'
+        return info
+
+    def showHashTable(self):
+        '''
+        Método que exibe o status de ocupação da tabela de dispersão.
+        Deve ser chamado apenas para tabelas de dispersão com poucos,
+        elementos, pois a saída pode ficar muito grande e confusa.
+        '''
+        for tabela in self.__tabelas():
+            entrada = -1
+            print('+--+')
+            for items in tabela:
+                entrada += 1
+                print(f'|{entrada:2d}| = ', end='') 
+                if not items:
+                    print(' None')
+                    continue
+                for entry in items:
+                    print(f'[ {entry.key},{entry.value} ] ',end='')
+                print()
+            print('+--+')
+
+
+class HashTableCompacta:
+    def __init__(self, size:int=100):
+        '''
+        Construtor de uma tabela de dispersão com endereçamento aberto, com a
+        mesma interface da HashTable (put, get, remove, items, keys, values...).
+
+        Em vez de um objeto Entry dentro de uma lista por slot, as entradas
+        ficam em vetores paralelos e densos, na ordem de inserção: hashes
+        (array de inteiros de 64 bits, guardados para não recalcular hash()
+        ao redimensionar nem comparar chaves com hashes diferentes), chaves e
+        valores. O vetor de índices, com tamanho potência de 2, guarda a
+        posição da entrada nesses vetores e é percorrido por sondagem
+        (a mesma sequência "perturbada" do dict do CPython). Uma entrada
+        removida vira uma lápide (INDICE_REMOVIDO no vetor de índices), para
+        não interromper a sondagem das demais chaves; as lápides são
+        descartadas quando a tabela é reconstruída.
+
+        Diferente da HashTable, o redimensionamento reconstrói a tabela de uma
+        vez (custo amortizado O(1) por put), quando 2/3 dos índices estão em
+        uso ou quando menos de FATOR_CARGA_MINIMO deles têm entradas.
+        Argumentos:
+            size(int): quantidade de entradas esperada, usada como capacidade
+            mínima. Se não informar, o tamanho padrão é 100.
+        '''
+        self.__size = size
+        self.__versao = 0
+        # quantidade de chamadas e de posições do vetor de índices visitadas por operação, para stats()
+        self.__operacoes = [0, 0, 0]
+        self.__sondagens = [0, 0, 0]
+        self.__hashes = array.array('q')
+        self.__keys = []
+        self.__values = []
+        self.__reconstruir(self.__capacidade_para(size))
+
+    def __capacidade_para(self, entradas:int)->int:
+        '''
+            Método que retorna a menor potência de 2 em que "entradas" ocupam no
+            máximo OCUPACAO_MAXIMA_COMPACTA dos índices.
+        '''
+        capacidade = 8
+        while capacidade * OCUPACAO_MAXIMA_COMPACTA < entradas:
+            capacidade *= 2
+        return capacidade
+
+    def __reconstruir(self, capacidade:int):
+        '''
+            Método que cria um vetor de índices com "capacidade" posições e
+            reinsere nele as entradas existentes, descartando as lápides.
+        '''
+        hashes, keys, values = self.__hashes, self.__keys, self.__values
+        self.__indices = array.array('q', [INDICE_VAZIO]) * capacidade
+        self.__mask = capacidade - 1
+        self.__limite = int(capacidade * OCUPACAO_MAXIMA_COMPACTA)
+        self.__hashes = array.array('q')
+        self.__keys = []
+        self.__values = []
+        indices = self.__indices
+        mask = self.__mask
+        for h, key, value in zip(hashes, keys, values):
+            if key is _REMOVIDA:
+                continue
+            # as chaves são distintas: basta achar um índice vazio, sem comparar chaves
+            perturb = h & 0xFFFFFFFFFFFFFFFF
+            i = h & mask
+            while indices[i] != INDICE_VAZIO:
+                perturb >>= 5
+                i = (i * 5 + perturb + 1) & mask
+            indices[i] = len(self.__keys)
+            self.__hashes.append(h)
+            self.__keys.append(key)
+            self.__values.append(value)
+        self.__used = len(self.__keys)
+
+    def __procurar(self, key:any, h:int, operacao:int=GET):
+        '''
+            Método que percorre a sequência de sondagem da chave, contando as
+            posições visitadas na operação informada (GET, PUT ou REMOVE).
+            Retorna:
+                tuple: (posição no vetor de índices, posição da entrada nos vetores
+                densos). Se a chave não estiver na tabela, a posição da entrada é -1
+                e a posição no vetor de índices é onde ela deve ser inserida.
+        '''
+        indices = self.__indices
+        mask = self.__mask
+        perturb = h & 0xFFFFFFFFFFFFFFFF
+        i = h & mask
+        livre = -1
+        self.__operacoes[operacao] += 1
+        sondagens = self.__sondagens
+        while True:
+            sondagens[operacao] += 1
+            ix = indices[i]
+            if ix == INDICE_VAZIO:
+                return (i if livre < 0 else livre), -1
+            if ix == INDICE_REMOVIDO:
+                if livre < 0:
+                    livre = i
+            elif self.__hashes[ix] == h:
+                k = self.__keys[ix]
+                if k is key or k == key:
+                    return i, ix
+            perturb >>= 5
+            i = (i * 5 + perturb + 1) & mask
+
+    def put(self, key:any, data:any)->int:
+        ''' 
+            Método que insere um novo elemento na tabela de dispersão.
+            Argumentos:
+                key(Any): chave do elemento a ser inserido.
+                data(Any): valor do elemento a ser inserido.
+            Retorna:
+                int: posição no vetor de índices onde o elemento foi inserido.
+        '''
+        h = hash(key)
+        i, ix = self.__procurar(key, h, PUT)
+        if ix >= 0:
+            self.__values[ix] = data
+            return i
+        if len(self.__keys) >= self.__limite:
+            # a capacidade considera só as entradas vivas: com muitas lápides a tabela apenas é compactada
+            self.__reconstruir(self.__capacidade_para(max(self.__size, (self.__used + 1) * 2)))
+            i, ix = self.__procurar(key, h, PUT)
+        self.__indices[i] = len(self.__keys)
+        self.__hashes.append(h)
+        self.__keys.append(key)
+        self.__values.append(data)
+        self.__used += 1
+        self.__versao += 1
+        return i
+
+    def get(self, key:any)->any:
+        '''
+            Método que retorna a carga na tabela de dispersão
+            correspondente a chave informada.
+            Argumentos:
+                key(Any): chave do elemento a ser buscado.
+            Retorna:
+                Any: valor do elemento buscado.
+            Raises:
+                KeyError: se a chave não for encontrada na tabela de dispersão.
+        '''
+        i, ix = self.__procurar(key, hash(key))
+        if ix < 0:
+            raise KeyError(f'key {key} not found')
+        return self.__values[ix]
+
+    def remove(self, key:any)->any:
+        '''
+            Método que remove um elemento da tabela de dispersão.
+            Argumentos:
+                key(Any): chave do elemento a ser removido.
+            Retorna:
+                Any: valor do elemento removido.
+            Raises:
+                KeyError: se a chave não for encontrada na tabela de dispersão.
+        '''
+        i, ix = self.__procurar(key, hash(key), REMOVE)
+        if ix < 0:
+            raise KeyError(f'key {key} not found')
+        value = self.__values[ix]
+        self.__indices[i] = INDICE_REMOVIDO
+        self.__keys[ix] = _REMOVIDA
+        self.__values[ix] = None
+        self.__used -= 1
+        self.__versao += 1
+        capacidade = len(self.__indices)
+        if capacidade > self.__capacidade_para(self.__size) and self.__used < capacidade * FATOR_CARGA_MINIMO:
+            self.__reconstruir(self.__capacidade_para(max(self.__size, self.__used * 2)))
+        return value
+
+    def put_many(self, pares)->int:
+        '''
+            Método que insere (ou atualiza) vários elementos de uma vez. A tabela é
+            reconstruída no máximo uma vez, já com a capacidade para todo o lote.
+            Argumentos:
+                pares(Iterable): pares (chave, valor), um dict ou outra tabela de dispersão.
+            Retorna:
+                int: quantidade de chaves novas (as demais tiveram o valor atualizado).
+        '''
+        pares = _lista_pares(pares)
+        if len(self.__keys) + len(pares) > self.__limite:
+            self.__reconstruir(self.__capacidade_para(max(self.__size, self.__used + len(pares))))
+        indices = self.__indices
+        hashes, keys, values = self.__hashes, self.__keys, self.__values
+        antes = self.__used
+        for key, data in pares:
+            h = hash(key)
+            i, ix = self.__procurar(key, h, PUT)
+            if ix >= 0:
+                values[ix] = data
+                continue
+            indices[i] = len(keys)
+            hashes.append(h)
+            keys.append(key)
+            values.append(data)
+            self.__used += 1
+        if self.__used != antes:
+            self.__versao += 1
+        return self.__used - antes
+
+    def get_many(self, keys, default=_AUSENTE)->list:
+        '''
+            Método que retorna os valores de várias chaves, na ordem informada.
+            Argumentos:
+                keys(Iterable): chaves dos elementos a serem buscados.
+                default(Any): valor usado para as chaves ausentes. Se não informar,
+                uma chave ausente lança KeyError.
+            Retorna:
+                list: valores das chaves.
+        '''
+        valores = []
+        for key in keys:
+            i, ix = self.__procurar(key, hash(key))
+            if ix >= 0:
+                valores.append(self.__values[ix])
+            elif default is _AUSENTE:
+                raise KeyError(f'key {key} not found')
+            else:
+                valores.append(default)
+        return valores
+
+    def update(self, outra):
+        '''
+            Método que copia para esta tabela todos os elementos de outra tabela de
+            dispersão (ou dict, ou pares chave/valor). Equivale a put_many.
+        '''
+        self.put_many(outra)
+
+    @classmethod
+    def from_iterable(cls, pares):
+        '''
+            Método que cria uma tabela já preenchida com os pares (chave, valor) informados.
+        '''
+        tabela = cls()
+        tabela.put_many(pares)
+        return tabela
+
+    def stats(self)->dict:
+        '''
+            Método que retorna as mesmas estatísticas da HashTable. Como não há
+            listas por slot, o comprimento da "cadeia" de uma entrada é a quantidade
+            de posições do vetor de índices visitadas até encontrá-la (1 quando ela
+            está na posição inicial), e as sondagens contam posições visitadas.
+            Inclui também a quantidade de lápides (entradas removidas ainda nos
+            vetores densos). O histograma refaz a sondagem de todas as entradas.
+        '''
+        indices = self.__indices
+        mask = self.__mask
+        posicoes = {}
+        for posicao, ix in enumerate(indices):
+            if ix >= 0:
+                posicoes[ix] = posicao
+        histograma = {}
+        for ix, h in enumerate(self.__hashes):
+            if self.__keys[ix] is _REMOVIDA:
+                continue
+            perturb = h & 0xFFFFFFFFFFFFFFFF
+            i = h & mask
+            comprimento = 1
+            while i != posicoes[ix]:
+                perturb >>= 5
+                i = (i * 5 + perturb + 1) & mask
+                comprimento += 1
+            histograma[comprimento] = histograma.get(comprimento, 0) + 1
+        estatisticas = _estatisticas(self.__used, len(indices), histograma, self.__operacoes, self.__sondagens)
+        estatisticas['lapides'] = len(self.__keys) - self.__used
+        return estatisticas
+
+    def __iter__(self):
+        '''
+        Método que percorre as chaves da tabela de dispersão, na ordem de inserção.
+        Raises:
+            RuntimeError: se uma entrada for inserida ou removida durante a iteração.
+        '''
+        versao = self.__versao
+        for key in self.__keys:
+            if key is not _REMOVIDA:
+                yield key
+                if versao != self.__versao:
+                    raise RuntimeError('HashTable changed size during iteration')
+
+    def _valores(self):
+        versao = self.__versao
+        for key, value in zip(self.__keys, self.__values):
+            if key is not _REMOVIDA:
+                yield value
+                if versao != self.__versao:
+                    raise RuntimeError('HashTable changed size during iteration')
+
+    def _itens(self):
+        versao = self.__versao
+        for key, value in zip(self.__keys, self.__values):
+            if key is not _REMOVIDA:
+                yield (key, value)
+                if versao != self.__versao:
+                    raise RuntimeError('HashTable changed size during iteration')
+
+    def items(self)->'ItemsView':
+        '''
+            Método que retorna uma visão dos pares chave/valor da tabela de dispersão.
+            Retorna:
+                ItemsView: visão iterável dos pares (chave, valor), com len() e "in".
+        '''
+        return ItemsView(self)
+
+    def keys(self)->'KeysView':
+        '''
+            Método que retorna uma visão das chaves da tabela de dispersão.
+            Retorna:
+                KeysView: visão iterável das chaves, com len() e "in" em O(1).
+        '''
+        return KeysView(self)
+
+    def values(self)->'ValuesView':
+        '''
+        Método que retorna uma visão dos valores da tabela de dispersão.
+        Retorna:
+            ValuesView: visão iterável dos valores, com len() e "in".
+        '''
+        return ValuesView(self)
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+    def __setitem__(self, key, data):
+        self.put(key, data)
+
+    def __contains__(self, key:any)->bool:
+        return self.__procurar(key, hash(key))[1] >= 0
+
+    def __len__(self)->int:
+        return self.__used
+
+    def __str__(self)->str:
+        '''
+        Método que retorna uma string com o conteúdo da tabela de dispersão.        
+        Retorna:
+            str: string no formato: {chave1:valor1, chave2:valor2, ...}
+        '''
+        return '{' + ','.join(f'{key}:{value}' for key, value in self._itens()) + '}'
+
+    def showHashTable(self):
+        '''
+        Método que exibe o vetor de índices e a entrada para a qual cada posição aponta.
+        Deve ser chamado apenas para tabelas de dispersão com poucos elementos.
+        '''
+        print('+--+')
+        for posicao, ix in enumerate(self.__indices):
+            print(f'|{posicao:2d}| = ', end='')
+            if ix == INDICE_VAZIO:
+                print(' None')
+            elif ix == INDICE_REMOVIDO:
+                print(' <removida>')
+            else:
+                print(f'[ {self.__keys[ix]},{self.__values[ix]} ] ')
+        print('+--+')
+
+
+class ConcurrentHashTable:
+    def __init__(self, size:int=100, particoes:int=PARTICOES_CONCORRENTE, tabela=HashTable):
+        '''
+        Construtor de uma tabela de dispersão que pode ser usada por várias
+        threads sem um semáforo externo.
+
+        As chaves são divididas em "particoes" tabelas independentes (lock
+        striping), cada uma protegida pelo seu próprio lock: operações em
+        chaves de partições diferentes não esperam umas pelas outras. Além de
+        put, get e remove, oferece operações compostas atômicas
+        (put_if_absent, compute e append_to_list_value), que verificam e
+        alteram uma chave sem que outra thread altere a mesma chave no meio.
+        A iteração (keys, values, items) copia uma partição de cada vez: não
+        bloqueia a tabela inteira, mas também não é um retrato instantâneo dela.
+        Argumentos:
+            size(int): tamanho total inicial, dividido entre as partições.
+            particoes(int): quantidade de partições (e de locks).
+            tabela(type): classe usada em cada partição (HashTable ou HashTableCompacta).
+        '''
+        self.__particoes = [tabela(max(1, size // particoes)) for _ in range(particoes)]
+        # RLock: a função de compute pode consultar a própria chave (get, in) sem travar a thread
+        self.__travas = [threading.RLock() for _ in range(particoes)]
+
+    def __particao(self, key:any)->int:
+        '''
+            Método que retorna o número da partição da chave. Usa os bits altos
+            de hash(key) * constante de Fibonacci, para que a escolha da partição
+            não dependa dos mesmos bits baixos que escolhem o slot dentro dela.
+        '''
+        return (((hash(key) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> 32) % len(self.__particoes)
+
+    def put(self, key:any, data:any)->int:
+        '''
+            Método que insere ou atualiza um elemento.
+            Retorna:
+                int: índice do elemento na tabela da sua partição.
+        '''
+        i = self.__particao(key)
+        with self.__travas[i]:
+            return self.__particoes[i].put(key, data)
+
+    def get(self, key:any)->any:
+        '''
+            Método que retorna o valor associado à chave.
+            Raises:
+                KeyError: se a chave não for encontrada na tabela de dispersão.
+        '''
+        i = self.__particao(key)
+        with self.__travas[i]:
+            return self.__particoes[i].get(key)
+
+    def remove(self, key:any)->any:
+        '''
+            Método que remove a chave e retorna o seu valor.
+            Raises:
+                KeyError: se a chave não for encontrada na tabela de dispersão.
+        '''
+        i = self.__particao(key)
+        with self.__travas[i]:
+            return self.__particoes[i].remove(key)
+
+    def put_if_absent(self, key:any, data:any)->any:
+        '''
+            Método que insere o elemento apenas se a chave ainda não existir.
+            Argumentos:
+                key(Any): chave do elemento.
+                data(Any): valor a ser inserido.
+            Retorna:
+                Any: o valor que já estava associado à chave, ou None se o novo
+                valor foi inserido.
+        '''
+        i = self.__particao(key)
+        with self.__travas[i]:
+            tabela = self.__particoes[i]
+            if key in tabela:
+                return tabela.get(key)
+            tabela.put(key, data)
+            return None
+
+    def compute(self, key:any, funcao)->any:
+        '''
+            Método que substitui o valor da chave por funcao(key, valor_atual),
+            com o lock da partição adquirido durante toda a operação.
+            valor_atual é None se a chave não existir. Se a função retornar
+            None a chave é removida (ou não é criada). A função não deve
+            acessar outras chaves da tabela.
+            Retorna:
+                Any: o novo valor associado à chave (None se ela foi removida).
+        '''
+        i = self.__particao(key)
+        with self.__travas[i]:
+            tabela = self.__particoes[i]
+            existe = key in tabela
+            novo = funcao(key, tabela.get(key) if existe else None)
+            if novo is not None:
+                tabela.put(key, novo)
+            elif existe:
+                tabela.remove(key)
+            return novo
+
+    def append_to_list_value(self, key:any, item:any, maximo:int=None)->bool:
+        '''
+            Método que acrescenta o item à lista associada à chave.
+            Argumentos:
+                key(Any): chave cujo valor é uma lista.
+                item(Any): elemento a ser acrescentado.
+                maximo(int): tamanho máximo da lista (None para não limitar).
+            Retorna:
+                bool: True se o item foi acrescentado e False se a lista já tinha
+                "maximo" elementos.
+            Raises:
+                KeyError: se a chave não for encontrada na tabela de dispersão.
+        '''
+        i = self.__particao(key)
+        with self.__travas[i]:
+            lista = self.__particoes[i].get(key)
+            if maximo is not None and len(lista) >= maximo:
+                return False
+            lista.append(item)
+            return True
+
+    def put_many(self, pares)->int:
+        '''
+            Método que insere (ou atualiza) vários elementos, adquirindo o lock de
+            cada partição uma única vez para todos os pares dela. O lote é atômico
+            em cada partição, mas não na tabela inteira.
+            Retorna:
+                int: quantidade de chaves novas.
+        '''
+        grupos = {}
+        for par in _lista_pares(pares):
+            grupos.setdefault(self.__particao(par[0]), []).append(par)
+        novas = 0
+        for i, grupo in grupos.items():
+            with self.__travas[i]:
+                novas += self.__particoes[i].put_many(grupo)
+        return novas
+
+    def get_many(self, keys, default=_AUSENTE)->list:
+        '''
+            Método que retorna os valores de várias chaves, na ordem informada,
+            adquirindo o lock de cada partição uma única vez.
+            Raises:
+                KeyError: se uma chave não for encontrada e default não for informado.
+        '''
+        keys = list(keys)
+        grupos = {}
+        for posicao, key in enumerate(keys):
+            grupos.setdefault(self.__particao(key), []).append(posicao)
+        valores = [None] * len(keys)
+        for i, posicoes in grupos.items():
+            with self.__travas[i]:
+                encontrados = self.__particoes[i].get_many([keys[p] for p in posicoes], default)
+            for posicao, valor in zip(posicoes, encontrados):
+                valores[posicao] = valor
+        return valores
+
+    def update(self, outra):
+        self.put_many(outra)
+
+    @classmethod
+    def from_iterable(cls, pares):
+        tabela = cls()
+        tabela.put_many(pares)
+        return tabela
+
+    def stats(self)->dict:
+        '''
+            Método que retorna as estatísticas das partições somadas (ver
+            HashTable.stats), obtidas uma partição por vez com o lock dela
+            adquirido, e a quantidade de entradas de cada partição, para
+            detectar partições desbalanceadas.
+        '''
+        histograma = {}
+        operacoes = [0, 0, 0]
+        sondagens = [0, 0, 0]
+        slots = 0
+        por_particao = []
+        for particao, trava in zip(self.__particoes, self.__travas):
+            with trava:
+                estatisticas = particao.stats()
+            slots += estatisticas['slots']
+            por_particao.append(estatisticas['entradas'])
+            for comprimento, quantidade in estatisticas['histograma_cadeias'].items():
+                histograma[comprimento] = histograma.get(comprimento, 0) + quantidade
+            for i, nome in enumerate(OPERACOES):
+                operacoes[i] += estatisticas['sondagens'][nome]['operacoes']
+                sondagens[i] += estatisticas['sondagens'][nome]['comparacoes']
+        estatisticas = _estatisticas(sum(por_particao), slots, histograma, operacoes, sondagens)
+        estatisticas['entradas_por_particao'] = por_particao
+        return estatisticas
+
+    def __iter__(self):
+        '''
+        Método que percorre as chaves, copiando as de uma partição por vez com o lock dela adquirido.
+        '''
+        for particao, trava in zip(self.__particoes, self.__travas):
+            with trava:
+                chaves = list(particao)
+            yield from chaves
+
+    def _valores(self):
+        for particao, trava in zip(self.__particoes, self.__travas):
+            with trava:
+                valores = list(particao._valores())
+            yield from valores
+
+    def _itens(self):
+        for particao, trava in zip(self.__particoes, self.__travas):
+            with trava:
+                itens = list(particao._itens())
+            yield from itens
+
+    def items(self)->'ItemsView':
+        return ItemsView(self)
+
+    def keys(self)->'KeysView':
+        return KeysView(self)
+
+    def values(self)->'ValuesView':
+        return ValuesView(self)
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+    def __setitem__(self, key, data):
+        self.put(key, data)
+
+    def __contains__(self, key:any)->bool:
+        i = self.__particao(key)
+        with self.__travas[i]:
+            return key in self.__particoes[i]
+
+    def __len__(self)->int:
+        '''
+        Método que soma a quantidade de entradas das partições (O(partições)).
+        '''
+        return sum(len(particao) for particao in self.__particoes)
+
+    def __str__(self)->str:
+        return '{' + ','.join(f'{key}:{value}' for key, value in self._itens()) + '}'
+
+
+class KeysView(abc.KeysView):
+    """
+    Visão das chaves de uma HashTable (ou HashTableCompacta, ConcurrentHashTable), retornada por keys().
+    Não copia as chaves: len() e "in" consultam a tabela diretamente.
+    """
+    def __iter__(self):
+        return iter(self._mapping)
+
+
+class ValuesView(abc.ValuesView):
+    """
+    Visão dos valores de uma HashTable (ou HashTableCompacta, ConcurrentHashTable), retornada por values().
+    """
+    def __iter__(self):
+        return self._mapping._valores()
+
+
+class ItemsView(abc.ItemsView):
+    """
+    Visão dos pares (chave, valor) de uma HashTable (ou HashTableCompacta, ConcurrentHashTable), retornada por items().
+    Percorre as entradas diretamente, sem buscar cada chave novamente na tabela.
+    """
+    def __iter__(self):
+        return self._mapping._itens()
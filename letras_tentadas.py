@@ -0,0 +1,50 @@
+class LetrasTentadas:
+
+    ''' Classe LetrasTentadas
+
+        Letras já tentadas em uma partida, certas e erradas juntas. Substitui a Fila de letras erradas do Jogo, em que saber
+        se uma letra já foi tentada exigia percorrer a fila (busca) e depois a palavra rasurada: aqui é uma única consulta
+        a um dicionário, O(1). O dicionário mantém a ordem em que as letras foram tentadas.
+
+        O texto das letras erradas, enviado em toda rodada, é montado uma única vez e reaproveitado até que uma nova letra
+        errada seja adicionada. O formato é o mesmo de Fila.__str__ ("[ A, B ]").
+
+        Atributos:
+        tentadas: dicionário letra -> True se a letra está na palavra, False se não está, na ordem das tentativas.
+        texto: texto das letras erradas, ou None quando precisa ser montado de novo. '''
+
+    __slots__ = ('tentadas', 'texto')
+
+    def __init__(self):
+        self.tentadas = {}
+        self.texto = None
+
+    def __contains__(self, letra):
+        return letra in self.tentadas
+
+    def __len__(self):
+        return len(self.tentadas)
+
+    def adicionar(self, letra, correta):
+
+        ''' adicionar(self, letra, correta)
+        Objetivo: Registra uma letra tentada.
+        Parâmetros de Entrada: letra (string: a letra tentada), correta (bool: True se a letra está na palavra).
+        Descrição: Uma letra errada descarta o texto das letras erradas, que é montado de novo na próxima consulta. '''
+
+        self.tentadas[letra] = correta
+        if not correta:
+            self.texto = None
+
+    def texto_erradas(self):
+
+        ''' texto_erradas(self)
+        Objetivo: Retorna o texto das letras erradas, na ordem em que foram tentadas, como "[ A, B ]". '''
+
+        if self.texto == None:
+            erradas = [letra for letra, correta in self.tentadas.items() if not correta]
+            self.texto = '[ ' + ', '.join(erradas) + ' ]' if erradas else '[  ]'
+        return self.texto
+
+    def __str__(self):
+        return self.texto_erradas()
@@ -1,328 +1,661 @@
-class Node:
-  '''
-    Classe de objetos para um nó dinâmico na memória
-    '''
-
-  def __init__(self, data):
-    self.__data = data
-    self.__next = None
-
-  @property
-  def data(self):
-    return self.__data
-
-  @data.setter
-  def data(self, newData):
-    self.__data = newData
-
-  @property
-  def next(self):
-    return self.__next
-
-  @next.setter
-  def next(self, newNext):
-    self.__next = newNext
-
-  def hasNext(self):
-    return self.__next != None
-
-  def __str__(self):
-    return str(self.__data)
-
-
-class ListException(Exception):
-  """Classe de exceção lançada quando uma violação de ordem genérica
-       da lista é identificada.
-    """
-
-  def __init__(self, msg):
-    """ Construtor padrão da classe, que recebe uma mensagem que se deseja
-            embutir na exceção
-        """
-    super().__init__(msg)
-
-
-class LinkedList:
-  """
-    A classe ListaEncadeada implementa a estrutura de dados Lista Encadeada.
-    Esta implementação utiliza nós encadeados para armazenar e manipular dados.
-    A lista encadeada pode ser usada para armazenar qualquer tipo de dado, seja
-    um tipo primitivo ou um objeto.
-
-    Attributes:
-        head (Node): O nó de início da lista encadeada.
-        tail (Node): o nó final da lista encadeada.
-        size (int): A quantidade de elementos na lista encadeada.
-        pointer (Node): O ponteiro ou cursor que apontará em qual nó a lista está e que também serve para passar pelos nós no percorrer da lista
-    """
-
-  def __init__(self) -> None:
-    """ Construtor padrão da classe Lista. Ao instanciar
-            um objeto do tipo Lista, este iniciará vazio. 
-        """
-    self.__head = None
-    self.__tail = None
-    self.__size = 0
-    self.__pointer = self.__head
-
-  def isEmpty(self):
-    """ Método que verifica se a lista está vazia ou não.
-
-        Returns:
-            boolean: True se a lista estiver vazia, False caso contrário.
-        """
-    return self.__size == 0
-
-  def __len__(self):
-    """ Método que retorna a quantidade de elementos existentes na lista
-
-        Returns:
-            int: um número inteiro que determina o número de elementos existentes na lista
-        """
-    return self.__size
-
-  def insert(self, value, position):
-    """ Método que adiciona um novo elemento à lista.
-
-        Args:
-            position (int): um número correpondente à posição em que se deseja
-                  inserir um novo valor
-            value (any): o conteúdo que deseja armazenar na lista.
-
-        Raises:
-            ListaException: Exceção lançada quando uma posição inválida é fornecida pelo usuário. São inválidas posições que se referem a:
-                  (a) números negativos
-                  (b) zero
-                  (c) número natural correspondente a um elemento que excede a
-                      quantidade de elementos da lista.
-        """
-    try:
-      assert position > 0 and position <= len(
-          self) + 1, f'Posicao invalida. Lista contém {self.__size} elementos'
-      if self.isEmpty():
-        if (position != 1):
-          raise ListException(
-              f'A lista esta vazia. A posicao correta para insercao é 1.')
-        new = Node(value)
-        self.__head = new
-        self.__tail = new
-        self.__tail.next = self.__head
-        self.__size += 1
-        self.__pointer = self.__head
-
-      elif position == 1:
-        new = Node(value)
-        new.next = self.__head
-        self.__head = new
-        self.__tail.next = self.__head
-        self.__size += 1
-        self.__pointer = self.__head
-
-      elif position == len(self) + 1:
-        new = Node(value)
-        self.__tail.next = new
-        self.__tail = new
-        self.__tail.next = self.__head
-        self.__size += 1
-
-      else:
-        new = Node(value)
-        pointer = self.__head
-        count = 1
-        while (count < (position - 1)):
-          pointer = pointer.next
-          count += 1
-        new.next = pointer.next
-        pointer.next = new
-        self.__size += 1
-
-    except TypeError:
-      raise ListException(f'A posição deve ser um número inteiro')
-    except AssertionError as ae:
-      raise ListException(ae)
-
-  def advance(self):
-    """ Método que avança o ponteiro da lista.
-
-            Returns: Ponteiro que representa o próximo jogador da partida.
-        """
-    self.__pointer = self.__pointer.next
-    return self.__pointer.data
-
-  def goTo(self, start, quantity):
-    """ Método que recebe quem começa o jogo(start) e a quantidade de iterações, servindo para percorrer até a posição do eliminado.
-
-        Args:
-            start (any): quem começa o jogo.
-            qunatity (int): quantidade de iterações.
-
-        Returns: Posição do jogador eliminado.
-        """
-    pointer = self.__head
-    count = 1
-    while (count < start):
-      pointer = pointer.next
-      count += 1
-    for i in range(quantity):
-      pointer = pointer.next
-    return pointer.data
-
-
-  def tamanho(self):
-    return self.__size
-    
-  def remove(self, position):
-    """ Método que remove um elemento da lista.
-
-        Args:
-            position (int): um número correpondente à ordem do elemento na lista.
-        
-        Returns:
-            qualquer tipo primitivo: o valor encontrado no elemento removido
-
-        Raises:
-            ListaException: Exceção lançada quando uma posição inválida é
-                  fornecida pelo usuário. São inválidas posições que se referem a:
-                  (a) números negativos
-                  (b) zero
-                  (c) número natural correspondente a um elemento que excede a
-                      quantidade de elementos da lista.                      
-        """
-    try:
-      if (self.isEmpty()):
-        raise ListException(f'Não é possível remover de uma lista vazia')
-      assert position > 0 and position <= len(
-          self), f'Posicao invalida. Lista contém {self.__size} elementos'
-
-      if position == 1:
-        data = self.__head.data
-        pointer = self.__head
-        self.__tail.next = pointer.next
-        self.__head = pointer.next
-        self.__size -= 1
-        self.__pointer = self.__head
-        if data == self.__pointer.data:
-          self.__pointer = self.__pointer.next
-        return data
-
-      elif position == len(self):
-        data = self.__tail.data
-        count = 1
-        pointer = self.__head
-        while count < position - 1:
-          pointer = pointer.next
-          count += 1
-        pointer.next = self.__head
-        self.__tail = pointer
-        self.__size -= 1
-        if data == self.__pointer.data:
-          self.__pointer = self.__pointer.next
-        return data
-
-      else:
-        pointer = self.__head
-        ant = self.__head
-        count = 1
-        while (count < position):
-          ant = pointer
-          pointer = pointer.next
-          count += 1
-        ant.next = pointer.next
-        data = pointer.data
-        if data == self.__pointer.data:
-          self.__pointer = self.__pointer.next
-        self.__size -= 1
-        return data
-
-    except TypeError:
-      raise ListException(f'A posição deve ser um número inteiro')
-    except AssertionError as ae:
-      raise ListException(ae)
-
-  def index(self, elem):
-    """ Método que recupera a posicao ordenada, dentro da lista, em que se
-            encontra um elemento passado como argumento. No caso de haver mais de uma
-            ocorrência do valor, a primeira ocorrência será levada em conta.
-        Args:
-            elem (any): o elemento que deverá ser buscada a sua posição.
-        
-        Returns:
-            int: um número inteiro representando a posição, na lista, em que foi
-                 encontrado "elem".
-
-        Raises:
-            ListException: Exceção lançada quando o argumento "elem"
-                  não está presente na lista ou se a lista estiver vazia.
-        """
-    if (self.isEmpty()):
-      raise ListException(f'Lista vazia')
-    pointer = self.__head
-    count = 1
-    while True:
-      if pointer.data == elem:
-        return count
-      pointer = pointer.next
-      count += 1
-      if pointer == self.__head:
-        break
-    raise ListException(f'O elemento {elem} não está armazenado na lista')
-
-  def element(self, index):
-    """ Método que recupera o elemento, dentro da lista, em que se
-            encontrado através do seu índice passado como argumento. No caso de haver mais de uma
-            ocorrência do element, a primeira ocorrência será levada em conta.
-            
-        Args:
-            index (int): Índex do elemento que será buscado na lista.
-
-        Raises:
-            ListaException: Exceção lançada quando o argumento no índice é inválida,sendo negativa
-        """
-    try:
-      assert not self.isEmpty(), 'Lista vazia'
-      assert index >= 0 and index <= len(
-          self), f'Posicao invalida. Lista contém {self.__size} elementos'
-
-      pointer = self.__head
-      count = 1
-      while (count <= index):
-        pointer = pointer.next
-        count += 1
-      return pointer.data
-    except TypeError:
-      raise ListException(f'A posição deve ser um número inteiro')
-    except AssertionError as ae:
-      raise ListException(ae)
-
-  def verifyElement(self, element):
-
-    """ Método que verifica se o elemento dentro da lista está igual a outro elemento.
-        Args:
-            element (any): Elemento que será comparado na lista.
-        
-        Returns:
-            any: um elemento que foi achado na lista com base na sua posição.
-
-        Raises:
-            ListaException: Erro se um elemento for igual a outro que já pertencia a lista ou AssertionError.
-        """
-    try:
-      pointer = self.__head
-      for i in range(len(self)):
-        assert pointer.data != element, f'O elemento [{element}] já está na lista e não pode ser adicionado de novo.'
-        pointer = pointer.next
-    except AssertionError as ae:
-      raise ListException(ae)
-
-  def __str__(self) -> str:
-    str = '[ '
-    if self.isEmpty():
-      str += ']'
-      return str
-    pointer = self.__head
-    for i in range(1, len(self) + 1):
-      str += f'{pointer.data}, '
-      pointer = pointer.next
-    str = str[:-2] + " ]"
-    return str
-
+
+class Node:
+  '''
+    Classe de objetos para um nó dinâmico na memória. O nó aponta para o próximo e para o anterior, para que a lista
+    consiga retirá-lo sem percorrer os demais nós (ver LinkedList.remove_node). Os atributos são acessados diretamente
+    e ficam em __slots__: o nó não tem __dict__ e percorrer a lista (pointer.next) não chama nenhum método.
+    '''
+
+  __slots__ = ('data', 'next', 'prev')
+
+  def __init__(self, data):
+    self.data = data
+    self.next = None
+    self.prev = None
+
+  def hasNext(self):
+    return self.next is not None
+
+  def __str__(self):
+    return str(self.data)
+
+
+class ListException(Exception):
+  """Classe de exceção lançada quando uma violação de ordem genérica
+       da lista é identificada.
+    """
+
+  def __init__(self, msg):
+    """ Construtor padrão da classe, que recebe uma mensagem que se deseja
+            embutir na exceção
+        """
+    super().__init__(msg)
+
+
+class LinkedList:
+  """
+    A classe ListaEncadeada implementa a estrutura de dados Lista Encadeada.
+    Esta implementação utiliza nós encadeados para armazenar e manipular dados.
+    A lista encadeada pode ser usada para armazenar qualquer tipo de dado, seja
+    um tipo primitivo ou um objeto.
+
+    Attributes:
+        head (Node): O nó de início da lista encadeada.
+        tail (Node): o nó final da lista encadeada.
+        size (int): A quantidade de elementos na lista encadeada.
+        pointer (Node): O ponteiro ou cursor que apontará em qual nó a lista está e que também serve para passar pelos nós no percorrer da lista
+    """
+
+  def __init__(self) -> None:
+    """ Construtor padrão da classe Lista. Ao instanciar
+            um objeto do tipo Lista, este iniciará vazio. 
+        """
+    self.__head = None
+    self.__tail = None
+    self.__size = 0
+    self.__pointer = self.__head
+
+  def isEmpty(self):
+    """ Método que verifica se a lista está vazia ou não.
+
+        Returns:
+            boolean: True se a lista estiver vazia, False caso contrário.
+        """
+    return self.__size == 0
+
+  def __len__(self):
+    """ Método que retorna a quantidade de elementos existentes na lista
+
+        Returns:
+            int: um número inteiro que determina o número de elementos existentes na lista
+        """
+    return self.__size
+
+  def insert(self, value, position):
+    """ Método que adiciona um novo elemento à lista.
+
+        Args:
+            position (int): um número correpondente à posição em que se deseja
+                  inserir um novo valor
+            value (any): o conteúdo que deseja armazenar na lista.
+
+        Returns:
+            Node: o nó criado para o elemento, que pode ser passado a remove_node para retirá-lo da lista sem
+                  procurar a sua posição.
+
+        Raises:
+            ListaException: Exceção lançada quando uma posição inválida é fornecida pelo usuário. São inválidas posições que se referem a:
+                  (a) números negativos
+                  (b) zero
+                  (c) número natural correspondente a um elemento que excede a
+                      quantidade de elementos da lista.
+        """
+    try:
+      assert position > 0 and position <= len(
+          self) + 1, f'Posicao invalida. Lista contém {self.__size} elementos'
+      if self.isEmpty():
+        if (position != 1):
+          raise ListException(
+              f'A lista esta vazia. A posicao correta para insercao é 1.')
+        new = Node(value)
+        new.next = new
+        new.prev = new
+        self.__head = new
+        self.__tail = new
+        self.__pointer = self.__head
+
+      elif position == 1:
+        new = Node(value)
+        self.__ligar(new, self.__tail, self.__head)
+        self.__head = new
+        self.__pointer = self.__head
+
+      elif position == len(self) + 1:
+        new = Node(value)
+        self.__ligar(new, self.__tail, self.__head)
+        self.__tail = new
+
+      else:
+        new = Node(value)
+        pointer = self.__head
+        count = 1
+        while (count < (position - 1)):
+          pointer = pointer.next
+          count += 1
+        self.__ligar(new, pointer, pointer.next)
+      self.__size += 1
+      return new
+
+    except TypeError:
+      raise ListException(f'A posição deve ser um número inteiro')
+    except AssertionError as ae:
+      raise ListException(ae)
+
+  def __ligar(self, new, anterior, proximo):
+    """ Método que encadeia o nó new entre os nós anterior e proximo.
+        """
+    new.prev = anterior
+    new.next = proximo
+    anterior.next = new
+    proximo.prev = new
+
+  def advance(self):
+    """ Método que avança o ponteiro da lista.
+
+            Returns: Ponteiro que representa o próximo jogador da partida.
+        """
+    self.__pointer = self.__pointer.next
+    return self.__pointer.data
+
+  def goTo(self, start, quantity):
+    """ Método que recebe quem começa o jogo(start) e a quantidade de iterações, servindo para percorrer até a posição do eliminado.
+
+        Args:
+            start (any): quem começa o jogo.
+            qunatity (int): quantidade de iterações.
+
+        Returns: Posição do jogador eliminado.
+        """
+    # a lista é circular: percorrer size nós volta ao mesmo nó, então basta o resto da divisão
+    pointer = self.__head
+    for i in range((start - 1 + quantity) % self.__size):
+      pointer = pointer.next
+    return pointer.data
+
+
+  def tamanho(self):
+    return self.__size
+    
+  def remove(self, position):
+    """ Método que remove um elemento da lista. Se o elemento removido for o do ponteiro, o ponteiro passa para o
+        elemento seguinte.
+
+        Args:
+            position (int): um número correpondente à ordem do elemento na lista.
+        
+        Returns:
+            qualquer tipo primitivo: o valor encontrado no elemento removido
+
+        Raises:
+            ListaException: Exceção lançada quando uma posição inválida é
+                  fornecida pelo usuário. São inválidas posições que se referem a:
+                  (a) números negativos
+                  (b) zero
+                  (c) número natural correspondente a um elemento que excede a
+                      quantidade de elementos da lista.                      
+        """
+    try:
+      if (self.isEmpty()):
+        raise ListException(f'Não é possível remover de uma lista vazia')
+      assert position > 0 and position <= len(
+          self), f'Posicao invalida. Lista contém {self.__size} elementos'
+
+      if position == len(self):
+        pointer = self.__tail
+      else:
+        pointer = self.__head
+        count = 1
+        while (count < position):
+          pointer = pointer.next
+          count += 1
+      return self.remove_node(pointer)
+
+    except TypeError:
+      raise ListException(f'A posição deve ser um número inteiro')
+    except AssertionError as ae:
+      raise ListException(ae)
+
+  def remove_node(self, node):
+    """ Método que remove da lista o nó retornado por insert, em O(1): o nó é desencadeado dos seus vizinhos sem
+        percorrer a lista. Se o nó for o do ponteiro, o ponteiro passa para o elemento seguinte. Como o nó é comparado
+        por identidade, elementos com o mesmo valor não são confundidos.
+
+        Args:
+            node (Node): o nó retornado por insert quando o elemento foi adicionado.
+
+        Returns:
+            any: o valor encontrado no elemento removido
+
+        Raises:
+            ListException: Exceção lançada quando o nó já foi removido da lista.
+        """
+    if node.next is None:
+      raise ListException(f'O elemento {node} não está armazenado na lista')
+    self.__size -= 1
+    if self.__size == 0:
+      self.__head = self.__tail = self.__pointer = None
+    else:
+      node.prev.next = node.next
+      node.next.prev = node.prev
+      if node is self.__head:
+        self.__head = node.next
+      if node is self.__tail:
+        self.__tail = node.prev
+      if node is self.__pointer:
+        self.__pointer = node.next
+    node.next = node.prev = None
+    return node.data
+
+  def current(self):
+    """ Método que retorna o elemento apontado pelo ponteiro da lista (o jogador da vez).
+
+        Returns:
+            any: o elemento do ponteiro, ou None se a lista estiver vazia.
+        """
+    if self.isEmpty():
+      return None
+    return self.__pointer.data
+
+  def removeCurrent(self):
+    """ Método que remove o elemento apontado pelo ponteiro da lista. O ponteiro passa para o elemento seguinte.
+
+        Returns:
+            any: o valor encontrado no elemento removido
+
+        Raises:
+            ListException: Exceção lançada quando a lista está vazia.
+        """
+    if self.isEmpty():
+      raise ListException(f'Não é possível remover de uma lista vazia')
+    return self.remove_node(self.__pointer)
+
+  def index(self, elem):
+    """ Método que recupera a posicao ordenada, dentro da lista, em que se
+            encontra um elemento passado como argumento. No caso de haver mais de uma
+            ocorrência do valor, a primeira ocorrência será levada em conta.
+        Args:
+            elem (any): o elemento que deverá ser buscada a sua posição.
+        
+        Returns:
+            int: um número inteiro representando a posição, na lista, em que foi
+                 encontrado "elem".
+
+        Raises:
+            ListException: Exceção lançada quando o argumento "elem"
+                  não está presente na lista ou se a lista estiver vazia.
+        """
+    if (self.isEmpty()):
+      raise ListException(f'Lista vazia')
+    head = self.__head
+    pointer = head
+    count = 1
+    while True:
+      if pointer.data == elem:
+        return count
+      pointer = pointer.next
+      count += 1
+      if pointer is head:
+        break
+    raise ListException(f'O elemento {elem} não está armazenado na lista')
+
+  def element(self, index):
+    """ Método que recupera o elemento, dentro da lista, em que se
+            encontrado através do seu índice passado como argumento. No caso de haver mais de uma
+            ocorrência do element, a primeira ocorrência será levada em conta.
+            
+        Args:
+            index (int): Índex do elemento que será buscado na lista.
+
+        Raises:
+            ListaException: Exceção lançada quando o argumento no índice é inválida,sendo negativa
+        """
+    try:
+      assert not self.isEmpty(), 'Lista vazia'
+      assert index >= 0 and index <= len(
+          self), f'Posicao invalida. Lista contém {self.__size} elementos'
+
+      pointer = self.__head
+      for i in range(index):
+        pointer = pointer.next
+      return pointer.data
+    except TypeError:
+      raise ListException(f'A posição deve ser um número inteiro')
+    except AssertionError as ae:
+      raise ListException(ae)
+
+  def verifyElement(self, element):
+
+    """ Método que verifica se o elemento dentro da lista está igual a outro elemento.
+        Args:
+            element (any): Elemento que será comparado na lista.
+        
+        Returns:
+            any: um elemento que foi achado na lista com base na sua posição.
+
+        Raises:
+            ListaException: Erro se um elemento for igual a outro que já pertencia a lista ou AssertionError.
+        """
+    try:
+      pointer = self.__head
+      for i in range(len(self)):
+        assert pointer.data != element, f'O elemento [{element}] já está na lista e não pode ser adicionado de novo.'
+        pointer = pointer.next
+    except AssertionError as ae:
+      raise ListException(ae)
+
+  def __str__(self) -> str:
+    if self.isEmpty():
+      return '[ ]'
+    itens = []
+    pointer = self.__head
+    for i in range(self.__size):
+      itens.append(f'{pointer.data}')
+      pointer = pointer.next
+    return '[ ' + ', '.join(itens) + ' ]'
+
+
+
+_VAGO = object()
+
+
+class Celula:
+  '''
+    Posição de um elemento na RingBufferList: guarda o elemento e o índice dele na lista contígua. É o valor retornado
+    por RingBufferList.insert e recebido por remove_node, como o Node na LinkedList.
+    '''
+
+  __slots__ = ('data', 'indice')
+
+  def __init__(self, data, indice):
+    self.data = data
+    self.indice = indice
+
+  def __str__(self):
+    return str(self.data)
+
+
+class RingBufferList:
+  """
+    A classe RingBufferList implementa a mesma lista circular de LinkedList (mesmos métodos, posições e exceções)
+    sobre uma lista contígua do Python, com índices para o início da lista e para o ponteiro, em vez de nós encadeados.
+    Pode substituir LinkedList no Jogo (ver LISTAS_JOGADORES em jogo.py).
+
+    advance, element, tamanho e current são O(1): o ponteiro é um índice e avançar é somar um, voltando ao início no
+    fim da lista. remove_node e removeCurrent são O(1) amortizados: a posição removida fica vaga (marcada com _VAGO) e é
+    pulada por advance, e a lista só é compactada quando as posições vagas passam da quantidade de elementos. Os métodos
+    que usam uma posição da lista (element, insert no meio, remove) compactam antes as posições vagas, se houver.
+
+    Cada elemento fica em uma Celula, que guarda o seu índice na lista; insert retorna a Celula, que pode ser passada
+    a remove_node como o Node na LinkedList.
+
+    Attributes:
+        itens (list): as células dos elementos na ordem da lista, com as posições vagas.
+        inicio (int): índice do primeiro elemento da lista em itens.
+        pointer (int): índice em itens do elemento apontado pelo ponteiro.
+        size (int): A quantidade de elementos na lista.
+        vagos (int): A quantidade de posições vagas em itens.
+    """
+
+  def __init__(self) -> None:
+    """ Construtor padrão da classe. Ao instanciar um objeto do tipo RingBufferList, este iniciará vazio.
+        """
+    self.__itens = []
+    self.__inicio = 0
+    self.__pointer = 0
+    self.__size = 0
+    self.__vagos = 0
+
+  def isEmpty(self):
+    """ Método que verifica se a lista está vazia ou não.
+
+        Returns:
+            boolean: True se a lista estiver vazia, False caso contrário.
+        """
+    return self.__size == 0
+
+  def __len__(self):
+    """ Método que retorna a quantidade de elementos existentes na lista
+
+        Returns:
+            int: um número inteiro que determina o número de elementos existentes na lista
+        """
+    return self.__size
+
+  def tamanho(self):
+    return self.__size
+
+  def __reindexar(self, inicio=0):
+    """ Método que atualiza o índice guardado nas células a partir da posição inicio de itens.
+        """
+    itens = self.__itens
+    for i in range(inicio, len(itens)):
+      itens[i].indice = i
+
+  def __compactar(self):
+    """ Método que retira as posições vagas de itens, mantendo o ponteiro no mesmo elemento.
+        """
+    if self.__vagos == 0:
+      return
+    atual = self.__itens[self.__pointer]
+    self.__itens = [celula for celula in self.__itens if celula is not _VAGO]
+    self.__reindexar()
+    self.__pointer = atual.indice
+    self.__inicio = 0
+    self.__vagos = 0
+
+  def __proximo(self, i):
+    """ Método que retorna o índice do próximo elemento depois do índice i, pulando as posições vagas e voltando ao
+        início da lista depois do último elemento.
+        """
+    itens = self.__itens
+    while True:
+      i += 1
+      if i == len(itens):
+        i = self.__inicio
+      if itens[i] is not _VAGO:
+        return i
+
+  def insert(self, value, position):
+    """ Método que adiciona um novo elemento à lista.
+
+        Args:
+            position (int): um número correpondente à posição em que se deseja
+                  inserir um novo valor
+            value (any): o conteúdo que deseja armazenar na lista.
+
+        Returns:
+            Celula: a célula criada para o elemento, que pode ser passada a remove_node.
+
+        Raises:
+            ListException: Exceção lançada quando uma posição inválida é fornecida pelo usuário (ver LinkedList.insert).
+        """
+    try:
+      assert position > 0 and position <= len(
+          self) + 1, f'Posicao invalida. Lista contém {self.__size} elementos'
+      if self.isEmpty():
+        if (position != 1):
+          raise ListException(
+              f'A lista esta vazia. A posicao correta para insercao é 1.')
+        new = Celula(value, 0)
+        self.__itens = [new]
+        self.__inicio = 0
+        self.__pointer = 0
+        self.__vagos = 0
+
+      elif position == len(self) + 1:
+        new = Celula(value, len(self.__itens))
+        self.__itens.append(new)
+
+      else:
+        self.__compactar()
+        new = Celula(value, position - 1)
+        self.__itens.insert(position - 1, new)
+        self.__reindexar(position)
+        if position == 1:
+          self.__pointer = 0
+        elif self.__pointer >= position - 1:
+          self.__pointer += 1
+      self.__size += 1
+      return new
+
+    except TypeError:
+      raise ListException(f'A posição deve ser um número inteiro')
+    except AssertionError as ae:
+      raise ListException(ae)
+
+  def advance(self):
+    """ Método que avança o ponteiro da lista.
+
+            Returns: Ponteiro que representa o próximo jogador da partida.
+        """
+    if self.isEmpty():
+      raise ListException(f'Lista vazia')
+    self.__pointer = self.__proximo(self.__pointer)
+    return self.__itens[self.__pointer].data
+
+  def current(self):
+    """ Método que retorna o elemento apontado pelo ponteiro da lista (o jogador da vez).
+
+        Returns:
+            any: o elemento do ponteiro, ou None se a lista estiver vazia.
+        """
+    if self.isEmpty():
+      return None
+    return self.__itens[self.__pointer].data
+
+  def goTo(self, start, quantity):
+    """ Método que recebe quem começa o jogo(start) e a quantidade de iterações, servindo para percorrer até a posição do eliminado.
+
+        Args:
+            start (any): quem começa o jogo.
+            qunatity (int): quantidade de iterações.
+
+        Returns: Posição do jogador eliminado.
+        """
+    self.__compactar()
+    return self.__itens[(start - 1 + quantity) % self.__size].data
+
+  def remove(self, position):
+    """ Método que remove um elemento da lista. Se o elemento removido for o do ponteiro, o ponteiro passa para o
+        elemento seguinte.
+
+        Args:
+            position (int): um número correpondente à ordem do elemento na lista.
+
+        Returns:
+            qualquer tipo primitivo: o valor encontrado no elemento removido
+
+        Raises:
+            ListException: Exceção lançada quando uma posição inválida é fornecida pelo usuário (ver LinkedList.remove).
+        """
+    try:
+      if (self.isEmpty()):
+        raise ListException(f'Não é possível remover de uma lista vazia')
+      assert position > 0 and position <= len(
+          self), f'Posicao invalida. Lista contém {self.__size} elementos'
+      self.__compactar()
+      return self.remove_node(self.__itens[position - 1])
+
+    except TypeError:
+      raise ListException(f'A posição deve ser um número inteiro')
+    except AssertionError as ae:
+      raise ListException(ae)
+
+  def remove_node(self, node):
+    """ Método que remove da lista a célula retornada por insert. A posição dela fica vaga, sem mover os demais
+        elementos; se for a do ponteiro, o ponteiro passa para o elemento seguinte.
+
+        Args:
+            node (Celula): a célula retornada por insert quando o elemento foi adicionado.
+
+        Returns:
+            any: o valor encontrado no elemento removido
+
+        Raises:
+            ListException: Exceção lançada quando a célula já foi removida da lista.
+        """
+    i = node.indice
+    if i == None or i >= len(self.__itens) or self.__itens[i] is not node:
+      raise ListException(f'O elemento {node} não está armazenado na lista')
+    node.indice = None
+    self.__size -= 1
+    if self.__size == 0:
+      self.__itens = []
+      self.__inicio = self.__pointer = self.__vagos = 0
+      return node.data
+    if i == self.__pointer:
+      self.__pointer = self.__proximo(i)
+    if i == self.__inicio:
+      self.__inicio = self.__proximo(i)
+    self.__itens[i] = _VAGO
+    self.__vagos += 1
+    if self.__vagos > self.__size:
+      self.__compactar()
+    return node.data
+
+  def removeCurrent(self):
+    """ Método que remove o elemento apontado pelo ponteiro da lista. O ponteiro passa para o elemento seguinte.
+
+        Returns:
+            any: o valor encontrado no elemento removido
+
+        Raises:
+            ListException: Exceção lançada quando a lista está vazia.
+        """
+    if self.isEmpty():
+      raise ListException(f'Não é possível remover de uma lista vazia')
+    return self.remove_node(self.__itens[self.__pointer])
+
+  def index(self, elem):
+    """ Método que recupera a posicao ordenada, dentro da lista, em que se
+            encontra um elemento passado como argumento. No caso de haver mais de uma
+            ocorrência do valor, a primeira ocorrência será levada em conta.
+        Args:
+            elem (any): o elemento que deverá ser buscada a sua posição.
+
+        Returns:
+            int: um número inteiro representando a posição, na lista, em que foi
+                 encontrado "elem".
+
+        Raises:
+            ListException: Exceção lançada quando o argumento "elem"
+                  não está presente na lista ou se a lista estiver vazia.
+        """
+    if (self.isEmpty()):
+      raise ListException(f'Lista vazia')
+    count = 1
+    for celula in self.__itens[self.__inicio:]:
+      if celula is _VAGO:
+        continue
+      if celula.data == elem:
+        return count
+      count += 1
+    raise ListException(f'O elemento {elem} não está armazenado na lista')
+
+  def element(self, index):
+    """ Método que recupera o elemento, dentro da lista, em que se
+            encontrado através do seu índice passado como argumento (0 é o primeiro; len(lista) volta ao primeiro).
+
+        Args:
+            index (int): Índex do elemento que será buscado na lista.
+
+        Raises:
+            ListException: Exceção lançada quando o argumento no índice é inválida,sendo negativa
+        """
+    try:
+      assert not self.isEmpty(), 'Lista vazia'
+      assert index >= 0 and index <= len(
+          self), f'Posicao invalida. Lista contém {self.__size} elementos'
+      self.__compactar()
+      return self.__itens[index % self.__size].data
+    except TypeError:
+      raise ListException(f'A posição deve ser um número inteiro')
+    except AssertionError as ae:
+      raise ListException(ae)
+
+  def verifyElement(self, element):
+    """ Método que verifica se o elemento dentro da lista está igual a outro elemento.
+        Args:
+            element (any): Elemento que será comparado na lista.
+
+        Raises:
+            ListException: Erro se um elemento for igual a outro que já pertencia a lista.
+        """
+    for celula in self.__itens:
+      if celula is not _VAGO and celula.data == element:
+        raise ListException(f'O elemento [{element}] já está na lista e não pode ser adicionado de novo.')
+
+  def __str__(self) -> str:
+    if self.isEmpty():
+      return '[ ]'
+    return '[ ' + ', '.join(f'{celula.data}' for celula in self.__itens[self.__inicio:] if celula is not _VAGO) + ' ]'
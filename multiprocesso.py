@@ -0,0 +1,214 @@
+import array
+import itertools
+import json
+import multiprocessing
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import zlib
+from hashtable import *
+
+# tamanho máximo de uma mensagem entre workers; o canal é de datagramas, e uma mensagem maior seria truncada por recv_fds
+TAMANHO_MAXIMO_AVISO = 65536
+
+
+class RegistroSalas:
+
+    ''' Classe RegistroSalas
+
+        Coordena as salas entre os processos (workers) do servidor quando ele é iniciado com --workers. Todos os workers
+        escutam a mesma porta com SO_REUSEPORT, então o kernel distribui as conexões entre eles e um cliente pode cair em um
+        worker diferente daquele onde está a sala que deseja criar ou entrar.
+
+        Cada sala pertence a um único worker, escolhido pelo crc32 do nome da sala. Quando um cliente pede para criar ou
+        entrar em uma sala de outro worker, o socket do cliente é repassado (SCM_RIGHTS) ao worker dono junto com o nickname
+        e o comando pendente, e passa a ser atendido por ele. Assim as salas e os jogadores prontos de uma sala ficam sempre
+        no mesmo processo e a verificação de nome repetido é feita apenas pelo dono, sem estado compartilhado.
+
+        Para que salas_disponiveis não precise consultar os outros workers, cada worker mantém uma cópia da lista de salas
+        de todos os workers, com a ocupação de cada uma, atualizada pelas mensagens de criação, ocupação e remoção que o dono
+        envia aos demais. A ocupação de uma sala de outro worker pode chegar com um pequeno atraso.
+
+        Cada mensagem entre workers é um datagrama de no máximo TAMANHO_MAXIMO_AVISO bytes. Um cliente cujo repasse não cabe
+        nesse limite (nome de sala ou bytes pendentes muito grandes) é desconectado, e um aviso que não cabe não é enviado
+        (a sala fica fora da lista dos outros workers).
+
+        Atributos:
+        indice: número do worker dono deste registro.
+        caminhos: endereços (sockets unix) dos canais de todos os workers.
+        canal: socket unix (datagrama) deste worker, usado para receber clientes e avisos de salas.
+        salas: ConcurrentHashTable com o nome de cada sala conhecida e o par (worker dono, quantidade de jogadores).
+        versao_salas: número que muda a cada alteração nas salas conhecidas (usado pelo retrato das salas do Server). '''
+
+    def __init__(self, indice, caminhos, canal):
+        self.indice = indice
+        self.__caminhos = caminhos
+        self.__canal = canal
+        self.__salas = ConcurrentHashTable()
+        self.__versoes = itertools.count(1)
+        self.versao_salas = 0
+        self.__adotar_cliente = None
+
+    def iniciar(self, adotar_cliente):
+
+        ''' iniciar(self, adotar_cliente)
+        Objetivo: Começa a receber as mensagens dos outros workers.
+        Parâmetros de Entrada: adotar_cliente (função adotar_cliente(cliente_socket, nickname, comando, pendentes, codec) do motor de rede do worker, chamada para cada cliente repassado a este worker). '''
+
+        self.__adotar_cliente = adotar_cliente
+        threading.Thread(target=self.__escutar, daemon=True).start()
+
+    def dono(self, sala):
+
+        ''' dono(self, sala)
+        Objetivo: Retorna o número do worker responsável pela sala. '''
+
+        return zlib.crc32(sala.encode('utf8')) % len(self.__caminhos)
+
+    def eh_local(self, sala):
+
+        ''' eh_local(self, sala)
+        Objetivo: Verifica se a sala pertence a este worker. '''
+
+        return self.dono(sala) == self.indice
+
+    def transferir(self, cliente_socket, nickname, comando, sala):
+
+        ''' transferir(self, cliente_socket, nickname, comando, sala)
+        Objetivo: Repassa o cliente para o worker dono da sala.
+        Descrição: Envia o descritor do socket, o nickname, o comando ainda não executado, os bytes já recebidos e não
+        consumidos e o formato (codec) negociado com o cliente para o worker dono, que responde ao cliente. Em seguida fecha a cópia local do socket; a conexão continua
+        aberta no worker de destino. Se a mensagem passar de TAMANHO_MAXIMO_AVISO, o cliente não é repassado e a conexão é fechada. '''
+
+        mensagem = json.dumps({'tipo': 'cliente', 'nickname': nickname, 'comando': comando,
+                               'pendentes': cliente_socket.pendentes().hex(),
+                               'codec': cliente_socket.codec.nome}).encode('utf8')
+        if len(mensagem) > TAMANHO_MAXIMO_AVISO:
+            print(f"Cliente {nickname} não repassado: mensagem de {len(mensagem)} bytes excede {TAMANHO_MAXIMO_AVISO}.")
+            cliente_socket.close()
+            return
+        descritores = [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array('i', [cliente_socket.fileno()]))]
+        self.__canal.sendmsg([mensagem], descritores, 0, self.__caminhos[self.dono(sala)])
+        cliente_socket.close()
+
+    def publicar_sala(self, sala):
+
+        ''' publicar_sala(self, sala)
+        Objetivo: Registra uma sala criada neste worker (com o jogador que a criou) e avisa os demais. '''
+
+        self.__registrar(sala, self.indice, 1)
+        self.__avisar({'tipo': 'sala_criada', 'sala': sala, 'dono': self.indice, 'jogadores': 1})
+
+    def atualizar_sala(self, sala, jogadores):
+
+        ''' atualizar_sala(self, sala, jogadores)
+        Objetivo: Registra a nova quantidade de jogadores de uma sala deste worker e avisa os demais. '''
+
+        self.__atualizar(sala, jogadores)
+        self.__avisar({'tipo': 'sala_ocupacao', 'sala': sala, 'jogadores': jogadores})
+
+    def remover_sala(self, sala):
+
+        ''' remover_sala(self, sala)
+        Objetivo: Remove uma sala deste worker do registro e avisa os demais. '''
+
+        self.__remover(sala)
+        self.__avisar({'tipo': 'sala_removida', 'sala': sala})
+
+    def ocupacao(self):
+
+        ''' ocupacao(self)
+        Objetivo: Retorna a lista de pares (nome da sala, quantidade de jogadores) das salas de todos os workers. '''
+
+        return [(sala, jogadores) for sala, (dono, jogadores) in self.__salas.items()]
+
+    def __registrar(self, sala, dono, jogadores):
+        self.__salas.put(sala, (dono, jogadores))
+        self.versao_salas = next(self.__versoes)
+
+    def __atualizar(self, sala, jogadores):
+        # só altera salas conhecidas: um aviso atrasado não recria uma sala já removida
+        self.__salas.compute(sala, lambda sala, valor: None if valor == None else (valor[0], jogadores))
+        self.versao_salas = next(self.__versoes)
+
+    def __remover(self, sala):
+        # remove a sala se ela existir, sem disputa entre verificar e remover
+        self.__salas.compute(sala, lambda sala, valor: None)
+        self.versao_salas = next(self.__versoes)
+
+    def __avisar(self, aviso):
+        mensagem = json.dumps(aviso).encode('utf8')
+        if len(mensagem) > TAMANHO_MAXIMO_AVISO:
+            print(f"Aviso {aviso['tipo']} não enviado: mensagem de {len(mensagem)} bytes excede {TAMANHO_MAXIMO_AVISO}.")
+            return
+        for indice, caminho in enumerate(self.__caminhos):
+            if indice != self.indice:
+                self.__canal.sendto(mensagem, caminho)
+
+    def __escutar(self):
+
+        ''' __escutar(self)
+        Objetivo: Laço que recebe os clientes repassados e os avisos de salas enviados pelos outros workers. '''
+
+        while True:
+            mensagem, fds, flags, _ = socket.recv_fds(self.__canal, TAMANHO_MAXIMO_AVISO, 1)
+            if flags & (socket.MSG_TRUNC | socket.MSG_CTRUNC):
+                # mensagem maior que o limite (os remetentes já verificam): é descartada, com o descritor que trouxer
+                for fd in fds:
+                    os.close(fd)
+                continue
+            aviso = json.loads(mensagem.decode('utf8'))
+            if aviso['tipo'] == 'cliente':
+                cliente_socket = socket.socket(fileno=fds[0])
+                self.__adotar_cliente(cliente_socket, aviso['nickname'], tuple(aviso['comando']),
+                                      bytes.fromhex(aviso['pendentes']), aviso['codec'])
+            elif aviso['tipo'] == 'sala_criada':
+                self.__registrar(aviso['sala'], aviso['dono'], aviso['jogadores'])
+            elif aviso['tipo'] == 'sala_ocupacao':
+                self.__atualizar(aviso['sala'], aviso['jogadores'])
+            elif aviso['tipo'] == 'sala_removida':
+                self.__remover(aviso['sala'])
+
+
+def iniciar_workers(total, executar_servidor, *args):
+
+    ''' iniciar_workers(total, executar_servidor, *args)
+    Objetivo: Cria (fork) os processos do servidor e aguarda o término deles.
+    Parâmetros de Entrada: total (int: número de workers), executar_servidor (função chamada em cada worker como
+    executar_servidor(*args, registro=registro)), args (argumentos repassados a executar_servidor).
+    Descrição: Os canais unix de todos os workers são criados antes do fork, para que um worker possa repassar clientes
+    a outro desde o primeiro instante. '''
+
+    diretorio = tempfile.mkdtemp(prefix='forca-')
+    caminhos = [os.path.join(diretorio, f'worker{i}.sock') for i in range(total)]
+    canais = []
+    for caminho in caminhos:
+        canal = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        canal.bind(caminho)
+        canais.append(canal)
+
+    contexto = multiprocessing.get_context('fork')
+    processos = [contexto.Process(target=_executar_worker, args=(i, caminhos, canais, executar_servidor, args),
+                                  daemon=True)
+                 for i in range(total)]
+    try:
+        for processo in processos:
+            processo.start()
+        print(f"{total} workers escutando na mesma porta.")
+        for processo in processos:
+            processo.join()
+    except KeyboardInterrupt:
+        for processo in processos:
+            processo.terminate()
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+
+def _executar_worker(indice, caminhos, canais, executar_servidor, args):
+    for i, canal in enumerate(canais):
+        if i != indice:
+            canal.close()
+    registro = RegistroSalas(indice, caminhos, canais[indice])
+    executar_servidor(*args, registro=registro)
@@ -0,0 +1,477 @@
+''' Protocolo de mensagens entre o cliente e o servidor.
+
+    Cada mensagem é enviada em um quadro: um cabeçalho de 4 bytes (big-endian) com o tamanho da mensagem, seguido
+    pela mensagem codificada. Como o TCP não preserva os limites de cada send, um recv pode trazer só parte
+    de uma mensagem ou várias mensagens juntas; o LeitorQuadros acumula os bytes recebidos e só devolve mensagens
+    completas, guardando o restante para a próxima leitura.
+
+    Dentro do programa uma mensagem é uma tupla com o nome do comando seguido dos argumentos, por exemplo
+    ('entrar_na_sala', 'sala 1'), ('status', '200') ou ('menu',). Ela pode ser codificada de duas formas:
+
+    - CodecTexto: o formato original, com o comando e os argumentos separados por vírgula em UTF-8
+      (entrar_na_sala,sala 1). As respostas do servidor continuam sendo as strings de antes ('200', 'menu',
+      'tema,...', 'Jogo encerrado'). É o formato usado por padrão, para os clientes antigos.
+    - CodecBinario: um byte com o código do comando, seguido de cada argumento com o tamanho em varint e o texto em
+      UTF-8. Os status ('200', '401', '402', '404') viram um único byte. Como os argumentos não são separados por
+      vírgula, nicknames e nomes de sala podem conter vírgulas.
+
+    O cliente pede o formato binário enviando, em texto, a mensagem protocolo,binario logo após conectar; o servidor
+    responde 200 (ainda em texto) e, a partir daí, os dois lados usam o CodecBinario.
+
+    As mensagens enviadas a vários clientes (difundir) são codificadas uma única vez por formato e o mesmo quadro é colocado
+    na fila de envio de cada conexão. Uma resposta repetida muitas vezes (como a lista de salas) pode ser guardada como
+    MensagemCodificada, que mantém o quadro já codificado de cada formato e é enviada com enviar_mensagem. A fila de cada conexão tem um limite de bytes (LIMITE_FILA_ENVIO): um cliente que
+    não lê o que recebe é marcado como lento e desconectado, em vez de bloquear o envio para os demais.
+'''
+import collections
+import select
+import socket
+import struct
+import threading
+
+CABECALHO = struct.Struct('!I')
+TAMANHO_MAXIMO = 1 << 20
+TAMANHO_LEITURA = 65536
+LIMITE_FILA_ENVIO = 256 * 1024
+# de quanto em quanto tempo (s) Conexao.aguardar_fim confere se deve parar de vigiar a conexão
+INTERVALO_VIGIA = 0.5
+PEDIDO_BINARIO = ('protocolo', 'binario')
+
+COMANDOS = ['nickname', 'criar_sala', 'entrar_na_sala', 'jogador_pronto', 'salas_disponiveis', 'chutar_palavra',
+            'digitar_letra', 'tema', 'status', 'texto', 'salas', 'menu', 'jogo_encerrado', 'protocolo']
+CODIGOS_COMANDOS = {comando: codigo for codigo, comando in enumerate(COMANDOS)}
+STATUS = ['200', '401', '402', '404']
+CODIGOS_STATUS = {status: codigo for codigo, status in enumerate(STATUS)}
+
+
+class ProtocoloException(Exception):
+    """Classe de exceção lançada quando um quadro inválido é recebido.
+    """
+    def __init__(self, msg):
+        """ Construtor padrão da classe, que recebe uma mensagem que se deseja
+            embutir na exceção
+        """
+        super().__init__(msg)
+
+
+def quadro(dados):
+    ''' Retorna os bytes do quadro (cabeçalho de tamanho + dados) correspondente a uma mensagem já codificada. '''
+    return CABECALHO.pack(len(dados)) + dados
+
+
+class CodecTexto:
+
+    ''' Classe CodecTexto
+
+        Codifica as mensagens no formato de texto original, separado por vírgulas. Ao decodificar, apenas a primeira
+        vírgula separa o comando do argumento; uma resposta sem vírgula (como o tema escolhido) vira uma tupla de um
+        único elemento. '''
+
+    nome = 'texto'
+
+    def codificar(self, mensagem):
+        comando = mensagem[0]
+        if comando in ('status', 'texto'):
+            texto = mensagem[1]
+        elif comando == 'salas':
+            # numa página de salas ('salas', texto, cursor) o cursor vira a última linha do texto
+            texto = ''.join(mensagem[1:])
+        elif comando == 'jogo_encerrado':
+            texto = 'Jogo encerrado'
+        else:
+            texto = ','.join(mensagem)
+        return texto.encode('utf8')
+
+    def decodificar(self, dados):
+        try:
+            return tuple(dados.decode('utf8').split(',', 1))
+        except UnicodeDecodeError:
+            raise ProtocoloException('Mensagem de texto com UTF-8 inválido')
+
+
+class CodecBinario:
+
+    ''' Classe CodecBinario
+
+        Codifica as mensagens em binário: um byte com o código do comando (posição em COMANDOS) seguido dos argumentos,
+        cada um com o tamanho em varint e o texto em UTF-8. O argumento de ('status', codigo) é um único byte com a
+        posição do código em STATUS. '''
+
+    nome = 'binario'
+
+    def codificar(self, mensagem):
+        try:
+            dados = bytearray((CODIGOS_COMANDOS[mensagem[0]],))
+            if mensagem[0] == 'status':
+                dados.append(CODIGOS_STATUS[mensagem[1]])
+                return bytes(dados)
+        except KeyError as ke:
+            raise ProtocoloException(f'Não há código binário para {ke}')
+        for argumento in mensagem[1:]:
+            texto = argumento.encode('utf8')
+            tamanho = len(texto)
+            while tamanho >= 0x80:
+                dados.append((tamanho & 0x7f) | 0x80)
+                tamanho >>= 7
+            dados.append(tamanho)
+            dados += texto
+        return bytes(dados)
+
+    def decodificar(self, dados):
+        try:
+            comando = COMANDOS[dados[0]]
+            if comando == 'status':
+                return (comando, STATUS[dados[1]])
+        except IndexError:
+            raise ProtocoloException('Mensagem binária com código desconhecido')
+        mensagem = [comando]
+        posicao = 1
+        while posicao < len(dados):
+            tamanho = deslocamento = 0
+            while True:
+                if posicao >= len(dados):
+                    raise ProtocoloException('Mensagem binária truncada')
+                byte = dados[posicao]
+                posicao += 1
+                tamanho |= (byte & 0x7f) << deslocamento
+                deslocamento += 7
+                if byte < 0x80:
+                    break
+            if posicao + tamanho > len(dados):
+                raise ProtocoloException('Mensagem binária truncada')
+            try:
+                mensagem.append(dados[posicao:posicao + tamanho].decode('utf8'))
+            except UnicodeDecodeError:
+                raise ProtocoloException('Mensagem binária com UTF-8 inválido')
+            posicao += tamanho
+        return tuple(mensagem)
+
+
+CODECS = {CodecTexto.nome: CodecTexto(), CodecBinario.nome: CodecBinario()}
+
+
+class MensagemCodificada(tuple):
+
+    ''' Classe MensagemCodificada
+
+        Mensagem (tupla com o comando seguido dos argumentos) que guarda o quadro de cada formato na primeira vez em que é
+        codificada. Deve ser tratada como imutável: é compartilhada entre conexões e threads, que enviam os mesmos bytes
+        sem codificá-la de novo. Como é uma tupla, pode ser comparada com as mensagens comuns. '''
+
+    def __new__(cls, *mensagem):
+        instancia = super().__new__(cls, mensagem)
+        instancia.quadros = {}
+        return instancia
+
+    def quadro(self, codec):
+
+        ''' quadro(self, codec)
+        Objetivo: Retorna o quadro da mensagem no formato do codec, codificando-a apenas na primeira vez. '''
+
+        dados = self.quadros.get(codec.nome)
+        if dados == None:
+            # duas threads podem codificar ao mesmo tempo; as duas geram os mesmos bytes
+            dados = self.quadros[codec.nome] = quadro(codec.codificar(self))
+        return dados
+
+
+def enviar_mensagem(conexao, mensagem):
+
+    ''' enviar_mensagem(conexao, mensagem)
+    Objetivo: Envia uma mensagem para uma conexão, reaproveitando o quadro já codificado se ela for uma MensagemCodificada.
+    Retorna: False se a conexão foi descartada por estar lenta. '''
+
+    if isinstance(mensagem, MensagemCodificada):
+        return conexao.enviar_quadro(mensagem.quadro(conexao.codec))
+    return conexao.enviar(*mensagem)
+
+
+def difundir(mensagem, conexoes):
+
+    ''' difundir(mensagem, conexoes)
+    Objetivo: Envia a mesma mensagem para várias conexões.
+    Parâmetros de Entrada: mensagem (tupla: comando seguido dos argumentos), conexoes (Conexao ou ConexaoAsync dos clientes).
+    Descrição: A mensagem é codificada uma única vez para cada formato em uso e o mesmo quadro é colocado na fila de envio
+    de cada conexão, sem esperar que ele seja escrito no socket; assim um cliente lento não atrasa os demais.
+    Retorna: a lista das conexões descartadas por estarem lentas (fila de envio cheia) ou fechadas. '''
+
+    if not isinstance(mensagem, MensagemCodificada):
+        mensagem = MensagemCodificada(*mensagem)
+    descartadas = []
+    for conexao in conexoes:
+        if not conexao.enviar_quadro(mensagem.quadro(conexao.codec)):
+            descartadas.append(conexao)
+    return descartadas
+
+
+class LeitorQuadros:
+
+    ''' Classe LeitorQuadros
+
+        Separa as mensagens de um fluxo de bytes. Não lê nem escreve em sockets: quem o usa entrega os bytes recebidos
+        com alimentar() e retira as mensagens completas com proxima(), o que permite usá-lo tanto com sockets bloqueantes
+        quanto com o asyncio.
+
+        Atributos:
+        buffer: bytes recebidos que ainda não formam uma mensagem completa. '''
+
+    def __init__(self, pendentes=b''):
+        self.__buffer = bytearray(pendentes)
+
+    def alimentar(self, dados):
+
+        ''' alimentar(self, dados)
+        Objetivo: Acrescenta ao buffer os bytes recebidos do socket. '''
+
+        self.__buffer += dados
+
+    def proxima(self):
+
+        ''' proxima(self)
+        Objetivo: Retira do buffer a próxima mensagem completa.
+        Retorna: os bytes da mensagem ou None se ainda não chegaram todos os bytes dela.
+        Raises:
+            ProtocoloException: se o tamanho anunciado no cabeçalho for maior que TAMANHO_MAXIMO. '''
+
+        if len(self.__buffer) < CABECALHO.size:
+            return None
+        tamanho, = CABECALHO.unpack_from(self.__buffer)
+        if tamanho > TAMANHO_MAXIMO:
+            raise ProtocoloException(f'Mensagem de {tamanho} bytes excede o limite de {TAMANHO_MAXIMO} bytes')
+        fim = CABECALHO.size + tamanho
+        if len(self.__buffer) < fim:
+            return None
+        mensagem = bytes(self.__buffer[CABECALHO.size:fim])
+        del self.__buffer[:fim]
+        return mensagem
+
+    def pendentes(self):
+
+        ''' pendentes(self)
+        Objetivo: Retorna os bytes já recebidos que ainda não foram entregues como mensagem. '''
+
+        return bytes(self.__buffer)
+
+
+class Conexao:
+
+    ''' Classe Conexao
+
+        Envia e recebe mensagens em quadros por um socket bloqueante. É usada pelo cliente e, no lugar do socket, pelo
+        Server (modo threads) e pelo Jogo, que compartilham o mesmo leitor; assim nenhum byte recebido a mais no lobby
+        se perde quando a conexão passa para o jogo.
+
+        O envio não bloqueia quem chama: o quadro é escrito direto no socket enquanto houver espaço no buffer do kernel e,
+        quando não houver, o restante vai para a fila de envio, esvaziada por uma thread de escrita que só existe enquanto
+        a fila tem dados.
+
+        Atributos:
+        socket: socket TCP da conexão.
+        leitor: LeitorQuadros com os bytes recebidos e ainda não consumidos.
+        codec: CodecTexto ou CodecBinario, conforme o formato negociado com o outro lado.
+        fila_envio: quadros (ou o restante deles) ainda não escritos no socket.
+        bytes_na_fila: total de bytes em fila_envio.
+        limite_envio: máximo de bytes em fila_envio antes de a conexão ser considerada lenta.
+        lenta: True se a conexão foi descartada por não ler o que recebe (ou por erro ao escrever).
+        semaphore_envio: protege a fila de envio, que é usada por threads diferentes.
+        semaphore_leitura: protege o socket e o leitor durante uma leitura, para que aguardar_fim (na thread do lobby) e
+        receber (na thread do jogo) nunca leiam ao mesmo tempo. '''
+
+    def __init__(self, sock, pendentes=b'', codec=CodecTexto.nome, limite_envio=LIMITE_FILA_ENVIO):
+        self.__socket = sock
+        self.__leitor = LeitorQuadros(pendentes)
+        self.codec = CODECS[codec]
+        self.__fila_envio = collections.deque()
+        self.__bytes_na_fila = 0
+        self.__escrevendo = False
+        self.__fechar = False
+        self.limite_envio = limite_envio
+        self.lenta = False
+        self.__semaphore_envio = threading.Semaphore(1)
+        self.__semaphore_leitura = threading.Semaphore(1)
+
+    def enviar(self, *mensagem):
+
+        ''' enviar(self, *mensagem)
+        Objetivo: Codifica a mensagem (comando seguido dos argumentos) e a envia em um quadro.
+        Retorna: False se a conexão foi descartada por estar lenta. '''
+
+        return self.enviar_quadro(quadro(self.codec.codificar(mensagem)))
+
+    def enviar_quadro(self, dados):
+
+        ''' enviar_quadro(self, dados)
+        Objetivo: Envia um quadro já codificado, sem esperar que o cliente o leia.
+        Parâmetros de Entrada: dados (bytes: quadro gerado por quadro(), que pode ser compartilhado entre várias conexões).
+        Descrição: Com a fila vazia, tenta escrever o quadro direto no socket (MSG_DONTWAIT); o que não couber vai para a
+        fila de envio. Se a fila passar de limite_envio, a conexão é marcada como lenta e encerrada.
+        Retorna: False se a conexão foi descartada. '''
+
+        self.__semaphore_envio.acquire()
+        try:
+            if self.lenta:
+                return False
+            if not self.__escrevendo:
+                try:
+                    enviados = self.__socket.send(dados, socket.MSG_DONTWAIT)
+                except BlockingIOError:
+                    enviados = 0
+                except OSError:
+                    self.__descartar()
+                    return False
+                if enviados == len(dados):
+                    return True
+                dados = memoryview(dados)[enviados:]
+            if self.__bytes_na_fila + len(dados) > self.limite_envio:
+                self.__descartar()
+                return False
+            self.__fila_envio.append(dados)
+            self.__bytes_na_fila += len(dados)
+            if not self.__escrevendo:
+                self.__escrevendo = True
+                threading.Thread(target=self.__escrever, daemon=True).start()
+            return True
+        finally:
+            self.__semaphore_envio.release()
+
+    def __escrever(self):
+
+        ''' __escrever(self)
+        Objetivo: Thread de escrita que esvazia a fila de envio e termina quando ela fica vazia ou o envio falha; nos dois
+        casos, se close() foi chamado enquanto ela escrevia, é ela que fecha o socket. '''
+
+        while True:
+            self.__semaphore_envio.acquire()
+            if not self.__fila_envio:
+                self.__escrevendo = False
+                if self.__fechar:
+                    self.__socket.close()
+                self.__semaphore_envio.release()
+                return
+            dados = self.__fila_envio[0]
+            self.__semaphore_envio.release()
+            try:
+                self.__socket.sendall(dados)
+            except OSError:
+                self.__semaphore_envio.acquire()
+                self.__descartar()
+                self.__escrevendo = False
+                if self.__fechar:
+                    # close() deixou o fechamento para esta thread
+                    self.__socket.close()
+                self.__semaphore_envio.release()
+                return
+            self.__semaphore_envio.acquire()
+            if self.__fila_envio:
+                self.__fila_envio.popleft()
+                self.__bytes_na_fila -= len(dados)
+            self.__semaphore_envio.release()
+
+    def __descartar(self):
+
+        ''' __descartar(self)
+        Objetivo: Marca a conexão como lenta, esvazia a fila de envio e encerra o socket nos dois sentidos, para que quem
+        estiver esperando em receber() receba o fim da conexão. Deve ser chamado com semaphore_envio adquirido. '''
+
+        self.lenta = True
+        self.__fila_envio.clear()
+        self.__bytes_na_fila = 0
+        try:
+            self.__socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def receber(self):
+
+        ''' receber(self)
+        Objetivo: Recebe a próxima mensagem, lendo do socket quantas vezes for necessário.
+        Descrição: Se o outro lado pedir o formato binário (PEDIDO_BINARIO), responde 200 e passa a usar o CodecBinario.
+        Retorna: a tupla da mensagem recebida ou uma tupla vazia se a conexão foi encerrada pelo outro lado. '''
+
+        self.__semaphore_leitura.acquire()
+        try:
+            while True:
+                dados = self.__leitor.proxima()
+                if dados == None:
+                    dados = self.__socket.recv(TAMANHO_LEITURA)
+                    if not dados:
+                        return ()
+                    self.__leitor.alimentar(dados)
+                    continue
+                mensagem = self.codec.decodificar(dados)
+                if mensagem == PEDIDO_BINARIO and self.codec.nome == CodecTexto.nome:
+                    self.enviar('status', '200')
+                    self.codec = CODECS[CodecBinario.nome]
+                    continue
+                return mensagem
+        finally:
+            self.__semaphore_leitura.release()
+
+    def aguardar_fim(self, parar):
+
+        ''' aguardar_fim(self, parar)
+        Objetivo: Vigia a conexão de um jogador que está pronto e aguarda os demais, para perceber se ele desconectar.
+        Parâmetros de Entrada: parar (função sem argumentos: retorna True quando a vigia deve terminar, por exemplo quando a partida começou).
+        Descrição: Espera o socket ficar legível (select, conferindo parar a cada INTERVALO_VIGIA segundos) e lê sem
+        bloquear; os bytes recebidos vão para o leitor e serão devolvidos pelo próximo receber. Se outra thread estiver em
+        receber (o jogo começou a ler a conexão), a vigia termina sem ler nada.
+        Retorna: True se o outro lado encerrou a conexão (ou ela falhou), False se a vigia terminou por parar() ou por receber. '''
+
+        while not parar():
+            try:
+                legivel = select.select([self.__socket], [], [], INTERVALO_VIGIA)[0]
+            except (OSError, ValueError):
+                # o socket foi fechado por outra thread
+                return True
+            if not legivel:
+                continue
+            if not self.__semaphore_leitura.acquire(blocking=False):
+                return False
+            try:
+                dados = self.__socket.recv(TAMANHO_LEITURA, socket.MSG_DONTWAIT)
+                if not dados:
+                    return True
+                self.__leitor.alimentar(dados)
+            except BlockingIOError:
+                pass
+            except OSError:
+                return True
+            finally:
+                self.__semaphore_leitura.release()
+        return False
+
+    def negociar_binario(self):
+
+        ''' negociar_binario(self)
+        Objetivo: Pede ao servidor o formato binário e passa a usá-lo se ele aceitar.
+        Retorna: True se o formato binário foi aceito. '''
+
+        self.enviar(*PEDIDO_BINARIO)
+        # a resposta ainda vem no formato texto, em que o status é apenas '200'
+        if self.receber() == ('200',):
+            self.codec = CODECS[CodecBinario.nome]
+            return True
+        return False
+
+    def pendentes(self):
+
+        ''' pendentes(self)
+        Objetivo: Retorna os bytes recebidos e ainda não consumidos, usados ao repassar o cliente para outro worker. '''
+
+        return self.__leitor.pendentes()
+
+    def fileno(self):
+        return self.__socket.fileno()
+
+    def close(self):
+
+        ''' close(self)
+        Objetivo: Fecha o socket; se ainda houver quadros na fila de envio, ele é fechado pela thread de escrita depois
+        de enviá-los. '''
+
+        self.__semaphore_envio.acquire()
+        if self.__escrevendo:
+            self.__fechar = True
+        else:
+            self.__socket.close()
+        self.__semaphore_envio.release()
@@ -0,0 +1,86 @@
+import bisect
+from protocolo import MensagemCodificada
+
+JOGADORES_POR_SALA = 3
+# quantidade de salas por página quando o cliente não informa um limite válido, e o máximo aceito
+LIMITE_PAGINA_SALAS = 50
+LIMITE_PAGINA_MAXIMO = 500
+
+
+class RetratoSalas:
+
+    ''' Classe RetratoSalas
+
+        Retrato imutável da lista de salas, usado para responder salas_disponiveis. É criado apenas quando as salas mudam
+        (criação, entrada, saída ou fim de uma sala) e depois compartilhado por todas as consultas: quem consulta não
+        percorre as salas, não monta a string de novo e não adquire nenhuma trava, apenas envia a resposta já codificada.
+        Quando as salas mudam, um retrato novo substitui o antigo (copy-on-write); quem já tinha o antigo continua usando-o.
+
+        A resposta lista cada sala com a sua ocupação, para que o cliente saiba quais têm vaga sem outra consulta. O texto não
+        tem vírgulas antes dos nomes das salas, pois no formato texto a primeira vírgula separa o comando do argumento.
+
+        Como as salas ficam ordenadas pelo nome, o retrato também responde salas_disponiveis paginado (pagina): o cursor é o
+        nome da última sala da página anterior e a próxima página começa na primeira sala depois dele (busca binária). Assim o
+        custo de cada página depende apenas do limite, e salas criadas ou removidas entre duas páginas não fazem uma sala
+        que continua existindo ser repetida ou pulada. A resposta completa (sem cursor) só é montada na primeira vez em que
+        é pedida.
+
+        Atributos:
+        versao: versão das salas a partir da qual o retrato foi criado.
+        salas: tupla ordenada de pares (nome da sala, quantidade de jogadores).
+        nomes: tupla ordenada com os nomes das salas, usada na busca do cursor.
+        jogadores: total de jogadores nas salas.
+        completa: MensagemCodificada com a resposta completa de salas_disponiveis, criada na primeira consulta. '''
+
+    __slots__ = ('versao', 'salas', 'nomes', 'jogadores', 'completa')
+
+    def __init__(self, versao, salas):
+        self.versao = versao
+        self.salas = tuple(sorted(salas))
+        self.nomes = tuple(nome for nome, _ in self.salas)
+        self.jogadores = sum(jogadores for _, jogadores in self.salas)
+        self.completa = None
+
+    def __len__(self):
+        return len(self.salas)
+
+    def __cabecalho(self):
+        return f'{len(self.salas)} sala(s) e {self.jogadores} jogador(es)\n'
+
+    def __linha(self, nome, jogadores):
+        lotada = ' lotada' if jogadores >= JOGADORES_POR_SALA else ''
+        return f'-  {nome} ({jogadores}/{JOGADORES_POR_SALA}{lotada})\n'
+
+    @property
+    def resposta(self):
+
+        ''' resposta
+        Objetivo: Retorna a resposta completa de salas_disponiveis (('salas', texto) ou ('status', '404') sem salas).
+        Descrição: Montada uma única vez por retrato; duas threads podem montá-la ao mesmo tempo, com o mesmo resultado. '''
+
+        if self.completa == None:
+            if len(self.salas) == 0:
+                self.completa = MensagemCodificada('status', '404')
+            else:
+                linhas = [self.__cabecalho()]
+                linhas.extend(self.__linha(nome, jogadores) for nome, jogadores in self.salas)
+                self.completa = MensagemCodificada('salas', ''.join(linhas))
+        return self.completa
+
+    def pagina(self, cursor='', limite=LIMITE_PAGINA_SALAS):
+
+        ''' pagina(self, cursor='', limite=LIMITE_PAGINA_SALAS)
+        Objetivo: Retorna uma página da lista de salas.
+        Parâmetros de Entrada: cursor (string: cursor retornado pela página anterior, ou vazio para a primeira página), limite (int: quantidade máxima de salas na página, entre 1 e LIMITE_PAGINA_MAXIMO).
+        Descrição: Retorna ('salas', texto, proximo_cursor), em que o texto tem o total de salas e jogadores e as salas da
+        página, e proximo_cursor é vazio na última página. Sem nenhuma sala, retorna ('status', '404'). '''
+
+        if len(self.salas) == 0:
+            return MensagemCodificada('status', '404')
+        limite = min(max(limite, 1), LIMITE_PAGINA_MAXIMO)
+        inicio = bisect.bisect_right(self.nomes, cursor) if cursor else 0
+        fim = min(inicio + limite, len(self.salas))
+        linhas = [self.__cabecalho()]
+        linhas.extend(self.__linha(nome, jogadores) for nome, jogadores in self.salas[inicio:fim])
+        proximo = self.nomes[fim - 1] if fim < len(self.salas) else ''
+        return ('salas', ''.join(linhas), proximo)
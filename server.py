@@ -1,310 +1,549 @@
-import socket
-import threading
-from hashtable import *
-from lista_circular import *
-from jogo import Jogo
-import sys
-import time
-
-class Server():
-    
-    ''' Classe Server
-
-        A classe Server é responsável por gerenciar as salas do jogo e contralar a entrada em regiões crítica. Ela possui os seguintes atributos:
-
-        salas: uma Hashtable encadeada que armazena a como chave a sala criada pelo usuário e valor o socket correspondente ao usúario.
-        nickname_list: uma Hashtable encadeada que armazena a como chave o socket do usuário e  o valor é o nick escolhido pelo jogador.
-        salas: uma Hashtable encadeada que serve como uma cópia da hashtable de salas, mas ela só adiciona os jogadores se eles estiveream prontos para iniciar a partida, permitindo que o jogo da sala só inicie se todos os cliente derem permissão.
-        respectivos semaphoros para tratar cada estrutura de dados.
-        semaphore_salas: Semaphore para controle de acesso às salas.
-        Semaphore_nickname: Semaphore para controle de acesso à lista de nicknames.
-        semaphore_jogadores_prontos: Semaphore para controle de acesso à lista de jogadores prontos.
-
-        Métodos:
-        - iniciar_servidor(HOST, PORT): Inicia o servidor, aguardando conexões.
-        - comunicacao_cliente(cliente_socket, cliente_address): Gerencia a comunicação com o cliente.
-        - comandos(cliente_socket): Processa comandos recebidos do cliente.
-        - nickname(cliente_socket, nickname): Associa o nickname ao cliente.
-        - jogador_pronto(cliente_socket, sala): Gerencia o status do jogador, indicando prontidão para iniciar o jogo.
-        - iniciar_jogo_todos_prontos(sala): Verifica se todos os jogadores de uma sala estão prontos para iniciar o jogo.
-        - jogo(lista_jogadores, chave): Inicia o jogo para a lista de jogadores em uma sala específica.
-        - __enviar_msg_cliente(mensagem, cliente_socket): Envia mensagem para um cliente específico.
-        - __receber_msg_cliente(cliente_socket): Recebe mensagem de um cliente específico.
-        - __enviar_msg_cliente_broadcast(mensagem, lista_jogadores): Envia mensagem para uma lista de clientes.
-        - mostrar_salas_disponiveis(): Mostra as salas disponíveis.
-        - __criar_sala(cliente_socket, nome_sala): Cria uma nova sala.
-        - __entrar_na_sala(sala, cliente_socket): Permite um cliente entrar em uma sala existente.
-    '''
-    
-    def __init__(self):
-        
-        '''  __init__(self)
-        Objetivo: Método construtor da classe Server.
-        Parâmetros de Entrada: self (referência à própria instância).
-        Descrição: Inicializa os semáforos para controlar o acesso a diferentes partes críticas do servidor (semaphore_salas, semaphore_nickname, semaphore_jogadores_prontos). Também inicializa três estruturas de dados (Hashtable) para armazenar salas, nicknames e jogadores prontos. '''
-        
-        self.semaphore_salas = threading.Semaphore(1)
-        self.semaphore_nickname = threading.Semaphore(1)
-        self.semaphore_jogadores_prontos = threading.Semaphore(1)
-        self.salas = HashTable()
-        self.nickname_list = HashTable()
-        self.jogadores_prontos = HashTable()
-
-    def iniciar_servidor(self, HOST, PORT):
-        
-        '''  iniciar_servidor(self, HOST, PORT)
-        Objetivo: Inicia o servidor para escutar conexões de clientes.
-        Parâmetros de Entrada: self (referência à própria instância), HOST (string: endereço IP do servidor), PORT (int: número da porta).
-        Descrição: Configura um socket de escuta para aguardar conexões de clientes. O método aceita as conexões dos clientes e inicia threads para lidar com cada cliente conectado. '''
-        
-        try:
-            server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            orig = (HOST, PORT)
-
-            server.bind(orig)
-            server.listen()
-
-            print("Aguardando conexões...")
-
-            while True:
-                cliente_socket, cliente_address = server.accept()
-                cliente_thread = threading.Thread(target=self.comunicacao_cliente, args=(cliente_socket, cliente_address))
-                cliente_thread.start()
-        except OSError as e:
-            print(f"Erro ao iniciar o servidor: {e}")
-            sys.exit(1)
-    
-
-    def comunicacao_cliente(self, cliente_socket, cliente_address):
-        
-        ''' comunicacao_cliente(self, cliente_socket, cliente_address)
-        Objetivo: Lida com a comunicação com o cliente.
-        Parâmetros de Entrada: self (referência à própria instância), cliente_socket (socket do cliente), cliente_address (endereço IP e porta do cliente).
-        Descrição: Gerencia a comunicação entre o servidor e um cliente específico, chamando o método comandos para interpretar e executar os comandos enviados pelo cliente.'''
-        
-        print(f"Cliente conectado: {cliente_address}")
-        self.comandos(cliente_socket)
-    
-    def comandos(self, cliente_socket):
-        
-        ''' comandos(self, cliente_socket)
-        Objetivo: Interpreta e executa os comandos recebidos do cliente.
-        Parâmetros de Entrada: self (referência à própria instância), cliente_socket (socket do cliente).
-        Descrição: Recebe comandos do cliente, os interpreta e os direciona para os métodos correspondentes, como nickname, entrar_na_sala, jogador_pronto, criar_sala, ou salas_disponiveis. '''
-        
-        while True:
-            comando = self.__receber_msg_cliente(cliente_socket)
-            if ',' in comando:
-                comando = comando.split(',')
-                if comando[0] == 'nickname':
-                    self.nickname(cliente_socket, comando[1])
-                    continue
-                elif comando[0] == 'entrar_na_sala':
-                    entrar = self.__entrar_na_sala(comando[1], cliente_socket)
-                    self.__enviar_msg_cliente(entrar, cliente_socket)
-                    continue
-
-                elif comando[0] == 'jogador_pronto':
-                    for chave, valor in self.salas.items():
-                        for socket in valor:
-                            if socket == cliente_socket:
-                                resp = self.jogador_pronto(cliente_socket, chave)
-                                if resp == '200':
-                                    self.__enviar_msg_cliente(resp, cliente_socket)
-                                else:
-                                    self.__enviar_msg_cliente('200', cliente_socket)
-                                    self.jogo(resp, chave)
-                                        
-                    break
-                                
-                
-                elif comando[0] == 'criar_sala':
-                    nome_sala = comando[1]
-                    resp = self.__criar_sala(cliente_socket, nome_sala)
-                    self.__enviar_msg_cliente(f"{resp}", cliente_socket)
-                    continue
-                    
-
-            else:
-                if comando == 'salas_disponiveis':
-                    resp = self.mostrar_salas_disponiveis()
-                    self.__enviar_msg_cliente(resp, cliente_socket)
-                    continue
-
-
-    def nickname(self, cliente_socket, nickname):
-        
-        ''' nickname(self, cliente_socket, nickname)
-        Objetivo: Armazena o nickname associado a um cliente.
-        Parâmetros de Entrada: self (referência à própria instância), cliente_socket (socket do cliente), nickname (string: nickname escolhido pelo cliente).
-        Descrição: Armazena o nickname escolhido pelo cliente em uma Hashtable, associando-o ao socket correspondente.'''
-        
-        self.semaphore_nickname.acquire()
-        self.nickname_list.put(cliente_socket, nickname)
-        self.semaphore_nickname.release()
-    
-    def jogador_pronto(self, cliente_socket, sala):
-        
-        ''' jogador_pronto(self, cliente_socket, sala)
-    Objetivo: Indica que um jogador está pronto para iniciar um jogo em uma sala específica.
-    Parâmetros de Entrada: self (referência à própria instância), cliente_socket (socket do cliente), sala (string: nome da sala).
-    Descrição: Marca o jogador como pronto para iniciar o jogo na sala específica, armazenando os jogadores prontos NA HASHTABLE '''
-        
-        self.semaphore_jogadores_prontos.acquire()
-        lista = self.salas.get(f'{sala}')
-        chaves = self.jogadores_prontos.keys()
-        if (f'{sala}') in chaves:
-            lista = self.jogadores_prontos.get(f'{sala}')
-            lista.append(cliente_socket)
-            self.jogadores_prontos.put(f'{sala}', lista)
-            self.semaphore_jogadores_prontos.release()
-            rsp = self.iniciar_jogo_todos_prontos(sala)
-            if rsp == '200ok':
-                return lista
-            else:
-                return '200'
-        else:
-            self.jogadores_prontos.put(f'{sala}', [cliente_socket])
-            self.semaphore_jogadores_prontos.release()
-            return '200'
-
-    def iniciar_jogo_todos_prontos(self, sala):
-        
-        ''' iniciar_jogo_todos_prontos(self, sala)
-        Objetivo: Verifica se todos os jogadores em uma sala estão prontos para iniciar o jogo.
-        Parâmetros de Entrada: self (referência à própria instância), sala (string: nome da sala).
-        Descrição: Verifica se o número de jogadores prontos na sala atingiu o número necessário para iniciar o jogo.'''
-        
-        while True:
-            if len(self.jogadores_prontos.get(f'{sala}')) == 3:
-                return '200ok'
-            else: return '200'
-    
-
-    def jogo(self, lista_jogadores, chave):
-        
-        ''' Objetivo: Inicia o jogo para uma lista de jogadores em uma sala específica.
-        Parâmetros de Entrada: self (referência à própria instância), lista_jogadores (lista de sockets de jogadores), chave (string: chave para identificar a sala).
-        Descrição: Inicia o jogo para os jogadores da lista especificada na sala correspondente e remove a sala das estruturas de dados após o jogo ser iniciado.'''
-        
-        jogo = Jogo()
-        parametro, ganhador = jogo._iniciar_jogo(lista_jogadores)
-        if parametro == 'Jogo_encerrado' and ganhador != 'nenhum':
-            nick_ganhador = self.nickname_list.get(ganhador)
-            self.__enviar_msg_cliente_broadcast(f'\nO jogador {nick_ganhador} acertou a palavra.', lista_jogadores)
-            time.sleep(2)
-            self.__enviar_msg_cliente_broadcast("Jogo encerrado", lista_jogadores)
-            self.semaphore_salas.acquire()
-            self.salas.remove(chave)
-            self.semaphore_salas.release()
-            self.semaphore_jogadores_prontos.acquire()
-            self.jogadores_prontos.remove(chave)
-            self.semaphore_jogadores_prontos.release()
-        else:
-            self.__enviar_msg_cliente_broadcast(f'\nVocê perdeu! A palavra era "..."', lista_jogadores)
-            time.sleep(2)
-            self.__enviar_msg_cliente_broadcast("Jogo encerrado", lista_jogadores)
-            self.semaphore_salas.acquire()
-            self.salas.remove(chave)
-            self.semaphore_salas.release()
-            self.semaphore_jogadores_prontos.acquire()
-            self.jogadores_prontos.remove(chave)
-            self.semaphore_jogadores_prontos.release()
-            
-        
-    
-    def __enviar_msg_cliente(self, mensagem, cliente_socket):
-        
-        ''' __enviar_msg_cliente(self, mensagem, cliente_socket)
-        Objetivo: Envia uma mensagem para um cliente específico.
-        Parâmetros de Entrada: self (referência à própria instância), mensagem (string: mensagem a ser enviada), cliente_socket (socket do cliente).
-        Descrição: Envia a mensagem fornecida para o cliente correspondente usando o socket.'''
-        
-        cliente_socket.send(mensagem.encode('utf8'))
-
-    def __receber_msg_cliente(self, cliente_socket):
-        
-        ''' __receber_msg_cliente(self, cliente_socket)
-        Objetivo: Recebe uma mensagem do cliente.
-        Parâmetros de Entrada: self (referência à própria instância), cliente_socket (socket do cliente).
-        Descrição: Recebe e decodifica uma mensagem enviada pelo cliente usando o socket especificado. '''
-        
-        msg = cliente_socket.recv(1024).decode('utf8')
-        return msg
-    
-    def __enviar_msg_cliente_broadcast(self, mensagem, lista_jogadores):
-        
-        ''' __enviar_msg_cliente_broadcast(self, mensagem, lista_jogadores)
-        Objetivo: Envia uma mensagem para todos os jogadores em uma lista.
-        Parâmetros de Entrada: self (referência à própria instância), mensagem (string: mensagem a ser enviada), lista_jogadores (lista de sockets dos jogadores).
-        Descrição: Envia a mensagem fornecida para todos os jogadores na lista usando seus respectivos sockets.'''
-        
-        for cliente in lista_jogadores:
-            self.__enviar_msg_cliente(mensagem, cliente)
-    
-
-    def mostrar_salas_disponiveis(self):
-        
-        ''' mostrar_salas_disponiveis(self)
-        Objetivo: Mostra as salas disponíveis para os clientes.
-        Parâmetros de Entrada: self (referência à própria instância).
-        Descrição: Retorna uma string contendo a lista das salas disponíveis para os clientes.'''
-        
-        self.semaphore_salas.acquire()
-        salas = self.salas.keys()
-        self.semaphore_salas.release()
-        if len(salas) == 0:
-            return "404"
-        else:
-            salas_str = ''
-            for sala in salas:
-                salas_str += (f'-  {sala}\n')
-            return salas_str
-
-    def __criar_sala(self, cliente_socket, nome_sala):
-        
-        ''' __criar_sala(self, cliente_socket, nome_sala)
-        Objetivo: Cria uma nova sala e adiciona um cliente a ela.
-        Parâmetros de Entrada: self (referência à própria instância), cliente_socket (socket do cliente), nome_sala (string: nome da sala).
-        Descrição: Cria uma nova sala com o nome fornecido e adiciona o cliente à sala usando seu socket.'''
-        
-        self.semaphore_salas.acquire()
-        if nome_sala in self.salas.keys():
-            self.semaphore_salas.release()
-            return '402'
-        self.salas.put(nome_sala, [cliente_socket])
-        self.semaphore_salas.release()
-        return '200'
-    
-    def __entrar_na_sala(self, sala, cliente_socket):
-        
-        ''' __entrar_na_sala(self, sala, cliente_socket)
-        Objetivo: Permite que um cliente entre em uma sala existente.
-        Parâmetros de Entrada: self (referência à própria instância), sala (string: nome da sala), cliente_socket (socket do cliente).
-        Descrição: Permite que um cliente entre em uma sala existente se houver espaço disponível. '''
-        
-        self.semaphore_salas.acquire()
-        chaves = self.salas.keys()
-        if sala in chaves:
-            lista = self.salas.get(f'{sala}')
-            if len(lista) < 3:    
-                lista.append(cliente_socket)
-                self.salas.put(f'{sala}', lista)
-                self.semaphore_salas.release()
-                return '200'
-            else:
-                self.semaphore_salas.release()
-                return '404'
-        else:
-            self.semaphore_salas.release() 
-            return '401'
-
-if len(sys.argv) != 3:
-        print("Uso: python seu_script.py HOST PORT")
-        sys.exit(1)
-
-host = sys.argv[1]
-port = int(sys.argv[2])
-
-server = Server()
-server.iniciar_servidor(host, port)
\ No newline at end of file
+import argparse
+import itertools
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from hashtable import *
+from lista_circular import *
+from jogo import Jogo
+from servidor_async import ServidorAsync
+from multiprocesso import iniciar_workers
+from protocolo import Conexao, ProtocoloException, difundir, enviar_mensagem
+from agendador import Agendador
+from sessao import Sessao
+from retrato_salas import RetratoSalas, JOGADORES_POR_SALA, LIMITE_PAGINA_SALAS
+import sys
+
+ATRASO_FIM_DE_JOGO = 2
+MAXIMO_PARTIDAS = 32
+
+class Server():
+    
+    ''' Classe Server
+
+        A classe Server é responsável por gerenciar as salas do jogo e contralar a entrada em regiões crítica. Ela possui os seguintes atributos:
+
+        salas: uma ConcurrentHashTable que armazena a como chave a sala criada pelo usuário e valor a lista com a Sessao de cada jogador da sala.
+        Cada partição da tabela tem o seu próprio lock, e criar, entrar, ficar pronto e sair de uma sala são operações atômicas dela (put_if_absent, append_to_list_value, compute), então salas diferentes não disputam um semáforo global.
+        O nickname, a sala e se o jogador está pronto ficam na Sessao de cada conexão (ver sessao.py), criada quando o cliente conecta.
+        versao_salas: número que muda a cada criação, entrada, saída ou fim de uma sala; o retrato das salas é recriado quando ele muda.
+        retrato: RetratoSalas com a resposta de salas_disponiveis já codificada (ver retrato_salas.py).
+        semaphore_retrato: Semaphore que garante que apenas uma thread recria o retrato desatualizado.
+        registro: RegistroSalas compartilhado entre os workers quando o servidor é iniciado com --workers (None com um único processo).
+        agendador: Agendador que envia as mensagens atrasadas (o aviso de jogo encerrado) de todas as partidas em uma única thread.
+        lista_jogadores: implementação da lista circular de jogadores usada pelo Jogo de cada partida ('encadeada' ou 'anel').
+        executor_partidas: ThreadPoolExecutor com no máximo maximo_partidas threads, onde as partidas são executadas; as partidas que excedem esse limite aguardam na fila do executor.
+        partidas_na_fila / partidas_em_andamento: quantidade de partidas aguardando uma thread do executor e em execução (ver metricas_partidas).
+        semaphore_partidas: Semaphore para controle de acesso aos contadores de partidas.
+
+        Métodos:
+        - iniciar_servidor(HOST, PORT, reuse_port): Inicia o servidor, aguardando conexões.
+        - adotar_cliente(cliente_socket, nickname, comando, pendentes, codec): Passa a atender um cliente repassado por outro worker.
+        - comunicacao_cliente(cliente_socket, cliente_address): Gerencia a comunicação com o cliente.
+        - comandos(sessao): Lê os comandos do cliente no modo com uma thread por conexão.
+        - tratar_comando(sessao, comando): Processa um comando recebido do cliente (compartilhado pelos modos threads e asyncio).
+        - nickname(sessao, nickname): Associa o nickname ao cliente.
+        - desconectar(sessao): Retira da sala um cliente que desconectou no lobby e fecha a conexão.
+        - jogador_pronto(sessao, sala): Gerencia o status do jogador, indicando prontidão para iniciar o jogo.
+        - iniciar_jogo_todos_prontos(lista): Verifica se todos os jogadores de uma sala estão prontos para iniciar o jogo.
+        - iniciar_partida(lista_jogadores, chave): Coloca o jogo de uma sala completa na fila do executor de partidas.
+        - metricas_partidas(): Retorna o tamanho da fila de partidas e quantas estão em andamento.
+        - jogo(lista_jogadores, chave): Inicia o jogo para a lista de jogadores em uma sala específica.
+        - __liberar_sala(chave): Remove a sala encerrada das estruturas de dados.
+        - __encerrar_partida(conexoes): Avisa os jogadores que o jogo terminou e fecha as conexões.
+        - __enviar_msg_cliente(mensagem, cliente_socket): Envia mensagem para um cliente específico.
+        - __receber_msg_cliente(cliente_socket): Recebe mensagem de um cliente específico.
+        - __enviar_msg_cliente_broadcast(mensagem, lista_jogadores): Envia mensagem para uma lista de clientes.
+        - retrato_salas(): Retorna o retrato atual das salas, recriando-o se as salas mudaram.
+        - mostrar_salas_disponiveis(): Mostra as salas disponíveis.
+        - __pagina_salas(comando): Responde uma página de salas_disponiveis,<cursor>,<limite>.
+        - __criar_sala(sessao, nome_sala): Cria uma nova sala.
+        - __entrar_na_sala(sala, sessao): Permite um cliente entrar em uma sala existente.
+    '''
+    
+    def __init__(self, registro=None, maximo_partidas=MAXIMO_PARTIDAS, lista_jogadores='encadeada'):
+        
+        '''  __init__(self, registro=None, maximo_partidas=MAXIMO_PARTIDAS, lista_jogadores='encadeada')
+        Objetivo: Método construtor da classe Server.
+        Parâmetros de Entrada: self (referência à própria instância), registro (RegistroSalas do worker, quando o servidor é executado com vários processos), maximo_partidas (int: número máximo de partidas executadas ao mesmo tempo), lista_jogadores (string: implementação da lista circular de jogadores usada nas partidas, 'encadeada' ou 'anel'; ver Jogo).
+        Descrição: Inicializa a ConcurrentHashTable que armazena as salas, o retrato da lista de salas, o semáforo que controla o acesso aos contadores de partidas (semaphore_partidas) e o executor das partidas. '''
+        
+        self.salas = ConcurrentHashTable()
+        self.__versoes = itertools.count(1)
+        self.versao_salas = 0
+        self.retrato = RetratoSalas(0, ())
+        self.semaphore_retrato = threading.Semaphore(1)
+        self.registro = registro
+        self.agendador = Agendador()
+        self.maximo_partidas = maximo_partidas
+        self.lista_jogadores = lista_jogadores
+        self.executor_partidas = ThreadPoolExecutor(max_workers=maximo_partidas, thread_name_prefix='partida')
+        self.partidas_na_fila = 0
+        self.partidas_em_andamento = 0
+        self.semaphore_partidas = threading.Semaphore(1)
+
+    def iniciar_servidor(self, HOST, PORT, reuse_port=False):
+        
+        '''  iniciar_servidor(self, HOST, PORT, reuse_port=False)
+        Objetivo: Inicia o servidor para escutar conexões de clientes.
+        Parâmetros de Entrada: self (referência à própria instância), HOST (string: endereço IP do servidor), PORT (int: número da porta), reuse_port (bool: permite que vários workers escutem a mesma porta).
+        Descrição: Configura um socket de escuta para aguardar conexões de clientes. O método aceita as conexões dos clientes e inicia threads para lidar com cada cliente conectado. '''
+        
+        try:
+            server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            if reuse_port:
+                server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            orig = (HOST, PORT)
+
+            server.bind(orig)
+            server.listen()
+
+            print("Aguardando conexões...")
+
+            while True:
+                cliente_socket, cliente_address = server.accept()
+                cliente_thread = threading.Thread(target=self.comunicacao_cliente, args=(Conexao(cliente_socket), cliente_address))
+                cliente_thread.start()
+        except OSError as e:
+            print(f"Erro ao iniciar o servidor: {e}")
+            sys.exit(1)
+    
+
+    def comunicacao_cliente(self, cliente_socket, cliente_address):
+        
+        ''' comunicacao_cliente(self, cliente_socket, cliente_address)
+        Objetivo: Lida com a comunicação com o cliente.
+        Parâmetros de Entrada: self (referência à própria instância), cliente_socket (socket do cliente), cliente_address (endereço IP e porta do cliente).
+        Descrição: Cria a Sessao do cliente e chama o método comandos para interpretar e executar os comandos enviados por ele.'''
+        
+        print(f"Cliente conectado: {cliente_address}")
+        self.comandos(Sessao(cliente_socket))
+
+    def adotar_cliente(self, cliente_socket, nickname, comando, pendentes, codec):
+        
+        ''' adotar_cliente(self, cliente_socket, nickname, comando, pendentes, codec)
+        Objetivo: Passa a atender um cliente repassado por outro worker.
+        Parâmetros de Entrada: self (referência à própria instância), cliente_socket (socket do cliente), nickname (string ou None), comando (tupla: comando recebido pelo outro worker e ainda não executado), pendentes (bytes já lidos do socket pelo outro worker e ainda não consumidos), codec (string: nome do formato negociado com o cliente).
+        Descrição: Cria a Sessao do cliente com o nickname recebido e inicia uma thread que executa o comando pendente e continua lendo os próximos comandos. '''
+        
+        sessao = Sessao(Conexao(cliente_socket, pendentes, codec), nickname)
+        threading.Thread(target=self.comandos, args=(sessao, comando)).start()
+    
+    def comandos(self, sessao, comando=None):
+        
+        ''' comandos(self, sessao, comando=None)
+        Objetivo: Interpreta e executa os comandos recebidos do cliente.
+        Parâmetros de Entrada: self (referência à própria instância), sessao (Sessao do cliente), comando (tupla: comando já recebido que deve ser executado antes de ler o próximo).
+        Descrição: Recebe comandos do cliente e os repassa para o método tratar_comando. Quando a sala do cliente fica completa, o jogo é colocado na fila do executor de partidas e a thread do cliente termina. Depois de jogador_pronto, enquanto os demais jogadores não ficam prontos, a thread vigia a conexão (Conexao.aguardar_fim) para perceber se o jogador desconectar. Se o cliente desconectar, a sessão é encerrada (desconectar) e a thread termina. '''
+        
+        while True:
+            if comando == None:
+                comando = self.__receber_msg_cliente(sessao.conexao)
+                if comando == ():
+                    self.desconectar(sessao)
+                    break
+            resposta, partida, encerrar = self.tratar_comando(sessao, comando)
+            comando = None
+            if resposta != None:
+                self.__enviar_msg_cliente(resposta, sessao.conexao)
+            if partida != None:
+                self.iniciar_partida(*partida)
+            if encerrar:
+                if sessao.pronto and not sessao.em_partida and sessao.conexao.aguardar_fim(lambda: sessao.em_partida):
+                    self.desconectar(sessao)
+                break
+
+    def tratar_comando(self, sessao, comando):
+        
+        ''' tratar_comando(self, sessao, comando)
+        Objetivo: Executa um comando recebido do cliente, sem realizar nenhuma operação de rede.
+        Parâmetros de Entrada: self (referência à própria instância), sessao (Sessao do cliente), comando (tupla: mensagem recebida do cliente, com o nome do comando seguido dos argumentos).
+        Descrição: Direciona o comando para os métodos correspondentes, como nickname, entrar_na_sala, jogador_pronto, criar_sala, ou salas_disponiveis.
+        É compartilhado pelo modo com threads e pelo modo asyncio, que só diferem na forma de ler e escrever nos sockets.
+        Retorna uma tupla (resposta, partida, encerrar): a mensagem a ser enviada ao cliente (ou None), a tupla (lista_jogadores, sala) quando o jogo da sala deve ser iniciado (ou None) e se o laço de comandos do cliente deve ser encerrado. '''
+        
+        sessao.comandos += 1
+        if len(comando) > 1:
+            if comando[0] == 'nickname':
+                self.nickname(sessao, comando[1])
+                return None, None, False
+
+            elif comando[0] == 'entrar_na_sala':
+                if self.__transferir_para_dono(sessao, comando):
+                    return None, None, True
+                return ('status', self.__entrar_na_sala(comando[1], sessao)), None, False
+
+            elif comando[0] == 'jogador_pronto':
+                chave = sessao.sala
+                if chave == None:
+                    # jogador_pronto fora de uma sala encerra a sessão, liberando a conexão
+                    self.desconectar(sessao)
+                    return None, None, True
+                resp = self.jogador_pronto(sessao, chave)
+                if resp == '200':
+                    return ('status', resp), None, True
+                else:
+                    return ('status', '200'), (resp, chave), True
+
+            elif comando[0] == 'criar_sala':
+                if self.__transferir_para_dono(sessao, comando):
+                    return None, None, True
+                nome_sala = comando[1]
+                resp = self.__criar_sala(sessao, nome_sala)
+                return ('status', resp), None, False
+
+            elif comando[0] == 'salas_disponiveis':
+                return self.__pagina_salas(comando), None, False
+
+        elif comando == ('salas_disponiveis',):
+            return self.retrato_salas().resposta, None, False
+
+        return None, None, False
+
+    def __pagina_salas(self, comando):
+        
+        ''' __pagina_salas(self, comando)
+        Objetivo: Responde salas_disponiveis paginado (salas_disponiveis,<cursor>,<limite>).
+        Parâmetros de Entrada: self (referência à própria instância), comando (tupla: no formato binário o cursor e o limite são argumentos separados; no formato texto chegam juntos e são separados pela última vírgula, pois o cursor é um nome de sala e pode conter vírgulas).
+        Descrição: Retorna a página do retrato das salas que começa depois do cursor. Um limite ausente ou inválido usa LIMITE_PAGINA_SALAS. '''
+        
+        argumentos = comando[1:] if len(comando) > 2 else comando[1].rsplit(',', 1)
+        cursor = argumentos[0]
+        try:
+            limite = int(argumentos[1])
+        except (IndexError, ValueError):
+            limite = LIMITE_PAGINA_SALAS
+        return self.retrato_salas().pagina(cursor, limite)
+
+    def __transferir_para_dono(self, sessao, comando):
+        
+        ''' __transferir_para_dono(self, sessao, comando)
+        Objetivo: Repassa o cliente ao worker dono da sala quando o servidor é executado com vários processos.
+        Parâmetros de Entrada: self (referência à própria instância), sessao (Sessao do cliente), comando (tupla: comando criar_sala ou entrar_na_sala).
+        Descrição: Se a sala pertence a outro worker, envia o socket do cliente, o nickname da sessão e o comando ao dono da sala, que cria uma nova Sessao para ele. Retorna True se o cliente foi repassado. '''
+        
+        if self.registro == None or self.registro.eh_local(comando[1]):
+            return False
+        self.registro.transferir(sessao.conexao, sessao.nickname, comando, comando[1])
+        return True
+
+    def nickname(self, sessao, nickname):
+        
+        ''' nickname(self, sessao, nickname)
+        Objetivo: Armazena o nickname associado a um cliente.
+        Parâmetros de Entrada: self (referência à própria instância), sessao (Sessao do cliente), nickname (string: nickname escolhido pelo cliente).
+        Descrição: Guarda o nickname na Sessao do cliente. Só a thread (ou o event loop) do próprio cliente altera a sua sessão, então não é preciso semáforo.'''
+        
+        sessao.nickname = nickname
+    
+    def desconectar(self, sessao):
+        
+        ''' desconectar(self, sessao)
+        Objetivo: Encerra a sessão de um cliente que desconectou no lobby.
+        Parâmetros de Entrada: self (referência à própria instância), sessao (Sessao do cliente).
+        Descrição: Retira o cliente da sala em que estava, liberando a vaga; se a sala ficar vazia ela é removida (e, com vários workers, os demais são avisados). Por fim fecha a conexão, liberando o descritor do socket.
+        Se a partida do jogador já começou (a verificação é feita no mesmo compute que completa a sala), nada é feito: a conexão pertence ao Jogo, que percebe a desconexão. '''
+        
+        chave = sessao.sala
+        sala_vazia = False
+        em_partida = False
+
+        def retirar(chave, lista):
+            nonlocal sala_vazia, em_partida
+            if sessao.em_partida:
+                em_partida = True
+                return lista
+            if lista == None:
+                return None
+            if sessao in lista:
+                lista.remove(sessao)
+            if len(lista) == 0:
+                sala_vazia = True
+                return None
+            return lista
+
+        if chave != None:
+            self.salas.compute(chave, retirar)
+            if em_partida:
+                return
+            self.__salas_alteradas(None if sala_vazia else chave)
+        sessao.sala = None
+        sessao.pronto = False
+        if sala_vazia and self.registro != None:
+            self.registro.remover_sala(chave)
+        sessao.conexao.close()
+
+    def jogador_pronto(self, sessao, sala):
+        
+        ''' jogador_pronto(self, sessao, sala)
+    Objetivo: Indica que um jogador está pronto para iniciar um jogo em uma sala específica.
+    Parâmetros de Entrada: self (referência à própria instância), sessao (Sessao do cliente), sala (string: nome da sala).
+    Descrição: Marca a Sessao do jogador como pronta e verifica se todos os jogadores da sala estão prontos em uma única operação atômica (compute) sobre a sala, então apenas o último jogador a ficar pronto inicia o jogo. Retorna a lista de jogadores da sala quando o jogo deve começar e '200' caso contrário. '''
+        
+        completa = []
+
+        def marcar_pronto(chave, lista):
+            if lista == None:
+                return None
+            sessao.pronto = True
+            if self.iniciar_jogo_todos_prontos(lista) == '200ok':
+                for jogador in lista:
+                    jogador.em_partida = True
+                completa.append(lista)
+            return lista
+
+        self.salas.compute(f'{sala}', marcar_pronto)
+        if completa:
+            for jogador in completa[0]:
+                jogador.partidas += 1
+            return completa[0]
+        else:
+            return '200'
+
+    def iniciar_jogo_todos_prontos(self, lista):
+        
+        ''' iniciar_jogo_todos_prontos(self, lista)
+        Objetivo: Verifica se todos os jogadores em uma sala estão prontos para iniciar o jogo.
+        Parâmetros de Entrada: self (referência à própria instância), lista (lista com a Sessao de cada jogador da sala).
+        Descrição: Verifica se a sala tem os 3 jogadores e se todos estão prontos. Deve ser chamado dentro de um compute sobre a sala, para que nenhum jogador entre, saia ou fique pronto durante a verificação.'''
+        
+        if len(lista) == JOGADORES_POR_SALA and all(jogador.pronto for jogador in lista):
+            return '200ok'
+        else: return '200'
+    
+
+    def iniciar_partida(self, lista_jogadores, chave):
+        
+        ''' iniciar_partida(self, lista_jogadores, chave)
+        Objetivo: Agenda o jogo de uma sala completa no executor de partidas.
+        Parâmetros de Entrada: self (referência à própria instância), lista_jogadores (lista com a Sessao de cada jogador), chave (string: nome da sala).
+        Descrição: Chamado pelos dois motores de rede quando o último jogador da sala fica pronto. O jogo não é executado na thread (ou no event loop) de quem o iniciou: vai para a fila do executor, que executa no máximo maximo_partidas jogos ao mesmo tempo. Se todas as threads estiverem ocupadas, a partida aguarda na fila. '''
+        
+        self.semaphore_partidas.acquire()
+        self.partidas_na_fila += 1
+        na_fila = self.partidas_na_fila
+        ocupado = self.partidas_em_andamento >= self.maximo_partidas
+        self.semaphore_partidas.release()
+        if ocupado:
+            print(f"Partida da sala {chave} aguardando na fila ({na_fila} na fila).")
+        self.executor_partidas.submit(self.__executar_partida, lista_jogadores, chave)
+
+    def __executar_partida(self, lista_jogadores, chave):
+        
+        ''' __executar_partida(self, lista_jogadores, chave)
+        Objetivo: Executa o jogo em uma thread do executor de partidas, atualizando os contadores da fila. '''
+        
+        self.semaphore_partidas.acquire()
+        self.partidas_na_fila -= 1
+        self.partidas_em_andamento += 1
+        self.semaphore_partidas.release()
+        try:
+            self.jogo(lista_jogadores, chave)
+        except Exception as e:
+            print(f"Erro na partida da sala {chave}: {e}")
+        finally:
+            self.semaphore_partidas.acquire()
+            self.partidas_em_andamento -= 1
+            self.semaphore_partidas.release()
+
+    def metricas_partidas(self):
+        
+        ''' metricas_partidas(self)
+        Objetivo: Retorna as métricas do executor de partidas.
+        Parâmetros de Entrada: self (referência à própria instância).
+        Descrição: Retorna um dicionário com a quantidade de partidas aguardando na fila (na_fila), em execução (em_andamento) e o limite de partidas simultâneas (maximo). '''
+        
+        self.semaphore_partidas.acquire()
+        metricas = {'na_fila': self.partidas_na_fila, 'em_andamento': self.partidas_em_andamento,
+                    'maximo': self.maximo_partidas}
+        self.semaphore_partidas.release()
+        return metricas
+
+    def jogo(self, lista_jogadores, chave):
+        
+        ''' Objetivo: Inicia o jogo para uma lista de jogadores em uma sala específica.
+        Parâmetros de Entrada: self (referência à própria instância), lista_jogadores (lista com a Sessao de cada jogador), chave (string: chave para identificar a sala).
+        Descrição: Inicia o jogo para os jogadores da lista especificada na sala correspondente. Ao final envia o resultado, libera a sala imediatamente e agenda o aviso de jogo encerrado para ATRASO_FIM_DE_JOGO segundos depois, sem manter a thread do jogo dormindo.
+        Os jogadores que desconectam durante o jogo são retirados da lista de conexões pelo Jogo. Mesmo que o jogo termine com erro, a sala é liberada e as conexões são fechadas.'''
+        
+        conexoes = [jogador.conexao for jogador in lista_jogadores]
+        try:
+            jogo = Jogo(self.lista_jogadores)
+            parametro, ganhador = jogo._iniciar_jogo(conexoes)
+            if parametro == 'Jogo_encerrado' and ganhador != 'nenhum':
+                nick_ganhador = None
+                for jogador in lista_jogadores:
+                    if jogador.conexao == ganhador:
+                        nick_ganhador = jogador.nickname
+                self.__enviar_msg_cliente_broadcast(('texto', f'\nO jogador {nick_ganhador} acertou a palavra.'), conexoes)
+            else:
+                self.__enviar_msg_cliente_broadcast(('texto', f'\nVocê perdeu! A palavra era "..."'), conexoes)
+        finally:
+            self.__liberar_sala(chave)
+            self.agendador.agendar(ATRASO_FIM_DE_JOGO, self.__encerrar_partida, conexoes)
+
+    def __encerrar_partida(self, conexoes):
+        
+        ''' __encerrar_partida(self, conexoes)
+        Objetivo: Envia o aviso de jogo encerrado e fecha as conexões dos jogadores.
+        Parâmetros de Entrada: self (referência à própria instância), conexoes (lista de conexões dos jogadores que continuam conectados).
+        Descrição: Executado pelo agendador. O cliente termina ao receber o aviso; as conexões são fechadas depois que as mensagens pendentes forem enviadas, liberando os descritores dos sockets. '''
+        
+        self.__enviar_msg_cliente_broadcast(('jogo_encerrado',), conexoes)
+        for conexao in conexoes:
+            conexao.close()
+
+    def __liberar_sala(self, chave):
+        
+        ''' __liberar_sala(self, chave)
+        Objetivo: Remove uma sala cujo jogo terminou.
+        Parâmetros de Entrada: self (referência à própria instância), chave (string: nome da sala).
+        Descrição: Remove a sala da Hashtable de salas, desfaz a associação das sessões dos jogadores com a sala e, com vários workers, avisa os demais que a sala não existe mais. '''
+        
+        for jogador in self.salas.remove(chave):
+            jogador.sala = None
+            jogador.pronto = False
+        self.__salas_alteradas()
+        if self.registro != None:
+            self.registro.remover_sala(chave)
+        
+    
+    def __enviar_msg_cliente(self, mensagem, cliente_socket):
+        
+        ''' __enviar_msg_cliente(self, mensagem, cliente_socket)
+        Objetivo: Envia uma mensagem para um cliente específico.
+        Parâmetros de Entrada: self (referência à própria instância), mensagem (tupla: comando seguido dos argumentos, por exemplo ('status', '200')), cliente_socket (Conexao ou ConexaoAsync do cliente).
+        Descrição: Envia a mensagem fornecida, em um quadro e no formato negociado pelo cliente, para o cliente correspondente. Uma MensagemCodificada (como o retrato das salas) é enviada sem ser codificada de novo.'''
+        
+        enviar_mensagem(cliente_socket, mensagem)
+
+    def __receber_msg_cliente(self, cliente_socket):
+        
+        ''' __receber_msg_cliente(self, cliente_socket)
+        Objetivo: Recebe uma mensagem do cliente.
+        Parâmetros de Entrada: self (referência à própria instância), cliente_socket (Conexao do cliente).
+        Descrição: Recebe uma mensagem completa enviada pelo cliente, mesmo que ela chegue dividida em vários segmentos ou junto com outras. Retorna uma tupla vazia se o cliente desconectou, se a conexão falhou ou se ele enviou um quadro inválido. '''
+        
+        try:
+            return cliente_socket.receber()
+        except (OSError, ProtocoloException):
+            return ()
+    
+    def __enviar_msg_cliente_broadcast(self, mensagem, lista_jogadores):
+        
+        ''' __enviar_msg_cliente_broadcast(self, mensagem, lista_jogadores)
+        Objetivo: Envia uma mensagem para todos os jogadores em uma lista.
+        Parâmetros de Entrada: self (referência à própria instância), mensagem (tupla: mensagem a ser enviada), lista_jogadores (lista de sockets dos jogadores).
+        Descrição: Codifica a mensagem uma única vez e a coloca na fila de envio de cada jogador (difundir), sem esperar que eles a leiam. Um jogador lento é desconectado em vez de atrasar os demais.'''
+        
+        difundir(mensagem, lista_jogadores)
+    
+
+    def __salas_alteradas(self, sala=None):
+        
+        ''' __salas_alteradas(self, sala=None)
+        Objetivo: Registra que as salas mudaram, para que o próximo salas_disponiveis recrie o retrato.
+        Parâmetros de Entrada: self (referência à própria instância), sala (string: sala cuja ocupação mudou, ou None).
+        Descrição: Cada alteração recebe um número novo (itertools.count é atômico), então o retrato só é reaproveitado enquanto nenhuma alteração terminar depois dele. Com vários workers, a nova ocupação da sala é enviada aos demais. '''
+        
+        self.versao_salas = next(self.__versoes)
+        if sala != None and self.registro != None:
+            try:
+                self.registro.atualizar_sala(sala, len(self.salas.get(sala)))
+            except KeyError:
+                pass
+
+    def retrato_salas(self):
+        
+        ''' retrato_salas(self)
+        Objetivo: Retorna o RetratoSalas atual.
+        Parâmetros de Entrada: self (referência à própria instância).
+        Descrição: Enquanto as salas não mudam, apenas retorna o retrato existente, sem adquirir nenhuma trava. Se mudaram, uma única thread (semaphore_retrato) cria o retrato novo a partir das salas (ou do registro de salas de todos os workers) e o publica; as demais usam o novo retrato em seguida. A versão é lida antes das salas, então uma alteração feita durante a criação deixa o retrato desatualizado e ele é recriado na próxima consulta. '''
+        
+        fonte = self if self.registro == None else self.registro
+        retrato = self.retrato
+        if retrato.versao == fonte.versao_salas:
+            return retrato
+        self.semaphore_retrato.acquire()
+        retrato = self.retrato
+        versao = fonte.versao_salas
+        if retrato.versao != versao:
+            if self.registro == None:
+                salas = [(nome, len(jogadores)) for nome, jogadores in self.salas.items()]
+            else:
+                salas = self.registro.ocupacao()
+            retrato = self.retrato = RetratoSalas(versao, salas)
+        self.semaphore_retrato.release()
+        return retrato
+
+    def mostrar_salas_disponiveis(self):
+        
+        ''' mostrar_salas_disponiveis(self)
+        Objetivo: Mostra as salas disponíveis para os clientes.
+        Parâmetros de Entrada: self (referência à própria instância).
+        Descrição: Retorna uma string contendo a lista das salas disponíveis, com a ocupação de cada uma (a mesma enviada em salas_disponiveis), ou "404" se não houver salas.'''
+        
+        resposta = self.retrato_salas().resposta
+        return resposta[1]
+
+    def __criar_sala(self, sessao, nome_sala):
+        
+        ''' __criar_sala(self, sessao, nome_sala)
+        Objetivo: Cria uma nova sala e adiciona um cliente a ela.
+        Parâmetros de Entrada: self (referência à própria instância), sessao (Sessao do cliente), nome_sala (string: nome da sala).
+        Descrição: Cria uma nova sala com o nome fornecido e adiciona a sessão do cliente à sala, verificando e criando a sala em uma única operação atômica (put_if_absent). A sala também é guardada na sessão, para que jogador_pronto a encontre sem percorrer as salas.'''
+        
+        if self.salas.put_if_absent(nome_sala, [sessao]) != None:
+            return '402'
+        sessao.sala = nome_sala
+        self.__salas_alteradas()
+        if self.registro != None:
+            self.registro.publicar_sala(nome_sala)
+        return '200'
+    
+    def __entrar_na_sala(self, sala, sessao):
+        
+        ''' __entrar_na_sala(self, sala, sessao)
+        Objetivo: Permite que um cliente entre em uma sala existente.
+        Parâmetros de Entrada: self (referência à própria instância), sala (string: nome da sala), sessao (Sessao do cliente).
+        Descrição: Permite que um cliente entre em uma sala existente se houver espaço disponível; a verificação da vaga e a entrada são uma única operação atômica (append_to_list_value). A sala também é guardada na sessão do cliente. '''
+        
+        try:
+            if not self.salas.append_to_list_value(f'{sala}', sessao, JOGADORES_POR_SALA):
+                return '404'
+        except KeyError:
+            return '401'
+        sessao.sala = sala
+        self.__salas_alteradas(sala)
+        return '200'
+
+def executar_servidor(HOST, PORT, modo, maximo_partidas=MAXIMO_PARTIDAS, lista_jogadores='encadeada', registro=None):
+    
+    ''' executar_servidor(HOST, PORT, modo, maximo_partidas=MAXIMO_PARTIDAS, lista_jogadores='encadeada', registro=None)
+    Objetivo: Cria o Server e o motor de rede escolhido (async ou threads) e passa a aceitar conexões.
+    Descrição: Com um registro (execução com --workers), o socket de escuta é criado com SO_REUSEPORT e os clientes repassados por outros workers são entregues ao motor de rede. '''
+    
+    server = Server(registro, maximo_partidas, lista_jogadores)
+    motor = ServidorAsync(server) if modo == 'async' else server
+    if registro != None:
+        registro.iniciar(motor.adotar_cliente)
+    motor.iniciar_servidor(HOST, PORT, reuse_port=registro != None)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Servidor do jogo da forca.')
+    parser.add_argument('host', help='endereço IP do servidor')
+    parser.add_argument('port', type=int, help='porta do servidor')
+    parser.add_argument('--modo', choices=['async', 'threads'], default='async',
+                        help='async: todos os clientes em um único event loop (padrão); threads: uma thread por conexão')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='número de processos escutando a mesma porta (SO_REUSEPORT); cada sala pertence a um worker')
+    parser.add_argument('--partidas', type=int, default=MAXIMO_PARTIDAS,
+                        help='número máximo de partidas executadas ao mesmo tempo em cada worker; as demais aguardam na fila')
+    parser.add_argument('--lista', choices=['encadeada', 'anel'], default='encadeada',
+                        help='lista circular de jogadores das partidas: encadeada (nós encadeados) ou anel (lista contígua)')
+    args = parser.parse_args()
+
+    if args.workers > 1:
+        iniciar_workers(args.workers, executar_servidor, args.host, args.port, args.modo, args.partidas, args.lista)
+    else:
+        executar_servidor(args.host, args.port, args.modo, args.partidas, args.lista)
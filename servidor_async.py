@@ -0,0 +1,243 @@
+import asyncio
+import threading
+import sys
+from protocolo import *
+from sessao import Sessao
+
+
+class ConexaoAsync:
+
+    ''' Classe ConexaoAsync
+
+        Representa a conexão de um cliente atendido pelo event loop do asyncio. Ela oferece os mesmos métodos enviar/receber da
+        classe Conexao, para que o Server e o Jogo possam usá-la sem saber qual motor de rede está em uso, e também o método
+        receber_async, usado pelo próprio event loop enquanto o cliente está no lobby.
+
+        Atributos:
+        reader: asyncio.StreamReader da conexão.
+        writer: asyncio.StreamWriter da conexão.
+        loop: event loop que atende a conexão.
+        leitor: LeitorQuadros com os bytes recebidos e ainda não consumidos.
+        codec: CodecTexto ou CodecBinario, conforme o formato negociado com o cliente.
+        limite_envio: máximo de bytes no buffer de escrita do transporte (a fila de envio da conexão) antes de o cliente ser considerado lento.
+        lenta: True se a conexão foi descartada por não ler o que recebe.
+        vigia: tarefa que está em aguardar_fim, vigiando a conexão de um jogador pronto (None se não houver). '''
+
+    def __init__(self, reader, writer, loop, pendentes=b'', codec=CodecTexto.nome, limite_envio=LIMITE_FILA_ENVIO):
+        self.__reader = reader
+        self.__writer = writer
+        self.__loop = loop
+        self.__thread_loop = threading.get_ident()
+        self.__leitor = LeitorQuadros(pendentes)
+        self.codec = CODECS[codec]
+        self.limite_envio = limite_envio
+        self.lenta = False
+        self.__vigia = None
+
+    def enviar(self, *mensagem):
+
+        ''' enviar(self, *mensagem)
+        Objetivo: Codifica a mensagem (comando seguido dos argumentos) e a envia em um quadro para o cliente.
+        Retorna: False se a conexão foi descartada por estar lenta. '''
+
+        return self.enviar_quadro(quadro(self.codec.codificar(mensagem)))
+
+    def enviar_quadro(self, dados):
+
+        ''' enviar_quadro(self, dados)
+        Objetivo: Envia um quadro já codificado, que pode ser compartilhado entre várias conexões.
+        Descrição: Dentro do event loop escreve diretamente no transporte; fora dele (por exemplo na thread que executa o jogo) agenda a escrita no event loop.
+        Retorna: False se a conexão já foi descartada por estar lenta. '''
+
+        if threading.get_ident() == self.__thread_loop:
+            self.__escrever(dados)
+        else:
+            self.__loop.call_soon_threadsafe(self.__escrever, dados)
+        return not self.lenta
+
+    def __escrever(self, dados):
+
+        ''' __escrever(self, dados)
+        Objetivo: Escreve o quadro no transporte, que o envia assim que o socket aceitar e guarda o restante no seu buffer.
+        Descrição: Se o buffer passar de limite_envio, o cliente não está lendo o que recebe: a conexão é marcada como lenta e
+        abortada, o que também faz receber_async devolver o fim da conexão. '''
+
+        if self.lenta:
+            return
+        transporte = self.__writer.transport
+        if transporte.get_write_buffer_size() + len(dados) > self.limite_envio:
+            self.lenta = True
+            transporte.abort()
+            return
+        self.__writer.write(dados)
+
+    def receber(self):
+
+        ''' receber(self)
+        Objetivo: Recebe a próxima mensagem do cliente de forma bloqueante.
+        Descrição: Deve ser chamado apenas fora do event loop (pela thread do jogo), pois aguarda a leitura agendada no event loop terminar. '''
+
+        return asyncio.run_coroutine_threadsafe(self.receber_async(), self.__loop).result()
+
+    async def receber_async(self):
+
+        ''' receber_async(self)
+        Objetivo: Recebe a próxima mensagem do cliente sem bloquear o event loop.
+        Descrição: Se o cliente pedir o formato binário (PEDIDO_BINARIO), responde 200 e passa a usar o CodecBinario.
+        Retorna: a tupla da mensagem recebida ou uma tupla vazia se a conexão foi encerrada pelo cliente. '''
+
+        vigia = self.__vigia
+        if vigia != None:
+            # o jogo passa a ler a conexão: a vigia do lobby termina antes, para que só uma tarefa leia o StreamReader
+            vigia.cancel()
+            await asyncio.wait({vigia})
+        while True:
+            dados = self.__leitor.proxima()
+            if dados == None:
+                dados = await self.__reader.read(TAMANHO_LEITURA)
+                if not dados:
+                    return ()
+                self.__leitor.alimentar(dados)
+                continue
+            mensagem = self.codec.decodificar(dados)
+            if mensagem == PEDIDO_BINARIO and self.codec.nome == CodecTexto.nome:
+                self.enviar('status', '200')
+                self.codec = CODECS[CodecBinario.nome]
+                continue
+            return mensagem
+
+    async def aguardar_fim(self):
+
+        ''' aguardar_fim(self)
+        Objetivo: Vigia a conexão de um jogador que está pronto e aguarda os demais, para perceber se ele desconectar.
+        Descrição: Deve ser executado na própria tarefa da conexão. Os bytes recebidos vão para o leitor e serão devolvidos
+        pelo próximo receber_async, que cancela a vigia antes de ler.
+        Retorna: True se o cliente encerrou a conexão (ou ela falhou), False se a vigia foi cancelada por receber_async. '''
+
+        self.__vigia = asyncio.current_task()
+        try:
+            while True:
+                dados = await self.__reader.read(TAMANHO_LEITURA)
+                if not dados:
+                    return True
+                self.__leitor.alimentar(dados)
+        except asyncio.CancelledError:
+            return False
+        except OSError:
+            return True
+        finally:
+            self.__vigia = None
+
+    def pendentes(self):
+
+        ''' pendentes(self)
+        Objetivo: Retorna os bytes recebidos e ainda não consumidos, usados ao repassar o cliente para outro worker. '''
+
+        return self.__leitor.pendentes()
+
+    def fileno(self):
+
+        ''' fileno(self)
+        Objetivo: Retorna o descritor do socket da conexão, usado para repassar o cliente a outro worker. '''
+
+        return self.__writer.get_extra_info('socket').fileno()
+
+    def close(self):
+
+        ''' close(self)
+        Objetivo: Encerra a conexão com o cliente. '''
+
+        if threading.get_ident() == self.__thread_loop:
+            self.__writer.close()
+        else:
+            self.__loop.call_soon_threadsafe(self.__writer.close)
+
+
+class ServidorAsync:
+
+    ''' Classe ServidorAsync
+
+        Motor de rede do servidor baseado em asyncio. Todas as conexões do lobby são multiplexadas em um único event loop,
+        em vez de uma thread por conexão como em Server.iniciar_servidor. Os comandos (nickname, criar_sala, entrar_na_sala,
+        jogador_pronto, salas_disponiveis) continuam sendo tratados por Server.tratar_comando; apenas a leitura e a escrita
+        nos sockets mudam. Quando uma sala fica completa, o jogo é executado no executor de partidas do Server
+        (Server.iniciar_partida), fora do event loop, pois a classe Jogo conversa com os jogadores de forma bloqueante.
+
+        Atributos:
+        server: instância de Server que mantém as salas; o nickname e a sala de cada cliente ficam na Sessao criada para a conexão. '''
+
+    def __init__(self, server):
+        self.server = server
+        self.__loop = None
+        self.__loop_pronto = threading.Event()
+
+    def iniciar_servidor(self, HOST, PORT, reuse_port=False):
+
+        ''' iniciar_servidor(self, HOST, PORT, reuse_port=False)
+        Objetivo: Inicia o servidor para escutar conexões de clientes usando o event loop do asyncio.
+        Parâmetros de Entrada: self (referência à própria instância), HOST (string: endereço IP do servidor), PORT (int: número da porta), reuse_port (bool: permite que vários workers escutem a mesma porta). '''
+
+        try:
+            asyncio.run(self.__servir(HOST, PORT, reuse_port))
+        except OSError as e:
+            print(f"Erro ao iniciar o servidor: {e}")
+            sys.exit(1)
+
+    def adotar_cliente(self, cliente_socket, nickname, comando, pendentes, codec):
+
+        ''' adotar_cliente(self, cliente_socket, nickname, comando, pendentes, codec)
+        Objetivo: Passa a atender, no event loop, um cliente repassado por outro worker.
+        Parâmetros de Entrada: cliente_socket (socket do cliente), nickname (string ou None), comando (tupla: comando recebido pelo outro worker e ainda não executado), pendentes (bytes já lidos do socket pelo outro worker e ainda não consumidos), codec (string: nome do formato negociado com o cliente).
+        Descrição: Chamado pela thread do RegistroSalas; agenda a conexão no event loop e executa o comando pendente antes de ler os próximos. '''
+
+        self.__loop_pronto.wait()
+        asyncio.run_coroutine_threadsafe(self.__adotar(cliente_socket, nickname, comando, pendentes, codec), self.__loop)
+
+    async def __servir(self, HOST, PORT, reuse_port):
+        servidor = await asyncio.start_server(self.__comunicacao_cliente, HOST, PORT, reuse_port=reuse_port)
+        self.__loop = asyncio.get_running_loop()
+        self.__loop_pronto.set()
+        print("Aguardando conexões...")
+        async with servidor:
+            await servidor.serve_forever()
+
+    async def __adotar(self, cliente_socket, nickname, comando, pendentes, codec):
+        reader, writer = await asyncio.open_connection(sock=cliente_socket)
+        cliente = ConexaoAsync(reader, writer, self.__loop, pendentes, codec)
+        await self.__comandos(Sessao(cliente, nickname), comando)
+
+    async def __comunicacao_cliente(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        cliente = ConexaoAsync(reader, writer, loop)
+        print(f"Cliente conectado: {writer.get_extra_info('peername')}")
+        await self.__comandos(Sessao(cliente))
+
+    async def __comandos(self, sessao, comando=None):
+
+        ''' __comandos(self, sessao, comando=None)
+        Objetivo: Lê e executa os comandos de um cliente no lobby.
+        Descrição: Equivalente a Server.comandos. Quando o cliente envia jogador_pronto, a leitura de comandos do lobby termina e
+        a conexão passa a ser usada pelo jogo; enquanto os demais jogadores não ficam prontos, a conexão é vigiada
+        (ConexaoAsync.aguardar_fim) para perceber se o jogador desconectar. Se o cliente desconectar (ou a conexão falhar), a
+        sessão é encerrada por Server.desconectar, que libera a vaga na sala e fecha a conexão. '''
+
+        cliente = sessao.conexao
+        while True:
+            if comando == None:
+                try:
+                    comando = await cliente.receber_async()
+                except (OSError, ProtocoloException):
+                    comando = ()
+                if comando == ():
+                    self.server.desconectar(sessao)
+                    return
+            resposta, partida, encerrar = self.server.tratar_comando(sessao, comando)
+            comando = None
+            if resposta != None:
+                enviar_mensagem(cliente, resposta)
+            if partida != None:
+                self.server.iniciar_partida(*partida)
+            if encerrar:
+                if sessao.pronto and not sessao.em_partida and await cliente.aguardar_fim():
+                    self.server.desconectar(sessao)
+                return
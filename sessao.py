@@ -0,0 +1,32 @@
+class Sessao:
+
+    ''' Classe Sessao
+
+        Estado de um jogador no servidor, criado uma vez por conexão e compartilhado por todos os comandos dela. Substitui as
+        Hashtables indexadas pelo socket (nicknames e jogadores prontos): consultar o nickname ou a sala de um jogador é o
+        acesso a um atributo, sem percorrer a lista de um slot nem adquirir um semáforo. Usa __slots__ para ocupar pouca
+        memória por conexão ociosa no lobby.
+
+        Atributos:
+        conexao: Conexao ou ConexaoAsync do jogador.
+        nickname: nickname escolhido pelo jogador (None até ele enviar o comando nickname).
+        sala: nome da sala em que o jogador está (None enquanto estiver só no lobby).
+        pronto: True depois que o jogador envia jogador_pronto na sala.
+        em_partida: True a partir do momento em que a sala fica completa e a partida do jogador é iniciada; a partir daí a
+        conexão pertence ao Jogo, e uma desconexão percebida pelo lobby não mexe mais na sala.
+        comandos: quantidade de comandos do lobby tratados para o jogador.
+        partidas: quantidade de partidas que o jogador iniciou. '''
+
+    __slots__ = ('conexao', 'nickname', 'sala', 'pronto', 'em_partida', 'comandos', 'partidas')
+
+    def __init__(self, conexao, nickname=None):
+        self.conexao = conexao
+        self.nickname = nickname
+        self.sala = None
+        self.pronto = False
+        self.em_partida = False
+        self.comandos = 0
+        self.partidas = 0
+
+    def __str__(self):
+        return f'{self.nickname}'
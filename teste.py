@@ -1,3 +1,3 @@
-palavra = 'chutar_palavra,palavra'
-array = palavra.split(',')
+palavra = 'chutar_palavra,palavra'
+array = palavra.split(',')
 print(array)
\ No newline at end of file